@@ -0,0 +1,112 @@
+"""
+곡 구간 분석 (훅 위치 / 음량 포락선)
+MP3를 한 번 디코딩해 짧은 프레임별 RMS 음량을 NumPy로 계산하고, 곡 전체에서 처음으로 크게 올라오는
+구간의 시작(강한 온셋)을 훅 위치로 잡는다. 결과는 몇백 바이트 크기라 라이브러리 인덱스에 메타데이터와
+함께 저장하고, 미리듣기에서 "훅으로 이동"에 사용한다.
+디코딩은 재생과 같은 pygame.mixer로 하므로 별도 디코더가 필요 없다. (numpy 필요)
+"""
+
+import io
+import os
+from typing import Dict, List, Optional, Tuple
+
+ANALYSIS_VERSION = 1        # 분석 방식이 바뀌면 올려서 저장된 결과를 다시 계산
+
+FRAME_SECONDS = 0.05        # 온셋 계산 프레임 길이
+ENVELOPE_SECONDS = 1.0      # 저장하는 음량 포락선 간격
+HOOK_WINDOW_SECONDS = 2.0   # 이 길이 동안 평균 음량이 유지되어야 훅 구간으로 인정
+HOOK_MARGIN_DB = 3.0        # 곡의 큰 음량(상위 10%) 대비 허용 차이
+LOUD_PERCENTILE = 90
+ONSET_LOOKBACK_SECONDS = 4.0  # 훅 구간 직전 이 범위에서 가장 강한 온셋을 시작점으로 사용
+SILENCE_DB = -90.0
+
+# pygame 샘플 크기 → NumPy dtype 이름
+_SAMPLE_DTYPES = {8: 'int8', 16: 'int16', 32: 'float32'}
+
+
+def _numpy():
+    try:
+        import numpy
+        return numpy
+    except ImportError:
+        raise RuntimeError("곡 분석에는 numpy가 필요합니다. (pip install numpy)")
+
+
+def _init_mixer():
+    """디코딩용 pygame.mixer 초기화 (출력 장치가 없는 서버에서는 더미 드라이버 사용)"""
+    os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+    import pygame
+    if not pygame.mixer.get_init():
+        try:
+            pygame.mixer.init()
+        except pygame.error:
+            os.environ["SDL_AUDIODRIVER"] = "dummy"
+            pygame.mixer.init()
+    return pygame.mixer
+
+
+def decode_file(path: str, data: Optional[bytes] = None) -> Tuple["numpy.ndarray", int]:
+    """MP3 → (모노 float32 샘플(-1~1), 샘플레이트), data가 있으면 파일 대신 메모리에서 디코딩"""
+    np = _numpy()
+    mixer = _init_mixer()
+    frequency, size, channels = mixer.get_init()
+    sound = mixer.Sound(file=io.BytesIO(data) if data is not None else path)
+    dtype = np.dtype(_SAMPLE_DTYPES[abs(size)])
+    samples = np.frombuffer(sound.get_raw(), dtype=dtype).reshape(-1, channels).astype(np.float32)
+    if dtype.kind == 'i':
+        samples /= float(np.iinfo(dtype).max)
+    return samples.mean(axis=1), frequency
+
+
+def analyze_samples(samples, sample_rate: int) -> Dict:
+    """모노 샘플의 훅 위치(초), 전체 음량(dBFS), 초당 음량 포락선 계산"""
+    np = _numpy()
+    hop = max(1, int(sample_rate * FRAME_SECONDS))
+    count = len(samples) // hop
+    if count == 0:
+        return {'version': ANALYSIS_VERSION, 'hook': 0.0, 'loudness': SILENCE_DB, 'envelope': b''}
+
+    frames = np.asarray(samples[:count * hop], dtype=np.float32).reshape(count, hop)
+    power = np.mean(frames * frames, axis=1)
+    db = 10 * np.log10(power + 1e-9)
+
+    # 평균 음량이 곡의 큰 음량 근처로 HOOK_WINDOW_SECONDS 이상 유지되는 첫 구간
+    window = min(count, max(1, int(HOOK_WINDOW_SECONDS / FRAME_SECONDS)))
+    sustained = np.convolve(db, np.ones(window) / window, mode='valid')
+    loud = np.percentile(db, LOUD_PERCENTILE)
+    candidates = np.flatnonzero(sustained >= loud - HOOK_MARGIN_DB)
+    start = int(candidates[0]) if candidates.size else 0
+
+    # 그 직전 범위에서 음량이 가장 크게 뛰는 프레임(강한 온셋)을 훅 시작으로 사용
+    onset = np.diff(db, prepend=db[0]).clip(min=0)
+    lookback = max(0, start - int(ONSET_LOOKBACK_SECONDS / FRAME_SECONDS))
+    hook_frame = lookback + int(np.argmax(onset[lookback:start + 1]))
+
+    # 초당 음량 포락선: -dBFS를 0~255 정수로 저장 (5분 곡 약 300바이트)
+    group = int(ENVELOPE_SECONDS / FRAME_SECONDS)
+    padded = np.pad(power, (0, -count % group), mode='edge').reshape(-1, group)
+    envelope_db = 10 * np.log10(padded.mean(axis=1) + 1e-9)
+
+    return {
+        'version': ANALYSIS_VERSION,
+        'hook': round(hook_frame * FRAME_SECONDS, 2),
+        'loudness': round(float(10 * np.log10(power.mean() + 1e-9)), 1),
+        'envelope': np.clip(-envelope_db, 0, 255).round().astype(np.uint8).tobytes(),
+    }
+
+
+def analyze_file(path: str, data: Optional[bytes] = None) -> Dict:
+    """MP3 파일을 디코딩해 분석 (data: 미리 읽어 둔 파일 내용)"""
+    samples, sample_rate = decode_file(path, data)
+    return analyze_samples(samples, sample_rate)
+
+
+def needs_analysis(record: Dict) -> bool:
+    """곡 정보에 현재 버전의 분석 결과가 없는지"""
+    analysis = record.get('analysis')
+    return not analysis or analysis.get('version') != ANALYSIS_VERSION
+
+
+def envelope_db(analysis: Dict) -> List[float]:
+    """저장된 포락선 → 초당 음량(dBFS) 목록"""
+    return [-float(v) for v in analysis.get('envelope', b'')]
@@ -1,10 +1,15 @@
+import io
 import os
-import eyed3
-import pygame
-import threading
-from typing import List, Dict, Optional
-from mutagen.id3 import ID3, ID3NoHeaderError, Encoding, TYER
-from mutagen.mp3 import MP3
+import time
+import logging
+from typing import List, Dict, Optional, Iterator
+
+from audio_prefetch import AudioPrefetcher
+from metrics import metrics, STAGE_TAG_WRITE, EVENT_ERROR
+
+logger = logging.getLogger(__name__)
+
+# eyed3, mutagen, pygame은 import 비용이 커서 실제 사용 시점에 로드한다.
 
 class AudioFileProcessor:
     """MP3 파일 처리 클래스"""
@@ -13,20 +18,23 @@ class AudioFileProcessor:
     def extract_metadata(file_path: str) -> Dict:
         """MP3 파일에서 메타데이터 추출 (상세 로그 추가)"""
         try:
-            print(f"extract_metadata: 파일 로드 시도 - {file_path}")
+            import eyed3
+            logger.debug("extract_metadata: 파일 로드 시도 - %s", file_path)
             audio = eyed3.load(file_path)
+            # 재생 길이는 로드 시 이미 읽은 MPEG 헤더(Xing/VBRI/LAME) 또는 TLEN 프레임에서 계산
+            duration = AudioFileProcessor._read_duration(audio)
             if not audio or not audio.tag:
-                print(f"extract_metadata: 태그 없음 - {file_path}")
-                return AudioFileProcessor._create_empty_metadata(file_path)
+                logger.debug("extract_metadata: 태그 없음 - %s", file_path)
+                return AudioFileProcessor._create_empty_metadata(file_path, duration)
             title = audio.tag.title or os.path.basename(file_path)
             artist = audio.tag.artist or "Unknown Artist"
             genre = audio.tag.genre.name if audio.tag.genre else ""
             year, original_year = AudioFileProcessor._extract_year_info(audio.tag)
             if year:
-                print(f"extract_metadata: 연도 발견 - 파일: {os.path.basename(file_path)}, 연도: {year}")
+                logger.debug("extract_metadata: 연도 발견 - 파일: %s, 연도: %s", os.path.basename(file_path), year)
             else:
-                print(f"extract_metadata: 연도 없음 - 파일: {os.path.basename(file_path)}")
-            print(f"extract_metadata: 메타데이터 추출 성공 - {file_path}")
+                logger.debug("extract_metadata: 연도 없음 - 파일: %s", os.path.basename(file_path))
+            logger.debug("extract_metadata: 메타데이터 추출 성공 - %s", file_path)
             return {
                 'path': file_path,
                 'filename': os.path.basename(file_path),
@@ -36,10 +44,11 @@ class AudioFileProcessor:
                 'original_year': original_year,
                 'year_added': False,
                 'genre': genre,
-                'genre_suggestion': ""
+                'genre_suggestion': "",
+                'duration': duration
             }
         except Exception as e:
-            print(f"extract_metadata: 파일 로드 오류 {file_path}: {e}")
+            logger.warning("extract_metadata: 파일 로드 오류 %s: %s", file_path, e)
             return None
     
     @staticmethod
@@ -88,7 +97,22 @@ class AudioFileProcessor:
         return year, original_year
     
     @staticmethod
-    def _create_empty_metadata(file_path: str) -> Dict:
+    def _read_duration(audio) -> float:
+        """eyed3로 로드한 파일의 재생 길이(초) - 헤더 정보가 없으면 TLEN(ms) 프레임 사용"""
+        if not audio:
+            return 0.0
+        if audio.info and audio.info.time_secs:
+            return float(audio.info.time_secs)
+        if audio.tag and hasattr(audio.tag, 'frame_set') and audio.tag.frame_set.get(b'TLEN'):
+            tlen_frame = audio.tag.frame_set[b'TLEN'][0]
+            try:
+                return int(str(tlen_frame.text).strip()) / 1000
+            except (TypeError, ValueError):
+                pass
+        return 0.0
+    
+    @staticmethod
+    def _create_empty_metadata(file_path: str, duration: float = 0.0) -> Dict:
         """빈 메타데이터 생성"""
         return {
             'path': file_path,
@@ -99,13 +123,16 @@ class AudioFileProcessor:
             'original_year': "",
             'year_added': False,
             'genre': "",
-            'genre_suggestion': ""
+            'genre_suggestion': "",
+            'duration': duration
         }
     
     @staticmethod
     def upgrade_id3_to_v23_utf16(file_path: str):
         """ID3 태그를 v2.3(UTF-16)으로 강제 변환 (latin-1 오류 방지)"""
         try:
+            from mutagen.id3 import ID3, ID3NoHeaderError, Encoding
+            from mutagen.mp3 import MP3
             audio = MP3(file_path)
             try:
                 tags = ID3(file_path)
@@ -116,23 +143,25 @@ class AudioFileProcessor:
                 if hasattr(frame, 'encoding'):
                     frame.encoding = Encoding.UTF16
             tags.save(file_path, v2_version=3)
-            print(f"ID3 태그를 v2.3(UTF-16)으로 변환 완료: {file_path}")
+            logger.debug("ID3 태그를 v2.3(UTF-16)으로 변환 완료: %s", file_path)
         except Exception as e:
-            print(f"ID3 변환 오류: {e}")
+            logger.warning("ID3 변환 오류: %s", e)
 
     @staticmethod
     def ensure_year_tyer(file_path: str, year: str):
         """mutagen으로 TYER(Year) 프레임에 연도 저장"""
         try:
+            from mutagen.id3 import ID3, TYER
             tags = ID3(file_path)
             tags.delall('TYER')
             tags.add(TYER(encoding=3, text=str(year)))
             tags.save(file_path, v2_version=3)
-            print(f"TYER(Year) 프레임에 연도 저장 완료: {year}")
+            logger.debug("TYER(Year) 프레임에 연도 저장 완료: %s", year)
         except Exception as e:
-            print(f"TYER 저장 오류: {e}")
+            logger.error("TYER 저장 오류: %s", e)
 
     @staticmethod
+    @metrics.timed(STAGE_TAG_WRITE)
     def save_metadata(data: Dict) -> bool:
         """메타데이터를 MP3 파일에 저장 (mutagen만 사용, 모든 프레임 UTF-16 강제)"""
         path = data['path']
@@ -167,111 +196,187 @@ class AudioFileProcessor:
                 if hasattr(frame, 'encoding'):
                     frame.encoding = Encoding.UTF16
             tags.save(path, v2_version=3)
-            print(f"저장 완료: {data['filename']}")
+            logger.info("저장 완료: %s", data['filename'])
             return True
         except Exception as e:
-            print(f"[ERROR] 저장 오류 {data['filename']}: {e}")
+            metrics.count('tags', EVENT_ERROR)
+            logger.error("저장 오류 %s: %s", data['filename'], e)
             return False
     
     @staticmethod
     def get_mp3_files(folder_path: str) -> List[str]:
         """폴더에서 MP3 파일 목록 가져오기"""
-        return [os.path.join(folder_path, f) for f in os.listdir(folder_path) if f.endswith(".mp3")]
+        return list(AudioFileProcessor.iter_mp3_files(folder_path))
+    
+    @staticmethod
+    def iter_mp3_files(folder_path: str, recursive: bool = False) -> Iterator[str]:
+        """폴더에서 MP3 파일 경로를 하나씩 반환 (recursive=True면 하위 폴더까지 스캔)"""
+        if not recursive:
+            for f in os.listdir(folder_path):
+                if f.endswith(".mp3"):
+                    yield os.path.join(folder_path, f)
+            return
+        for dirpath, dirnames, filenames in os.walk(folder_path):
+            dirnames.sort()
+            for f in sorted(filenames):
+                if f.endswith(".mp3"):
+                    yield os.path.join(dirpath, f)
     
     @staticmethod
     def get_file_duration(file_path: str) -> float:
-        """MP3 파일의 길이(초) 반환"""
+        """MP3 파일의 길이(초) 반환 (메타데이터에 길이가 없을 때만 사용)
+
+        mutagen은 첫 프레임과 Xing/VBRI/LAME 헤더만 읽으므로 태그 전체를 파싱하지 않는다.
+        """
         try:
-            audio = eyed3.load(file_path)
-            if audio and audio.info:
-                return audio.info.time_secs
+            from mutagen.mp3 import MP3
+            return MP3(file_path).info.length
         except:
             pass
         return 0
 
 
 class AudioPlayer:
-    """오디오 재생 관리 클래스"""
+    """오디오 재생 관리 클래스
+
+    재생 위치는 별도 모니터링 스레드 없이 요청할 때 계산한다.
+    (마지막 시작/이동 위치 + 그 이후 pygame.mixer.music.get_pos() 증가분, 일시정지 시간 제외)
+    """
     
     def __init__(self):
-        pygame.mixer.init()
+        # pygame 로드와 mixer 초기화는 첫 재생 시점으로 미룸 (창 표시 지연 방지)
+        self._mixer = None
         self.is_playing = False
         self.current_file = None
         self.song_length = 0
         self.current_pos = 0
         self.seeking = False
-        self._playback_thread = None
+        # 위치 계산 기준: 마지막 시작/이동 위치(초)와 그 시점의 get_pos() 값(ms)
+        self._seek_offset = 0.0
+        self._pos_base_ms = 0
+        # get_pos()를 쓸 수 없을 때 사용하는 monotonic 시계 기준 (일시정지 중이면 None)
+        self._clock_start: Optional[float] = None
+        # 미리 읽어 둔 곡은 메모리에서 재생 (재생 중인 곡의 스트림은 pygame이 계속 읽으므로 보관)
+        self.prefetcher = AudioPrefetcher()
+        self._stream: Optional[io.BytesIO] = None
+    
+    def _get_mixer(self):
+        """pygame.mixer 지연 초기화"""
+        if self._mixer is None:
+            os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+            import pygame
+            pygame.mixer.init()
+            self._mixer = pygame.mixer
+        return self._mixer
     
-    def play(self, file_path: str) -> bool:
-        """파일 재생"""
+    def play(self, file_path: str, duration: float = 0) -> bool:
+        """파일 재생 (duration: 스캔 시 읽어 둔 재생 길이, 없으면 파일 헤더에서 읽음)"""
         try:
-            pygame.mixer.music.load(file_path)
-            pygame.mixer.music.play()
+            mixer = self._get_mixer()
+            data = self.prefetcher.get(file_path)
+            if data is not None:
+                self._stream = io.BytesIO(data)
+                mixer.music.load(self._stream, os.path.splitext(file_path)[1].lstrip('.'))
+            else:
+                self._stream = None
+                mixer.music.load(file_path)
+            mixer.music.play()
             
             self.current_file = file_path
-            self.song_length = AudioFileProcessor.get_file_duration(file_path)
+            self.song_length = duration or AudioFileProcessor.get_file_duration(file_path)
             self.current_pos = 0
             self.is_playing = True
+            self._reset_clock(0.0)
             
-            # 재생 모니터링 시작
-            self._start_playback_monitoring()
-            
-            print(f"재생 시작: {os.path.basename(file_path)}")
+            logger.debug("재생 시작: %s", os.path.basename(file_path))
             return True
             
         except Exception as e:
-            print(f"재생 오류: {e}")
+            logger.warning("재생 오류: %s", e)
             return False
     
     def pause(self):
         """재생 일시정지"""
         if self.is_playing:
-            pygame.mixer.music.pause()
+            self._get_mixer().music.pause()
+            self.current_pos = self.get_position()
             self.is_playing = False
-            print("재생 일시정지")
+            self._clock_start = None
+            logger.debug("재생 일시정지")
     
     def resume(self):
         """재생 재개"""
         if not self.is_playing and self.current_file:
-            pygame.mixer.music.unpause()
+            self._get_mixer().music.unpause()
             self.is_playing = True
-            print("재생 재개")
+            self._clock_start = time.monotonic() - (self.current_pos - self._seek_offset)
+            logger.debug("재생 재개")
     
     def stop(self):
         """재생 중지"""
-        pygame.mixer.music.stop()
+        if self._mixer is not None:
+            self._mixer.music.stop()
         self.is_playing = False
         self.current_pos = 0
-        print("재생 중지")
+        self._reset_clock(0.0)
+        self._clock_start = None
+        logger.debug("재생 중지")
     
     def set_position(self, position: float):
         """재생 위치 설정"""
         self.current_pos = position
         try:
-            pygame.mixer.music.set_pos(position)
+            self._get_mixer().music.set_pos(position)
         except:
             # set_pos가 지원되지 않는 경우
-            pass
-    
-    def _start_playback_monitoring(self):
-        """재생 모니터링 시작"""
-        if self._playback_thread and self._playback_thread.is_alive():
             return
-        
-        self._playback_thread = threading.Thread(target=self._monitor_playback, daemon=True)
-        self._playback_thread.start()
+        self._reset_clock(position)
+        if not self.is_playing:
+            self._clock_start = None
     
-    def _monitor_playback(self):
-        """재생 상태 모니터링 (별도 스레드에서 실행)"""
-        while self.is_playing and pygame.mixer.music.get_busy():
-            if not self.seeking:
-                self.current_pos += 0.1
-            threading.Event().wait(0.1)
-        
-        # 재생 완료 시
-        if self.is_playing:
+    def jump_to_hook(self, analysis: Optional[Dict]) -> bool:
+        """분석된 훅 위치(audio_analysis)로 이동, 일시정지 상태였으면 재개"""
+        if not self.current_file or not analysis:
+            return False
+        self.set_position(analysis.get('hook', 0))
+        if not self.is_playing:
+            self.resume()
+        logger.debug("훅으로 이동: %s", self.format_time(self.current_pos))
+        return True
+    
+    def _reset_clock(self, position: float):
+        """위치 계산 기준을 지정 위치로 다시 잡음 (재생 시작, 위치 이동 시)"""
+        self._seek_offset = position
+        self._pos_base_ms = self._mixer.music.get_pos() if self._mixer is not None else 0
+        self._clock_start = time.monotonic()
+    
+    def get_position(self) -> float:
+        """현재 재생 위치(초)"""
+        if self.seeking or not self.is_playing or self._mixer is None:
+            return self.current_pos
+        played_ms = self._mixer.music.get_pos()
+        if played_ms >= 0:
+            elapsed = (played_ms - self._pos_base_ms) / 1000
+        elif self._clock_start is not None:
+            elapsed = time.monotonic() - self._clock_start
+        else:
+            return self.current_pos
+        position = self._seek_offset + max(elapsed, 0.0)
+        if self.song_length:
+            position = min(position, self.song_length)
+        self.current_pos = position
+        return position
+    
+    def check_finished(self) -> bool:
+        """재생이 끝났으면 상태를 정리하고 True 반환 (UI 타이머에서 호출)"""
+        if self.is_playing and self._mixer is not None and not self._mixer.music.get_busy():
             self.is_playing = False
             self.current_pos = 0
+            self._clock_start = None
+            # 끝난 곡은 재개(unpause)할 수 없으므로 다음 재생은 처음부터 다시 로드
+            self.current_file = None
+            return True
+        return False
     
     @staticmethod
     def format_time(seconds: float) -> str:
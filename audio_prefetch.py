@@ -0,0 +1,110 @@
+"""
+미리듣기 프리페치 캐시
+선택한 곡과 그 다음 곡 몇 개를 백그라운드에서 메모리로 미리 읽어 두어, 느린 저장소(NAS 등)에서도
+재생 시작 시 파일을 다시 읽지 않게 한다. 전체 크기 상한을 넘으면 가장 오래 쓰지 않은 곡부터 버린다.
+"""
+
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Iterable, Optional
+
+PREFETCH_CACHE_BYTES = 256 * 1024 * 1024  # 메모리에 보관할 전체 크기 상한
+PREFETCH_AHEAD = 3                        # 선택한 곡 다음으로 미리 읽을 곡 수
+PREFETCH_WORKERS = 2
+PREFETCH_WAIT_TIMEOUT = 10                # 읽는 중인 곡을 재생할 때 기다릴 최대 시간(초)
+
+
+def _read_file(path: str) -> bytes:
+    with open(path, "rb") as f:
+        return f.read()
+
+
+class AudioPrefetcher:
+    """경로 → 파일 내용 LRU 캐시 + 백그라운드 읽기 (스레드 안전)"""
+
+    def __init__(self, max_bytes: int = PREFETCH_CACHE_BYTES, workers: int = PREFETCH_WORKERS):
+        self.max_bytes = max_bytes
+        self.workers = workers
+        # 이미 끝난 Future에 콜백을 붙이면 같은 스레드에서 바로 실행되므로 재진입 가능한 락 사용
+        self.lock = threading.RLock()
+        self._cache: "OrderedDict[str, bytes]" = OrderedDict()
+        self._size = 0
+        self._pending: Dict[str, Future] = {}
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self.hits = 0
+        self.misses = 0
+
+    def prefetch(self, paths: Iterable[str]):
+        """지정한 곡들을 백그라운드에서 읽기 (이미 있거나 읽는 중이면 건너뜀)
+
+        새 요청 목록에 없는, 아직 시작하지 않은 이전 요청은 취소한다. (목록을 빠르게 넘길 때 대기열 방지)
+        """
+        wanted = list(dict.fromkeys(paths))
+        with self.lock:
+            for path, future in list(self._pending.items()):
+                if path not in wanted and future.cancel():
+                    self._pending.pop(path, None)
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="audio-prefetch")
+            for path in wanted:
+                if path in self._cache or path in self._pending:
+                    continue
+                future = self._executor.submit(_read_file, path)
+                self._pending[path] = future
+                future.add_done_callback(lambda f, p=path: self._store(p, f))
+
+    def _store(self, path: str, future: Future):
+        with self.lock:
+            if self._pending.get(path) is future:
+                del self._pending[path]
+            if future.cancelled() or future.exception() is not None:
+                return
+            self._put(path, future.result())
+
+    def _put(self, path: str, data: bytes):
+        """캐시에 추가하고 크기 상한을 넘으면 오래된 곡부터 제거 (lock 보유 상태에서 호출)"""
+        # 한 곡이 상한의 절반을 넘으면 다른 곡을 모두 밀어내므로 보관하지 않음
+        if len(data) > self.max_bytes // 2:
+            return
+        if path in self._cache:
+            self._size -= len(self._cache.pop(path))
+        self._cache[path] = data
+        self._size += len(data)
+        while self._size > self.max_bytes:
+            _, evicted = self._cache.popitem(last=False)
+            self._size -= len(evicted)
+
+    def get(self, path: str, timeout: float = PREFETCH_WAIT_TIMEOUT) -> Optional[bytes]:
+        """미리 읽어 둔 파일 내용 (읽는 중이면 완료를 기다림), 없으면 None"""
+        with self.lock:
+            data = self._cache.get(path)
+            if data is not None:
+                self._cache.move_to_end(path)
+                self.hits += 1
+                return data
+            future = self._pending.get(path)
+        if future is not None:
+            try:
+                data = future.result(timeout=timeout)
+                self.hits += 1
+                return data
+            except Exception:
+                pass
+        self.misses += 1
+        return None
+
+    def clear(self):
+        with self.lock:
+            for future in list(self._pending.values()):
+                future.cancel()
+            self._pending.clear()
+            self._cache.clear()
+            self._size = 0
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def __len__(self) -> int:
+        return len(self._cache)
@@ -0,0 +1,32 @@
+"""
+일괄 처리 공용 도구
+batch_tagger, spotify_popularity_updater, genre_prior 같은 CLI가 함께 쓰는 종료 코드와 스트리밍 병렬 map.
+CLI 진입점끼리 서로 import하지 않도록 가벼운 표준 라이브러리만 사용한다.
+"""
+
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, Iterator
+
+EXIT_OK = 0
+EXIT_PARTIAL_FAILURE = 1
+EXIT_USAGE = 2
+EXIT_INTERRUPTED = 130
+
+
+def ordered_map(func: Callable, items: Iterable, workers: int) -> Iterator:
+    """입력 순서를 유지하면서 최대 workers*2개까지만 동시에 진행하는 스트리밍 map"""
+    executor = ThreadPoolExecutor(max_workers=workers)
+    pending = deque()
+    try:
+        for item in items:
+            pending.append(executor.submit(func, item))
+            if len(pending) >= workers * 2:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+    except BaseException:
+        # 중단 시 아직 시작하지 않은 작업은 취소하고 진행 중인 작업을 기다리지 않음
+        executor.shutdown(wait=False, cancel_futures=True)
+        raise
+    executor.shutdown()
@@ -0,0 +1,334 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+SmartGenreTagger - 헤드리스 일괄 태깅 CLI
+Qt 없이 서버에서 라이브러리 전체를 태깅하기 위한 진입점
+
+스캔 → 메타데이터 추출 → 장르 추천 → 태그 저장을 스트리밍 파이프라인으로 연결합니다.
+
+사용법:
+    python batch_tagger.py /music --recursive --workers 3 -o result.csv
+    python batch_tagger.py /music --dry-run --format json
+    python batch_tagger.py /music -v                     # 곡별 진행 로그 (기본은 경고 이상만)
+    python batch_tagger.py /music --metrics run.prom   # 단계별 소요 시간/재시도 지표 (.json이면 JSON)
+    python batch_tagger.py /music --profile profiles   # 단계별 cProfile + 전체 스레드 벽시계 샘플 저장
+
+종료 코드:
+    0   모든 파일 처리 성공
+    1   일부 파일 처리 실패
+    2   잘못된 인자 / 처리할 파일 없음 / 설정 오류
+    130 사용자 중단 (Ctrl+C)
+"""
+
+import os
+import sys
+import csv
+import json
+import argparse
+import logging
+from typing import Dict, Iterator, Optional
+
+from batch_common import EXIT_INTERRUPTED, EXIT_OK, EXIT_PARTIAL_FAILURE, EXIT_USAGE, ordered_map
+from profiling import profiler
+
+logger = logging.getLogger(__name__)
+
+# pygame 환영 메시지가 표준 출력(결과 스트림)에 섞이지 않도록 함
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+# CSV 내보내기(main_window.export_to_csv)와 같은 헤더 + 처리 상태
+CSV_FIELDNAMES = ['파일경로', '파일명', '제목', '아티스트', '연도', '장르', '추천장르',
+                  'Spotify_인기도', 'Spotify_URL', '상태', '오류']
+
+# 저장 대상에서 제외할 추천 결과
+INVALID_SUGGESTIONS = ("", "중지됨", "Unknown Genre")
+
+
+def genre_in_suggestion(genre: str, suggestion: str) -> bool:
+    """여러 장르가 /로 구분되어 있을 때 각 장르가 추천값에 포함되는지 체크 (GUI 저장 규칙과 동일)"""
+    for g in genre.split('/'):
+        if g.strip().lower() and g.strip().lower() in suggestion.lower():
+            return True
+    return False
+
+
+class BatchTagger:
+    """스캔부터 저장까지의 헤드리스 태깅 파이프라인"""
+
+    def __init__(self, workers: int = 3, io_workers: int = 4, dry_run: bool = False,
+                 overwrite: bool = False, analyze: bool = False):
+        # 무거운 모듈은 실제 실행 시점에 로드 (--help 등은 즉시 응답)
+        from audio_manager import AudioFileProcessor
+        from library_index import library_index
+        from music_genre_service import music_genre_service
+
+        self.processor = AudioFileProcessor
+        self.index = library_index
+        self.service = music_genre_service
+        self.workers = max(1, workers)
+        self.io_workers = max(1, io_workers)
+        self.dry_run = dry_run
+        self.overwrite = overwrite
+        self.analyze = analyze
+
+    def scan(self, folder: str, recursive: bool = False) -> Iterator[str]:
+        """MP3 파일 경로 스트림"""
+        return self.processor.iter_mp3_files(folder, recursive=recursive)
+
+    @profiler.accumulated("batch_load")
+    def _load(self, path: str) -> Dict:
+        """1단계: 메타데이터 추출"""
+        data = self.index.load_metadata(path, self.processor.extract_metadata)
+        if data is None:
+            return {'path': path, 'filename': os.path.basename(path),
+                    'status': 'error', 'error': '메타데이터 추출 실패'}
+        data['status'] = ''
+        data['error'] = ''
+        if self.analyze:
+            self._analyze(data)
+        return data
+
+    def _analyze(self, data: Dict):
+        """1단계 부가 작업: 훅 위치/음량 분석 후 인덱스에 저장 (실패해도 태깅은 계속)"""
+        from audio_analysis import analyze_file, needs_analysis
+        if not needs_analysis(data):
+            return
+        try:
+            data['analysis'] = analyze_file(data['path'])
+            self.index.update(data['path'], analysis=data['analysis'])
+        except Exception as e:
+            logger.warning("곡 분석 오류 %s: %s", data['filename'], e)
+
+    @profiler.accumulated("batch_recommend")
+    def _recommend_and_save(self, data: Dict) -> Dict:
+        """2단계: 장르 추천 후 태그 저장"""
+        if data['status'] == 'error':
+            return data
+        if self.service.is_stop_requested():
+            data['status'] = 'skipped'
+            return data
+
+        genre = (data.get('genre', '') or '').strip()
+        year = data['year']  # 추천 결과가 캐시된 키 (아래에서 연도를 채우기 전)
+        try:
+            suggestion, year_value = self.service.get_genre_recommendation(
+                data['title'], data['artist'], data['year'], genre, data['path'])
+        except Exception as e:
+            data['status'] = 'error'
+            data['error'] = str(e)
+            return data
+        data['spotify'] = self.service.get_spotify_info(data['title'], data['artist'])
+
+        if suggestion in INVALID_SUGGESTIONS or suggestion.startswith("검색 오류"):
+            data['status'] = 'skipped' if suggestion == "중지됨" else 'no-match'
+            data['error'] = suggestion if suggestion.startswith("검색 오류") else ''
+            return data
+
+        # GUI와 동일한 규칙: 기존 장르와 완전히 다른 추천이면 기존 장르 유지
+        if genre and not self.overwrite and not genre_in_suggestion(genre, suggestion):
+            suggestion = genre
+        data['genre_suggestion'] = suggestion
+
+        # 연도가 비어 있고 새로 추출된 연도가 있으면 채움
+        year_filled = False
+        if not data.get('year') and year_value and year_value.isdigit() and len(year_value) == 4:
+            data['year'] = year_value
+            data['year_added'] = True
+            year_filled = True
+
+        if suggestion == genre and not year_filled:
+            data['status'] = 'unchanged'
+            return data
+        if self.dry_run:
+            data['status'] = 'dry-run'
+            return data
+
+        if self.processor.save_metadata(data):
+            data['status'] = 'saved'
+            # 로컬 예측만으로 나온 추천(캐시에 없음)은 저장했더라도 확정 장르로 캐시하지 않음
+            if suggestion == genre or self.service.has_cached_genre(data['title'], data['artist'], year):
+                self.service.set_cached_genre(data['title'], data['artist'], data['year'], suggestion)
+        else:
+            data['status'] = 'error'
+            data['error'] = '태그 저장 실패'
+        return data
+
+    def run(self, folder: str, recursive: bool = False) -> Iterator[Dict]:
+        """파이프라인 실행 - 처리가 끝난 순서가 아닌 스캔 순서대로 결과를 반환"""
+        self.service.set_stop_flag(False)
+        loaded = ordered_map(self._load, self.scan(folder, recursive), self.io_workers)
+        try:
+            yield from ordered_map(self._recommend_and_save, loaded, self.workers)
+        except BaseException:
+            # 진행 중인 워커들이 다음 API 호출 전에 멈추도록 중지 플래그 설정
+            self.service.set_stop_flag(True)
+            raise
+        finally:
+            self.index.save()
+            self.service.save_cache()
+
+
+class ResultWriter:
+    """처리 결과를 CSV 또는 JSON Lines로 스트리밍 출력"""
+
+    def __init__(self, stream, fmt: str = 'csv'):
+        self.stream = stream
+        self.fmt = fmt
+        self._csv_writer = None
+        if fmt == 'csv':
+            self._csv_writer = csv.DictWriter(stream, fieldnames=CSV_FIELDNAMES)
+            self._csv_writer.writeheader()
+
+    def write(self, data: Dict):
+        year = data.get('year', '') or ''
+        spotify = data.get('spotify') or {}
+        analysis = data.get('analysis') or {}
+        if self.fmt == 'csv':
+            self._csv_writer.writerow({
+                '파일경로': data.get('path', ''),
+                '파일명': data.get('filename', ''),
+                '제목': data.get('title', ''),
+                '아티스트': data.get('artist', ''),
+                '연도': year,
+                '장르': data.get('genre', ''),
+                '추천장르': data.get('genre_suggestion', ''),
+                'Spotify_인기도': spotify.get('popularity', ''),
+                'Spotify_URL': spotify.get('url', ''),
+                '상태': data.get('status', ''),
+                '오류': data.get('error', ''),
+            })
+        else:
+            record = {
+                'path': data.get('path', ''),
+                'filename': data.get('filename', ''),
+                'title': data.get('title', ''),
+                'artist': data.get('artist', ''),
+                'year': year,
+                'genre': data.get('genre', ''),
+                'genre_suggestion': data.get('genre_suggestion', ''),
+                'spotify_popularity': spotify.get('popularity'),
+                'spotify_url': spotify.get('url', ''),
+                'spotify_genres': spotify.get('genres', []),
+                'hook': analysis.get('hook'),
+                'loudness': analysis.get('loudness'),
+                'status': data.get('status', ''),
+                'error': data.get('error', ''),
+            }
+            self.stream.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self.stream.flush()
+
+
+def open_output(path: Optional[str] = None):
+    """결과 스트림 열기 - 경로가 없으면 표준 출력 파일 디스크립터를 따로 연다
+    (로그는 표준 에러로 나가므로 sys.stdout을 바꾸지 않고 결과만 이 스트림에 쓴다)"""
+    if path:
+        return open(path, 'w', newline='', encoding='utf-8-sig')
+    sys.stdout.flush()
+    return open(sys.stdout.fileno(), 'w', newline='', encoding='utf-8', closefd=False)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="SmartGenreTagger 헤드리스 일괄 태거 (GUI 없이 폴더 전체를 태깅)")
+    parser.add_argument("folder", help="MP3 파일이 있는 폴더")
+    parser.add_argument("-r", "--recursive", action="store_true", help="하위 폴더까지 스캔")
+    parser.add_argument("-w", "--workers", type=int, default=3,
+                        help="장르 추천 동시 작업 수 (기본값: 3)")
+    parser.add_argument("--io-workers", type=int, default=4,
+                        help="메타데이터 추출 동시 작업 수 (기본값: 4)")
+    parser.add_argument("-n", "--dry-run", action="store_true", help="태그를 파일에 저장하지 않음")
+    parser.add_argument("--overwrite", action="store_true",
+                        help="기존 장르와 완전히 다른 추천도 그대로 저장")
+    parser.add_argument("--analyze", action="store_true",
+                        help="훅 위치/음량 분석 결과를 라이브러리 인덱스에 저장 (numpy 필요)")
+    parser.add_argument("-f", "--format", choices=["csv", "json"], default="csv",
+                        help="출력 형식 (json은 한 줄에 하나의 JSON 객체)")
+    parser.add_argument("-o", "--output", help="결과 파일 경로 (기본값: 표준 출력)")
+    parser.add_argument("-q", "--quiet", action="store_true", help="경고 로그까지 숨기기 (오류만 출력)")
+    parser.add_argument("-v", "--verbose", action="count", default=0,
+                        help="진행 로그 출력 (기본: 경고 이상만, -v: 곡별 결과, -vv: 디버그)")
+    parser.add_argument("--log-level", metavar="SPEC",
+                        help="로그 레벨 지정 (예: INFO,music_genre_service=DEBUG, 환경변수 SMARTGENRETAGGER_LOG)")
+    parser.add_argument("--metrics", metavar="PATH",
+                        help="단계별 소요 시간/백엔드 이벤트 지표 저장 (.json → JSON, 그 외 → Prometheus 텍스트)")
+    parser.add_argument("--profile", metavar="DIR",
+                        help="프로파일 저장 폴더 (곡별 단계 누적 cProfile + 전체 실행 벽시계 샘플, "
+                             "환경변수 SMARTGENRETAGGER_PROFILE)")
+    return parser
+
+
+def _write_metrics(path: str, quiet: bool):
+    """중단되었더라도 그때까지의 지표를 저장하고 요약을 표준 오류로 출력"""
+    from metrics import metrics
+    try:
+        metrics.write(path)
+    except OSError as e:
+        print(f"지표 저장 실패: {e}", file=sys.stderr)
+        return
+    if not quiet:
+        print(metrics.report(), file=sys.stderr)
+    print(f"지표 저장: {path}", file=sys.stderr)
+
+
+def main(argv: Optional[list] = None) -> int:
+    args = build_parser().parse_args(argv)
+
+    from log_config import bulk_level, setup_logging, shutdown_logging
+    try:
+        setup_logging(bulk_level(args.verbose, args.quiet), args.log_level)
+    except ValueError as e:
+        print(f"오류: {e}", file=sys.stderr)
+        return EXIT_USAGE
+
+    if not os.path.isdir(args.folder):
+        print(f"오류: 폴더를 찾을 수 없습니다: {args.folder}", file=sys.stderr)
+        return EXIT_USAGE
+
+    from config import config, ConfigError
+    try:
+        config.validate()
+    except ConfigError as e:
+        for missing in e.missing:
+            print(f"설정 오류: {missing.message}", file=sys.stderr)
+        return EXIT_USAGE
+
+    if args.profile:
+        try:
+            profiler.enable(args.profile)
+        except OSError as e:
+            print(f"오류: 프로파일 폴더를 만들 수 없습니다: {e}", file=sys.stderr)
+            return EXIT_USAGE
+
+    result_stream = open_output(args.output)
+    counts = {}
+    try:
+        tagger = BatchTagger(workers=args.workers, io_workers=args.io_workers,
+                             dry_run=args.dry_run, overwrite=args.overwrite, analyze=args.analyze)
+        writer = ResultWriter(result_stream, args.format)
+        with profiler.action("batch_run"):
+            for data in tagger.run(args.folder, recursive=args.recursive):
+                writer.write(data)
+                counts[data['status']] = counts.get(data['status'], 0) + 1
+    except KeyboardInterrupt:
+        print("\n사용자에 의해 중단되었습니다.", file=sys.stderr)
+        return EXIT_INTERRUPTED
+    finally:
+        result_stream.close()
+        if profiler.enabled:
+            profiler.disable()  # 곡별 단계 누적 프로파일 저장
+            print(f"프로파일 저장: {profiler.output_dir}", file=sys.stderr)
+        shutdown_logging()  # 요약보다 먼저 남은 로그 출력
+        if args.metrics:
+            _write_metrics(args.metrics, args.quiet)
+
+    total = sum(counts.values())
+    if total == 0:
+        print("처리할 MP3 파일이 없습니다.", file=sys.stderr)
+        return EXIT_USAGE
+    summary = ", ".join(f"{status}: {count}" for status, count in sorted(counts.items()))
+    print(f"총 {total}개 파일 처리 ({summary})", file=sys.stderr)
+    return EXIT_PARTIAL_FAILURE if counts.get('error') else EXIT_OK
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+장르 정규화 마이크로 벤치마크
+
+result.csv의 장르/추천장르 값으로 기존 루프 기반 필터(legacy)와 genre_normalizer 엔진의
+결과가 완전히 같은지 검증하고 처리 시간을 비교합니다. 결과가 다르면 종료 코드 1을 반환합니다.
+
+사용법:
+    python benchmarks/bench_genre_normalizer.py
+    python benchmarks/bench_genre_normalizer.py --csv SmartGenreTagger_Export_20250619_023405.csv --repeat 20
+"""
+
+import os
+import re
+import sys
+import csv
+import time
+import argparse
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from genre_normalizer import GenreNormalizer  # noqa: E402
+
+
+# =============================================================================
+# 기존 구현 (비교 기준, 로그 출력만 제거)
+# =============================================================================
+
+def legacy_filter_artist_in_genres(genres, artist):
+    artist_words = set(artist.lower().replace('.', '').replace('-', ' ').split())
+    filtered = []
+    for g in genres:
+        g_lower = g.lower()
+        if artist.lower() in g_lower:
+            continue
+        if any(word in g_lower for word in artist_words if len(word) > 2):
+            continue
+        filtered.append(g)
+    return filtered
+
+
+def legacy_filter_decade_genres(genres):
+    decade_pattern = re.compile(r'(\b(19|20)\d{2}s\b|\b\d{2}s\b|\bdecade\b|\bera\b)', re.IGNORECASE)
+    return [g for g in genres if not decade_pattern.search(g)]
+
+
+def legacy_clean_compound_genres(genre_string):
+    if not genre_string:
+        return genre_string
+    special_conversions = {
+        'korean hip hop': 'K-Rap',
+        'korean rap': 'K-Rap',
+        'k rap': 'K-Rap',
+        'k-rap': 'K-Rap'
+    }
+    hyphen_exceptions = ['k-pop', 'j-pop', 'c-pop', 'k-rap']
+    meaningless_tags = ['contemporary', 'modern', 'new', 'current', 'recent', 'latest', 'music']
+    genres = [g.strip() for g in genre_string.split('/')]
+    processed_genres = []
+    special_genres = []
+    for genre in genres:
+        genre_lower = genre.lower().strip()
+        if not genre_lower:
+            continue
+        if genre_lower in meaningless_tags:
+            continue
+        converted = False
+        for key, value in special_conversions.items():
+            if key in genre_lower:
+                special_genres.append(value)
+                converted = True
+                break
+        if converted:
+            continue
+        if genre_lower in hyphen_exceptions:
+            special_genres.append(genre.title())
+        else:
+            genre = re.sub(r'-', ' ', genre)
+            genre = ' '.join(genre.split())
+            processed_genres.append(genre)
+    main_genres = ['Hip Hop', 'R&B', 'Rock', 'Pop', 'EDM', 'Electronic', 'Jazz', 'Blues', 'Country', 'Folk']
+    cleaned_genres = []
+    main_genre_found = None
+    for genre in processed_genres:
+        found_main = False
+        for main in main_genres:
+            if main.lower() in genre.lower():
+                if not main_genre_found:
+                    main_genre_found = main
+                    cleaned_genres.append(main)
+                modifier = genre.replace(main, '').strip()
+                if modifier and modifier.lower() not in meaningless_tags:
+                    cleaned_genres.append(modifier)
+                found_main = True
+                break
+        if not found_main:
+            cleaned_genres.append(genre)
+    cleaned_genres.extend(special_genres)
+    unique_genres = []
+    for g in cleaned_genres:
+        g = g.strip()
+        if g and g not in unique_genres and g.lower() not in meaningless_tags:
+            unique_genres.append(g)
+    return ' / '.join(unique_genres[:4])
+
+
+def legacy_titlecase_keep_separators(s):
+    import re
+    return re.sub(r'\w+', lambda m: m.group(0).capitalize(), s)
+
+
+def legacy_filter_regional_genres(genre_result):
+    regional_terms = [
+        "Southern Hip Hop", "southern hip hop",
+        "East Coast Hip Hop", "east coast hip hop",
+        "West Coast Hip Hop", "west coast hip hop",
+        "Midwest Hip Hop", "midwest hip hop",
+        "Southern", "East Coast", "West Coast", "Midwest",
+        "English", "American", "British", "German", "French",
+        "Italian", "Spanish", "Japanese", "Chinese", "Korean",
+        "USA", "US", "UK", "Germany", "France", "Italy", "Spain", "Japan", "China",
+        "2010s", "2000s", "1990s", "90s", "00s", "10s", "20s"
+    ]
+    genres = [g.strip() for g in genre_result.split('/')]
+    filtered_genres = []
+    for genre in genres:
+        if not genre.strip():
+            continue
+        is_filtered = False
+        genre_lower = genre.lower()
+        for regional in regional_terms:
+            if regional.lower() == genre_lower or regional.lower() in genre_lower:
+                is_filtered = True
+                break
+        allowed_exceptions = ["uk drill", "k-pop", "k-rap", "latin", "afrobeats", "hardcore"]
+        if is_filtered:
+            for exception in allowed_exceptions:
+                if exception in genre_lower:
+                    is_filtered = False
+                    break
+        if not is_filtered:
+            filtered_genres.append(genre)
+    if len(filtered_genres) < 1:
+        filtered_genres = ["Hip Hop"]
+    elif len(filtered_genres) < 2:
+        if "Hip Hop" not in ' / '.join(filtered_genres):
+            filtered_genres.insert(0, "Hip Hop")
+    return ' / '.join(filtered_genres[:4])
+
+
+# =============================================================================
+# 벤치마크
+# =============================================================================
+
+def load_rows(csv_path):
+    """(장르 문자열, 아티스트) 목록 로드 - 장르와 추천장르 컬럼 모두 사용"""
+    rows = []
+    with open(csv_path, newline='', encoding='utf-8-sig') as f:
+        for record in csv.DictReader(f):
+            artist = record.get('아티스트', '') or ''
+            for column in ('장르', '추천장르'):
+                value = record.get(column, '') or ''
+                if value:
+                    rows.append((value, artist))
+    return rows
+
+
+def build_cases(normalizer):
+    """(이름, legacy 함수, 엔진 함수) - 모두 (장르 문자열, 아티스트)를 입력으로 받음"""
+    def split(value):
+        return [g.strip() for g in value.split('/') if g.strip()]
+
+    return [
+        ("filter_regional", lambda v, a: legacy_filter_regional_genres(v),
+         lambda v, a: normalizer.filter_regional(v)),
+        ("titlecase", lambda v, a: legacy_titlecase_keep_separators(v),
+         lambda v, a: normalizer.titlecase(v)),
+        ("gpt post-process", lambda v, a: legacy_titlecase_keep_separators(legacy_filter_regional_genres(v)),
+         lambda v, a: normalizer.refine(v)),
+        ("clean_compound", lambda v, a: legacy_clean_compound_genres(v),
+         lambda v, a: normalizer.clean_compound(v)),
+        ("filter_decade", lambda v, a: legacy_filter_decade_genres(split(v)),
+         lambda v, a: normalizer.filter_decades(split(v))),
+        ("filter_artist", lambda v, a: legacy_filter_artist_in_genres(split(v), a),
+         lambda v, a: normalizer.filter_artist(split(v), a)),
+        ("decade + artist", lambda v, a: legacy_filter_artist_in_genres(legacy_filter_decade_genres(split(v)), a),
+         lambda v, a: normalizer.filter_genre_list(split(v), a)),
+    ]
+
+
+def time_function(func, rows, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for value, artist in rows:
+            func(value, artist)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="장르 정규화 엔진 마이크로 벤치마크")
+    parser.add_argument("--csv", default=os.path.join(PROJECT_ROOT, "result.csv"), help="입력 CSV 경로")
+    parser.add_argument("--repeat", type=int, default=10, help="반복 횟수 (최솟값 사용)")
+    args = parser.parse_args()
+
+    rows = load_rows(args.csv)
+    normalizer = GenreNormalizer()
+    print(f"입력: {os.path.basename(args.csv)} ({len(rows)}개 장르 문자열)\n")
+    print(f"{'case':<18}{'legacy':>12}{'engine':>12}{'speedup':>10}  parity")
+
+    all_match = True
+    for name, legacy, engine in build_cases(normalizer):
+        mismatches = [(v, a) for v, a in rows if legacy(v, a) != engine(v, a)]
+        legacy_time = time_function(legacy, rows, args.repeat)
+        engine_time = time_function(engine, rows, args.repeat)
+        parity = "OK" if not mismatches else f"FAIL ({len(mismatches)})"
+        print(f"{name:<18}{legacy_time * 1000:>10.2f}ms{engine_time * 1000:>10.2f}ms"
+              f"{legacy_time / engine_time:>9.1f}x  {parity}")
+        for value, artist in mismatches[:3]:
+            print(f"    {value!r} ({artist}): {legacy(value, artist)!r} != {engine(value, artist)!r}")
+        all_match = all_match and not mismatches
+    return 0 if all_match else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
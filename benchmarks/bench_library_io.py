@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+라이브러리 스캔/태그 I/O 벤치마크
+
+gen_mp3_library로 만든 합성 MP3 라이브러리(기본 1k, 10k, 100k개)에서 다음 단계를 측정합니다.
+    scan        AudioFileProcessor.get_mp3_files (폴더 목록)
+    parse       AudioFileProcessor.extract_metadata (eyed3 태그 + 재생 길이)
+    load        load_all_files와 같은 경로 - library_index.load_metadata (빈 인덱스 / 인덱스 적중)
+    save        AudioFileProcessor.save_metadata (장르를 바꿔 저장)
+단계별 파일/초와 함께 /proc/self/io 기준 읽은/쓴 바이트를 세어, 저장 1회당 다시 쓴 바이트와
+패딩이 부족해 파일 전체를 다시 쓴 비율을 출력합니다. (Linux 외에서는 바이트 수 생략)
+eyed3와 mutagen이 필요합니다.
+
+사용법:
+    python benchmarks/bench_library_io.py
+    python benchmarks/bench_library_io.py --sizes 1000,10000 --save-sample 2000
+    python benchmarks/bench_library_io.py --dir /mnt/nas/bench --sizes 10000 --keep --json nas.json
+    sudo python benchmarks/bench_library_io.py --drop-caches   # 매 단계 전 페이지 캐시 비우기
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import shutil
+import logging
+import argparse
+import tempfile
+from typing import Dict, List, Optional
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from gen_mp3_library import DEFAULT_CSV, generate_library  # noqa: E402
+
+DEFAULT_SIZES = "1000,10000,100000"
+SAVE_GENRES = ["Hip Hop / Trap", "K-Pop / Dance", "R&B / Soul / Neo Soul", "Electronic / House / Deep House"]
+
+
+def io_counters() -> Optional[Dict[str, int]]:
+    """현재 프로세스의 누적 읽기/쓰기 바이트 (rchar/wchar, Linux 전용)"""
+    try:
+        with open("/proc/self/io") as f:
+            fields = dict(line.split(": ") for line in f.read().splitlines())
+        return {"read": int(fields["rchar"]), "write": int(fields["wchar"])}
+    except (OSError, KeyError, ValueError):
+        return None
+
+
+def drop_caches():
+    """페이지 캐시 비우기 (root 권한 필요, 실패하면 무시)"""
+    try:
+        os.sync()
+        with open("/proc/sys/vm/drop_caches", "w") as f:
+            f.write("3\n")
+    except OSError as e:
+        print(f"  (페이지 캐시를 비울 수 없습니다: {e})")
+
+
+class Stage:
+    """with 블록의 소요 시간과 I/O 바이트 측정"""
+
+    def __init__(self, name: str, count: int, flush_caches: bool = False):
+        self.name = name
+        self.count = count
+        self.flush_caches = flush_caches
+        self.elapsed = 0.0
+        self.read = self.written = None
+
+    def __enter__(self):
+        if self.flush_caches:
+            drop_caches()
+        self._io = io_counters()
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.elapsed = time.perf_counter() - self._start
+        after = io_counters()
+        if self._io and after:
+            self.read = after["read"] - self._io["read"]
+            self.written = after["write"] - self._io["write"]
+        return False
+
+    def report(self, extra: str = ""):
+        rate = self.count / self.elapsed if self.elapsed else 0.0
+        line = f"  {self.name:<12} {self.count:>7}개 {self.elapsed:>8.2f}s {rate:>10.0f}개/s"
+        if self.read is not None:
+            line += f"  읽기 {self.read / self.count / 1024:>7.1f}KB/개  쓰기 {self.written / self.count / 1024:>7.1f}KB/개"
+        print(line + (f"  {extra}" if extra else ""))
+
+
+def run_size(folder: str, count: int, args) -> Dict:
+    from audio_manager import AudioFileProcessor
+    from library_index import LibraryIndex
+
+    result = {"count": count}
+    if not os.path.isdir(folder) or len(os.listdir(folder)) != count:
+        shutil.rmtree(folder, ignore_errors=True)
+        start = time.perf_counter()
+        total = generate_library(folder, count, args.frames, args.seed, args.csv)
+        print(f"  생성         {count:>7}개 {time.perf_counter() - start:>8.2f}s  ({total / 1024 / 1024:.1f}MB)")
+
+    with Stage("scan", count, args.drop_caches) as stage:
+        files = AudioFileProcessor.get_mp3_files(folder)
+    stage.report()
+    result["scan"] = stage.elapsed
+
+    with Stage("parse", count, args.drop_caches) as stage:
+        records = [AudioFileProcessor.extract_metadata(path) for path in files]
+    failed = sum(r is None for r in records)
+    stage.report(f"실패 {failed}개" if failed else "")
+    result["parse"] = stage.elapsed
+
+    index_file = os.path.join(os.path.dirname(folder), f".bench_index_{count}.pkl")
+    index = LibraryIndex(index_file, autosave_every=0)
+    with Stage("load(cold)", count, args.drop_caches) as stage:
+        for path in files:
+            index.load_metadata(path, AudioFileProcessor.extract_metadata)
+        index.save()
+    stage.report()
+    result["load_cold"] = stage.elapsed
+
+    index = LibraryIndex(index_file, autosave_every=0)
+    with Stage("load(index)", count, args.drop_caches) as stage:
+        for path in files:
+            index.load_metadata(path, AudioFileProcessor.extract_metadata)
+    stage.report(f"적중 {index.hits}개")
+    result["load_index"] = stage.elapsed
+    os.remove(index_file)
+
+    rng = random.Random(args.seed)
+    sample = [r for r in records if r][:args.save_sample or None]
+    sizes_before = {r['path']: os.path.getsize(r['path']) for r in sample}
+    with Stage("save", len(sample), args.drop_caches) as stage:
+        saved = 0
+        for record in sample:
+            record = dict(record, genre_suggestion=rng.choice(SAVE_GENRES))
+            saved += AudioFileProcessor.save_metadata(record)
+    grown = sum(os.path.getsize(path) != size for path, size in sizes_before.items())
+    stage.report(f"파일 크기 변경(전체 재작성) {grown / max(len(sample), 1):.0%}")
+    result.update(save=stage.elapsed, saved=saved, rewritten_files=grown,
+                  bytes_written_per_save=(stage.written / max(len(sample), 1)) if stage.written is not None else None)
+    return result
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="라이브러리 스캔/태그 I/O 벤치마크 (합성 MP3)")
+    parser.add_argument("--sizes", default=DEFAULT_SIZES, help=f"파일 수 목록 (기본 {DEFAULT_SIZES})")
+    parser.add_argument("--dir", help="라이브러리를 만들 폴더 (기본: 임시 폴더, 같은 크기면 재사용)")
+    parser.add_argument("--keep", action="store_true", help="끝난 뒤 생성한 파일을 지우지 않음")
+    parser.add_argument("--frames", type=int, default=10, help="파일당 MPEG 프레임 수")
+    parser.add_argument("--save-sample", type=int, default=1000,
+                        help="저장을 측정할 파일 수 (0: 전체, 저장은 파일을 수정함)")
+    parser.add_argument("--csv", default=DEFAULT_CSV, help="곡 정보를 가져올 CSV")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--drop-caches", action="store_true", help="단계마다 페이지 캐시 비우기 (root)")
+    parser.add_argument("--json", metavar="PATH", help="결과를 JSON 파일로 저장 (비교용)")
+    args = parser.parse_args()
+
+    try:
+        import eyed3  # noqa: F401
+        import mutagen  # noqa: F401
+    except ImportError as e:
+        print(f"eyed3와 mutagen이 필요합니다: {e}", file=sys.stderr)
+        return 1
+    logging.getLogger("eyed3").setLevel(logging.ERROR)
+
+    sizes: List[int] = [int(s) for s in args.sizes.split(",") if s.strip()]
+    base = args.dir or tempfile.mkdtemp(prefix="bench_library_io_")
+    results = []
+    try:
+        for count in sizes:
+            print(f"[{count}개]")
+            results.append(run_size(os.path.join(base, f"lib_{count}"), count, args))
+    finally:
+        if not args.keep:
+            # --dir로 지정한 폴더는 이 벤치마크가 만든 하위 폴더만 삭제
+            for count in sizes:
+                shutil.rmtree(os.path.join(base, f"lib_{count}"), ignore_errors=True)
+            if not args.dir:
+                shutil.rmtree(base, ignore_errors=True)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+        print(f"결과 저장: {args.json}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
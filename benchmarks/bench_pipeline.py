@@ -0,0 +1,460 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+태깅 파이프라인 처리량 벤치마크 (외부 API 호출 없음)
+
+MusicBrainz, Discogs, OpenAI, Spotify 클라이언트 모듈을 지연 시간과 429 응답 비율을 조절할 수 있는
+가짜 모듈로 바꿔 넣고, 번들 CSV의 곡 목록으로 다음 경로를 측정합니다.
+    sync     MusicGenreService.get_genre_recommendation (스레드 풀, GUI/CLI와 같은 방식)
+    async    MusicGenreService.get_genre_recommendation_async (asyncio.gather)
+    spotify  SpotifyPopularityUpdater.process_csv (pandas 필요)
+시나리오마다 새 프로세스를 띄워 임시 폴더에서 실행하므로 캐시 파일이 남지 않고 최대 RSS도 따로 측정됩니다.
+곡/초, 곡별 지연 시간 p50/p95, 최대 RSS, 단계별 지표 요약을 출력하고,
+--min-rate보다 느린 시나리오가 있으면 종료 코드 1을 반환합니다.
+
+서비스 안의 고정 대기(API 예절용 sleep, 재시도 백오프)는 --sleep-scale 배로 줄여서 실행합니다.
+(기본 0: 파이프라인 자체 오버헤드 측정, 1: 실제와 같은 대기 시간)
+
+사용법:
+    python benchmarks/bench_pipeline.py --limit 300
+    python benchmarks/bench_pipeline.py --scenario sync --workers 8 --latency gpt=0.5 --rate-429 0.05
+    python benchmarks/bench_pipeline.py --limit 1000 --json before.json
+"""
+
+import os
+import sys
+import csv
+import json
+import time
+import types
+import random
+import argparse
+import resource
+import tempfile
+import threading
+import subprocess
+from typing import Dict, List
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_CSV = os.path.join(PROJECT_ROOT, "SmartGenreTagger_Export_20250619_023405.csv")
+
+SCENARIOS = ("sync", "async", "spotify")
+
+# 백엔드별 기본 가짜 응답 지연(초)
+DEFAULT_LATENCY = {"musicbrainz": 0.05, "discogs": 0.08, "gpt": 0.3, "spotify": 0.03}
+
+FAKE_TAGS = ["hip hop", "trap", "southern hip hop", "pop", "r&b", "dance", "electronic", "rap"]
+FAKE_ENV = {
+    "OPENAI_API_KEY": "bench",
+    "DISCOGS_TOKEN": "bench",
+    "SPOTIFY_CLIENT_ID": "bench",
+    "SPOTIFY_CLIENT_SECRET": "bench",
+}
+
+
+# =============================================================================
+# 가짜 백엔드
+# =============================================================================
+
+class FakeBackend:
+    """응답 지연 + 429 응답 비율 (모든 가짜 클라이언트가 공유)"""
+
+    def __init__(self, latency: Dict[str, float], rate_429: float, jitter: float, seed: int):
+        self.latency = latency
+        self.rate_429 = rate_429
+        self.jitter = jitter
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.calls: Dict[str, int] = {}
+
+    def request(self, backend: str) -> bool:
+        """지연 시간만큼 대기하고, 429로 응답해야 하면 True"""
+        with self.lock:
+            self.calls[backend] = self.calls.get(backend, 0) + 1
+            jitter = self.random.uniform(-self.jitter, self.jitter)
+            limited = self.random.random() < self.rate_429
+        delay = self.latency.get(backend, 0.0) * (1 + jitter)
+        if delay > 0:
+            time.sleep(delay)
+        return limited
+
+
+class FakeSpotifyException(Exception):
+    def __init__(self, http_status: int, retry_after: float = 0.05):
+        super().__init__(f"http status: {http_status}")
+        self.http_status = http_status
+        self.headers = {"Retry-After": str(retry_after)}
+
+
+def install_fake_modules(backend: FakeBackend, catalog: Dict[str, Dict]):
+    """musicbrainzngs / discogs_client / openai / spotipy 자리에 가짜 모듈 등록"""
+    rng = random.Random(1)
+
+    def tags(n=4):
+        return [{"name": name} for name in rng.sample(FAKE_TAGS, n)]
+
+    # MusicBrainz
+    mb = types.ModuleType("musicbrainzngs")
+    mb.set_useragent = lambda *args, **kwargs: None
+    mb.set_rate_limit = lambda *args, **kwargs: None
+
+    def search_recordings(query=None, limit=3):
+        if backend.request("musicbrainz"):
+            raise Exception("HTTP Error 429: Too Many Requests")
+        return {"recording-list": [{
+            "first-release-date": "2019-05-01",
+            "tag-list": tags(2),
+            "artist-credit": [{"artist": {"id": f"mb-artist-{i}"}}],
+        } for i in range(min(limit, 2))]}
+
+    def get_artist_by_id(artist_id, includes=None):
+        if backend.request("musicbrainz"):
+            raise Exception("HTTP Error 429: Too Many Requests")
+        return {"artist": {"id": artist_id, "tag-list": tags(3)}}
+
+    mb.search_recordings = search_recordings
+    mb.get_artist_by_id = get_artist_by_id
+
+    # Discogs
+    discogs = types.ModuleType("discogs_client")
+
+    class DiscogsResult:
+        def __init__(self):
+            self.genres = ["Hip Hop"]
+            self.styles = ["Trap", "Pop Rap"]
+
+    class DiscogsClient:
+        def __init__(self, user_agent, user_token=None):
+            pass
+
+        def search(self, query, type=None, per_page=3):
+            if backend.request("discogs"):
+                raise Exception("429: You are making requests too quickly.")
+            return [DiscogsResult() for _ in range(per_page)]
+
+    discogs.Client = DiscogsClient
+
+    # OpenAI
+    openai = types.ModuleType("openai")
+
+    class Completions:
+        def create(self, timeout=None, **kwargs):
+            if backend.request("gpt"):
+                raise Exception("Error code: 429 - Rate limit reached")
+            message = types.SimpleNamespace(content="Hip Hop / Trap / Southern")
+            return types.SimpleNamespace(choices=[types.SimpleNamespace(message=message)])
+
+    class OpenAI:
+        def __init__(self, api_key=None):
+            self.chat = types.SimpleNamespace(completions=Completions())
+
+    openai.OpenAI = OpenAI
+
+    # Spotify (spotify_client._spotify에 직접 넣으므로 spotipy는 import와 예외 타입만 필요)
+    spotipy = types.ModuleType("spotipy")
+    oauth2 = types.ModuleType("spotipy.oauth2")
+
+    class SpotifyOauthError(Exception):
+        pass
+
+    oauth2.SpotifyOauthError = SpotifyOauthError
+    spotipy.oauth2 = oauth2
+    spotipy.SpotifyException = FakeSpotifyException
+
+    sys.modules.update({
+        "musicbrainzngs": mb,
+        "discogs_client": discogs,
+        "openai": openai,
+        "spotipy": spotipy,
+        "spotipy.oauth2": oauth2,
+    })
+    return FakeSpotify(backend, catalog)
+
+
+class FakeSpotify:
+    """검색어 → 트랙 카탈로그 (찾지 못하는 검색어는 다른 곡 후보만 반환)"""
+
+    FILLER = [{
+        "id": f"filler{i}", "name": f"Other Song {i}", "popularity": 10,
+        "artists": [{"name": f"Other Artist {i}", "id": f"filler-artist-{i}"}],
+        "external_urls": {"spotify": f"https://open.spotify.com/track/filler{i}"},
+    } for i in range(19)]
+
+    def __init__(self, backend: FakeBackend, catalog: Dict[str, Dict]):
+        self.backend = backend
+        self.catalog = catalog
+
+    def _request(self):
+        if self.backend.request("spotify"):
+            raise FakeSpotifyException(429)
+
+    def search(self, q, type="track", limit=20):
+        self._request()
+        track = self.catalog.get(q)
+        items = ([track] if track else []) + self.FILLER[:limit - 1]
+        return {"tracks": {"items": items}}
+
+    def artists(self, ids):
+        self._request()
+        return {"artists": [{"id": i, "genres": ["trap", "rap"]} for i in ids]}
+
+    def tracks(self, ids):
+        self._request()
+        return {"tracks": [{"id": i, "popularity": 50} for i in ids]}
+
+
+class ScaledTime:
+    """서비스 모듈의 time 대체 - sleep만 scale배로 줄임"""
+
+    def __init__(self, scale: float):
+        self.scale = scale
+
+    def sleep(self, seconds):
+        if seconds > 0 and self.scale > 0:
+            time.sleep(seconds * self.scale)
+
+    def __getattr__(self, name):
+        return getattr(time, name)
+
+
+# =============================================================================
+# 시나리오 실행 (자식 프로세스)
+# =============================================================================
+
+def load_tracks(csv_path: str, limit: int, strip_year: float, seed: int) -> List[Dict]:
+    """CSV 곡 목록 (strip_year 비율만큼 연도를 지워 MusicBrainz/Discogs 경로도 실행)"""
+    rng = random.Random(seed)
+    tracks = []
+    with open(csv_path, newline="", encoding="utf-8-sig") as f:
+        for row in csv.DictReader(f):
+            title, artist = row.get("제목", "").strip(), row.get("아티스트", "").strip()
+            if not title or not artist:
+                continue
+            year = "" if rng.random() < strip_year else row.get("연도", "")
+            tracks.append({"title": title, "artist": artist, "year": year, "genre": row.get("장르", "")})
+            if limit and len(tracks) >= limit:
+                break
+    return tracks
+
+
+def build_catalog(tracks: List[Dict], found: float, seed: int) -> Dict[str, Dict]:
+    """첫 번째 검색 전략의 검색어 → 원곡 트랙 (found 비율만큼만 등록)"""
+    from text_normalizer import search_query
+    rng = random.Random(seed)
+    catalog = {}
+    for i, track in enumerate(tracks):
+        if rng.random() >= found:
+            continue
+        catalog[search_query(track["title"], track["artist"])] = {
+            "id": f"track{i}", "name": track["title"], "popularity": rng.randint(0, 100),
+            "artists": [{"name": track["artist"], "id": f"artist{i}"}],
+            "external_urls": {"spotify": f"https://open.spotify.com/track/track{i}"},
+        }
+    return catalog
+
+
+def percentile(values: List[float], q: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+def peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux는 KB, macOS는 바이트 단위
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def run_sync(service, tracks: List[Dict], workers: int) -> List[float]:
+    from concurrent.futures import ThreadPoolExecutor
+
+    def recommend(track):
+        start = time.perf_counter()
+        service.get_genre_recommendation(track["title"], track["artist"], track["year"], track["genre"])
+        return time.perf_counter() - start
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(recommend, tracks))
+
+
+def run_async(service, tracks: List[Dict], workers: int) -> List[float]:
+    import asyncio
+
+    async def main():
+        semaphore = asyncio.Semaphore(workers)
+
+        async def recommend(track):
+            async with semaphore:
+                start = time.perf_counter()
+                await service.get_genre_recommendation_async(
+                    track["title"], track["artist"], track["year"], track["genre"])
+                return time.perf_counter() - start
+
+        return await asyncio.gather(*(recommend(t) for t in tracks))
+
+    return list(asyncio.run(main()))
+
+
+def write_tracks_csv(tracks: List[Dict], path: str):
+    with open(path, "w", newline="", encoding="utf-8-sig") as f:
+        writer = csv.writer(f)
+        writer.writerow(["제목", "아티스트", "연도", "장르"])
+        writer.writerows([t["title"], t["artist"], t["year"], t["genre"]] for t in tracks)
+
+
+def run_child(args) -> Dict:
+    """임시 폴더에서 한 시나리오 실행 후 결과 dict 반환"""
+    workdir = tempfile.mkdtemp(prefix="bench_pipeline_")
+    os.chdir(workdir)  # 캐시/인덱스/토큰 파일은 모두 상대 경로
+    sys.path.insert(0, PROJECT_ROOT)
+
+    tracks = load_tracks(args.csv, args.limit, args.strip_year, args.seed)
+    backend = FakeBackend(parse_latency(args.latency), args.rate_429, args.jitter, args.seed)
+    fake_spotify = install_fake_modules(backend, build_catalog(tracks, args.found, args.seed))
+
+    import logging
+    from log_config import setup_logging
+    setup_logging(logging.DEBUG if args.verbose else logging.ERROR)
+
+    from config import config
+    config._env, config._env_loaded = dict(FAKE_ENV), True
+    import spotify_client
+    spotify_client._spotify = fake_spotify
+    from metrics import metrics
+
+    result = {"scenario": args.scenario, "tracks": len(tracks), "workers": args.workers}
+    if args.scenario == "spotify":
+        try:
+            from spotify_popularity_updater import SpotifyPopularityUpdater
+        except SystemExit:
+            return dict(result, skipped="pandas가 설치되어 있지 않습니다")
+        input_csv = os.path.join(workdir, "input.csv")
+        write_tracks_csv(tracks, input_csv)
+        updater = SpotifyPopularityUpdater()
+        updater.workers = args.workers
+        start = time.perf_counter()
+        updater.process_csv(input_csv, os.path.join(workdir, "output.csv"))
+        elapsed = time.perf_counter() - start
+        # 행별 시간은 노출되지 않으므로 Spotify 요청 지연 분포를 사용
+        stage = metrics.snapshot()["stages"].get("spotify", {})
+        p50, p95 = stage.get("p50", 0.0), stage.get("p95", 0.0)
+    else:
+        import music_genre_service as service_module
+        service_module.time = ScaledTime(args.sleep_scale)
+        service = service_module.MusicGenreService()
+        runner = run_sync if args.scenario == "sync" else run_async
+        start = time.perf_counter()
+        latencies = runner(service, tracks, args.workers)
+        elapsed = time.perf_counter() - start
+        p50, p95 = percentile(latencies, 0.5), percentile(latencies, 0.95)
+
+    return dict(result, elapsed=round(elapsed, 3), rate=round(len(tracks) / elapsed, 2) if elapsed else 0.0,
+                p50_ms=round(p50 * 1000, 1), p95_ms=round(p95 * 1000, 1), peak_rss_mb=round(peak_rss_mb(), 1),
+                backend_calls=backend.calls, metrics=metrics.snapshot())
+
+
+# =============================================================================
+# 부모 프로세스: 시나리오별 자식 실행 + 결과 출력
+# =============================================================================
+
+def parse_latency(spec: str) -> Dict[str, float]:
+    """'gpt=0.5,spotify=0.01' → 기본값에 덮어쓴 백엔드별 지연"""
+    latency = dict(DEFAULT_LATENCY)
+    for part in filter(None, (p.strip() for p in (spec or "").split(","))):
+        name, _, value = part.partition("=")
+        if name not in latency:
+            raise argparse.ArgumentTypeError(f"알 수 없는 백엔드: {name} ({', '.join(latency)})")
+        latency[name] = float(value)
+    return latency
+
+
+def child_argv(args, scenario: str) -> List[str]:
+    argv = [sys.executable, os.path.abspath(__file__), "--child", "--scenario", scenario,
+            "--csv", os.path.abspath(args.csv), "--limit", str(args.limit), "--workers", str(args.workers),
+            "--latency", args.latency or "", "--rate-429", str(args.rate_429), "--jitter", str(args.jitter),
+            "--found", str(args.found), "--strip-year", str(args.strip_year),
+            "--sleep-scale", str(args.sleep_scale), "--seed", str(args.seed)]
+    return argv + (["--verbose"] if args.verbose else [])
+
+
+def print_result(result: Dict):
+    if result.get("skipped"):
+        print(f"  {result['scenario']:<8} 건너뜀: {result['skipped']}")
+        return
+    print(f"  {result['scenario']:<8} {result['tracks']:>6}곡 {result['elapsed']:>8.2f}s "
+          f"{result['rate']:>8.1f}곡/s  p50 {result['p50_ms']:>8.1f}ms  p95 {result['p95_ms']:>8.1f}ms  "
+          f"최대 RSS {result['peak_rss_mb']:>6.1f}MB")
+    counters = result["metrics"].get("counters", {})
+    events = ", ".join(f"{b}.{e}={n}" for b, ev in counters.items() for e, n in ev.items()
+                       if e in ("retry", "rate_limited", "hit", "miss"))
+    if events:
+        print(f"           {events}")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="태깅 파이프라인 처리량 벤치마크 (가짜 백엔드)")
+    parser.add_argument("--csv", default=DEFAULT_CSV, help="곡 목록 CSV ('제목', '아티스트' 컬럼)")
+    parser.add_argument("--scenario", choices=SCENARIOS, action="append",
+                        help="실행할 시나리오 (여러 번 지정 가능, 기본: 전부)")
+    parser.add_argument("--limit", type=int, default=500, help="곡 수 제한 (0: 전체)")
+    parser.add_argument("-w", "--workers", type=int, default=4, help="동시 작업 수")
+    parser.add_argument("--latency", default="",
+                        help="백엔드별 응답 지연(초), 예: gpt=0.5,musicbrainz=0.1 (기본 %s)" %
+                             ",".join(f"{k}={v}" for k, v in DEFAULT_LATENCY.items()))
+    parser.add_argument("--rate-429", type=float, default=0.0, help="429 응답 비율 (0~1)")
+    parser.add_argument("--jitter", type=float, default=0.2, help="지연 시간 변동 비율 (±)")
+    parser.add_argument("--found", type=float, default=0.9, help="Spotify에서 찾을 수 있는 곡 비율")
+    parser.add_argument("--strip-year", type=float, default=0.5,
+                        help="연도를 지울 곡 비율 (연도 없는 곡은 MusicBrainz/Discogs 경로를 탐)")
+    parser.add_argument("--sleep-scale", type=float, default=0.0,
+                        help="서비스 고정 대기/백오프 배율 (0: 대기 없음, 1: 실제와 같음)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--min-rate", type=float, default=0.0,
+                        help="시나리오별 최소 처리량(곡/s) - 미달 시 종료 코드 1")
+    parser.add_argument("--json", metavar="PATH", help="결과를 JSON 파일로 저장 (비교용)")
+    parser.add_argument("-v", "--verbose", action="store_true", help="서비스 로그 출력")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    return parser
+
+
+def main() -> int:
+    args = build_parser().parse_args()
+    parse_latency(args.latency)
+
+    if args.child:
+        args.scenario = args.scenario[0]
+        print(json.dumps(run_child(args), ensure_ascii=False))
+        return 0
+
+    if not os.path.isfile(args.csv):
+        print(f"CSV 파일을 찾을 수 없습니다: {args.csv}", file=sys.stderr)
+        return 1
+
+    print(f"CSV: {os.path.basename(args.csv)}, 곡 수 제한 {args.limit or '없음'}, 동시 작업 {args.workers}, "
+          f"429 비율 {args.rate_429:.0%}, 대기 배율 {args.sleep_scale}")
+    results, failed = [], False
+    for scenario in args.scenario or SCENARIOS:
+        proc = subprocess.run(child_argv(args, scenario), capture_output=True, text=True)
+        if proc.returncode != 0:
+            print(f"  {scenario:<8} 실패:\n{proc.stderr.strip()}", file=sys.stderr)
+            failed = True
+            continue
+        if args.verbose and proc.stderr:
+            print(proc.stderr, file=sys.stderr)
+        result = json.loads(proc.stdout.strip().splitlines()[-1])
+        results.append(result)
+        print_result(result)
+        if not result.get("skipped") and result["rate"] < args.min_rate:
+            print(f"  ⚠️ {scenario}: 처리량 {result['rate']}곡/s < 기준 {args.min_rate}곡/s")
+            failed = True
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+        print(f"결과 저장: {args.json}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+시작 시간 벤치마크 (회귀 방지용)
+
+새 프로세스에서 main_window import 시간과 메인 윈도우 표시 시간을 측정하고,
+무거운 모듈(musicbrainzngs, openai, pygame 등)이 시작 경로에서 로드되지 않는지 확인합니다.
+예산을 초과하거나 무거운 모듈이 로드되면 종료 코드 1을 반환합니다.
+
+사용법:
+    python benchmarks/bench_startup.py
+    python benchmarks/bench_startup.py --repeat 10 --import-budget 0.4 --window-budget 0.8
+    python benchmarks/bench_startup.py --importtime 15   # 가장 느린 import 15개 출력
+"""
+
+import os
+import sys
+import json
+import argparse
+import statistics
+import subprocess
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 시작 경로에서 로드되면 안 되는 모듈들
+HEAVY_MODULES = ["musicbrainzngs", "discogs_client", "openai", "aiohttp", "asyncio", "pygame", "eyed3"]
+
+IMPORT_SNIPPET = """
+import sys, time, json
+t = time.perf_counter()
+import main_window
+elapsed = time.perf_counter() - t
+print(json.dumps({"elapsed": elapsed, "loaded": [m for m in %r if m in sys.modules]}))
+""" % (HEAVY_MODULES,)
+
+WINDOW_SNIPPET = """
+import sys, time, json
+t = time.perf_counter()
+from PySide6.QtWidgets import QApplication
+app = QApplication(sys.argv)
+from main_window import SmartGenreTaggerMainWindow
+window = SmartGenreTaggerMainWindow()
+window.show()
+app.processEvents()
+elapsed = time.perf_counter() - t
+print(json.dumps({"elapsed": elapsed, "loaded": [m for m in %r if m in sys.modules]}))
+""" % (HEAVY_MODULES,)
+
+
+def run_snippet(snippet: str) -> dict:
+    """새 인터프리터에서 스니펫 실행 후 측정 결과 반환"""
+    env = dict(os.environ)
+    env.setdefault("QT_QPA_PLATFORM", "offscreen")
+    proc = subprocess.run([sys.executable, "-c", snippet], cwd=PROJECT_ROOT, env=env,
+                          capture_output=True, text=True)
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr.strip() or f"exit code {proc.returncode}")
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def measure(name: str, snippet: str, repeat: int, budget: float) -> bool:
+    """repeat회 측정 후 중앙값과 예산 비교"""
+    results = [run_snippet(snippet) for _ in range(repeat)]
+    times = [r["elapsed"] for r in results]
+    median = statistics.median(times)
+    loaded = sorted(set(m for r in results for m in r["loaded"]))
+    ok = median <= budget and not loaded
+    print(f"{name:<16} median {median * 1000:7.1f} ms  "
+          f"(min {min(times) * 1000:.1f} / max {max(times) * 1000:.1f}, budget {budget * 1000:.0f} ms)  "
+          f"{'OK' if ok else 'FAIL'}")
+    if loaded:
+        print(f"  ⚠️ 시작 경로에서 로드된 무거운 모듈: {', '.join(loaded)}")
+    return ok
+
+
+def print_importtime(top: int):
+    """python -X importtime 결과에서 누적 시간이 큰 모듈 출력"""
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", "import main_window"],
+                          cwd=PROJECT_ROOT, capture_output=True, text=True)
+    rows = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        fields = line[len("import time:"):].split("|")
+        rows.append((int(fields[1]), int(fields[0]), fields[2].rstrip()))
+    rows.sort(reverse=True)
+    print(f"\n누적 import 시간 상위 {top}개:")
+    for cumulative_us, self_us, module in rows[:top]:
+        print(f"  {cumulative_us / 1000:8.1f} ms  (self {self_us / 1000:6.1f} ms)  {module}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="SmartGenreTagger 시작 시간 벤치마크")
+    parser.add_argument("--repeat", type=int, default=5, help="측정 반복 횟수 (기본값: 5)")
+    parser.add_argument("--import-budget", type=float, default=0.5, help="main_window import 예산(초)")
+    parser.add_argument("--window-budget", type=float, default=0.8, help="메인 윈도우 표시 예산(초)")
+    parser.add_argument("--skip-window", action="store_true", help="윈도우 표시 측정 생략")
+    parser.add_argument("--importtime", type=int, default=0, metavar="N",
+                        help="-X importtime 기준 느린 모듈 N개 출력")
+    args = parser.parse_args()
+
+    ok = measure("import", IMPORT_SNIPPET, args.repeat, args.import_budget)
+    if not args.skip_window:
+        ok = measure("window shown", WINDOW_SNIPPET, args.repeat, args.window_budget) and ok
+    if args.importtime:
+        print_importtime(args.importtime)
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Spotify 매칭 엔진 마이크로 벤치마크
+
+CSV의 곡명/아티스트로 검색 결과와 비슷한 후보 목록(곡당 20개, 원곡 변형 1개 + 다른 곡 19개)을
+만들고, 기존 find_best_match(legacy)와 track_matcher 엔진의 선택 결과와 점수가 완전히 같은지
+검증한 뒤 처리 시간을 비교합니다. 결과가 다르면 종료 코드 1을 반환합니다.
+
+사용법:
+    python benchmarks/bench_track_matcher.py
+    python benchmarks/bench_track_matcher.py --csv SmartGenreTagger_Export_20250619_023405.csv --repeat 5
+"""
+
+import os
+import re
+import sys
+import csv
+import time
+import random
+import argparse
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+import text_normalizer  # noqa: E402
+import track_matcher  # noqa: E402
+
+
+# =============================================================================
+# 기존 구현 (비교 기준)
+# =============================================================================
+
+def legacy_normalize_text(text):
+    if not text:
+        return ""
+    text = text.lower().strip()
+    text = re.sub(r'\s*\((clean|dirty|explicit|radio edit|album version|extended|main)\)\s*', '', text)
+    text = re.sub(r'\s+(clean|dirty|explicit|radio edit|album version|extended|main)\s*', '', text)
+    text = re.split(r'\s+(ft\.?|feat\.?|featuring|with|&|\+)\s+', text)[0].strip()
+    text = re.sub(r'\([^)]*\)|\[[^\]]*\]', '', text).strip()
+    text = re.sub(r'[^\w\s가-힣]', ' ', text)
+    text = re.sub(r'\s+', ' ', text).strip()
+    return text
+
+
+def legacy_calculate_similarity(str1, str2):
+    if not str1 or not str2:
+        return 0.0
+    if str1 == str2:
+        return 1.0
+    if str1 in str2 or str2 in str1:
+        shorter = min(len(str1), len(str2))
+        longer = max(len(str1), len(str2))
+        return max(0.7, shorter / longer)
+    words1 = set(str1.split())
+    words2 = set(str2.split())
+    if not words1 or not words2:
+        return 0.0
+    intersection = len(words1.intersection(words2))
+    union = len(words1.union(words2))
+    jaccard = intersection / union if union > 0 else 0.0
+    partial_score = 0.0
+    for word1 in words1:
+        for word2 in words2:
+            if len(word1) >= 3 and len(word2) >= 3:
+                if word1 in word2 or word2 in word1:
+                    partial_score = max(partial_score, 0.5)
+    return max(jaccard, partial_score)
+
+
+def legacy_find_best_match(tracks, target_title, target_artist):
+    if not tracks:
+        return None
+    target_title_clean = legacy_normalize_text(target_title)
+    target_artist_clean = legacy_normalize_text(target_artist)
+    best_score = 0
+    best_track = None
+    for track in tracks:
+        track_title = legacy_normalize_text(track['name'])
+        track_artists = [legacy_normalize_text(artist['name']) for artist in track['artists']]
+        title_score = legacy_calculate_similarity(target_title_clean, track_title)
+        artist_score = 0
+        for track_artist in track_artists:
+            score = legacy_calculate_similarity(target_artist_clean, track_artist)
+            artist_score = max(artist_score, score)
+        total_score = title_score * 0.6 + artist_score * 0.4
+        if total_score > best_score and total_score > 0.3:
+            best_score = total_score
+            best_track = {
+                'id': track['id'],
+                'name': track['name'],
+                'artists': [artist['name'] for artist in track['artists']],
+                'popularity': track['popularity'],
+                'external_urls': track['external_urls']['spotify'],
+                'similarity_score': total_score
+            }
+    return best_track
+
+
+# =============================================================================
+# 후보 목록 생성
+# =============================================================================
+
+VARIANTS = (
+    lambda t, a: (t, a),
+    lambda t, a: (t.split('(')[0].strip(), a),
+    lambda t, a: (f"{t} - Remix", a),
+    lambda t, a: (t, a.split(' ')[0]),
+    lambda t, a: (t.upper(), f"{a} & Someone"),
+    lambda t, a: (' '.join(t.split()[:2]), a),
+)
+
+
+def make_track(track_id, title, artist):
+    artists = [{'name': name.strip()} for name in re.split(r',| & ', artist) if name.strip()] or [{'name': artist}]
+    return {
+        'id': str(track_id),
+        'name': title,
+        'artists': artists,
+        'popularity': track_id % 100,
+        'external_urls': {'spotify': f"https://open.spotify.com/track/{track_id:022d}"},
+    }
+
+
+def load_queries(csv_path, candidates, seed):
+    """(곡명, 아티스트, 후보 목록) 목록"""
+    with open(csv_path, newline='', encoding='utf-8-sig') as f:
+        songs = [(r.get('제목', '') or '', r.get('아티스트', '') or '') for r in csv.DictReader(f)]
+    songs = [(t, a) for t, a in songs if t and a]
+    rng = random.Random(seed)
+    queries = []
+    for i, (title, artist) in enumerate(songs):
+        tracks = [make_track(rng.randrange(10 ** 6), *rng.choice(songs)) for _ in range(candidates - 1)]
+        variant = rng.choice(VARIANTS)(title, artist)
+        tracks.insert(rng.randrange(candidates), make_track(i, *variant))
+        queries.append((title, artist, tracks))
+    return queries
+
+
+def clear_memo():
+    """엔진의 메모 캐시 비우기 (콜드 측정용)"""
+    for func in (text_normalizer.match_text, track_matcher.prepare, track_matcher.prepare_raw):
+        func.cache_clear()
+
+
+def time_function(func, queries, repeat, before=None):
+    best = float('inf')
+    for _ in range(repeat):
+        if before:
+            before()
+        start = time.perf_counter()
+        for title, artist, tracks in queries:
+            func(tracks, title, artist)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Spotify 매칭 엔진 마이크로 벤치마크")
+    parser.add_argument("--csv", default=os.path.join(PROJECT_ROOT, "result.csv"), help="입력 CSV 경로")
+    parser.add_argument("--candidates", type=int, default=20, help="곡당 후보 수 (Spotify 검색 limit)")
+    parser.add_argument("--repeat", type=int, default=3, help="반복 횟수 (최솟값 사용)")
+    parser.add_argument("--seed", type=int, default=0, help="후보 생성 시드")
+    args = parser.parse_args()
+
+    queries = load_queries(args.csv, args.candidates, args.seed)
+    matcher = track_matcher.TrackMatcher()
+
+    def engine(tracks, title, artist):
+        # 엔진은 artist_ids를 추가로 반환하므로 기존 결과와 같은 항목만 비교
+        result = matcher.best_match(tracks, title, artist)
+        if result:
+            result = {k: v for k, v in result.items() if k != 'artist_ids'}
+        return result
+
+    print(f"입력: {os.path.basename(args.csv)} ({len(queries)}곡 × 후보 {args.candidates}개)\n")
+
+    mismatches = [(t, a, tracks) for t, a, tracks in queries
+                  if legacy_find_best_match(tracks, t, a) != engine(tracks, t, a)]
+    found = sum(1 for t, a, tracks in queries if engine(tracks, t, a))
+
+    legacy_time = time_function(legacy_find_best_match, queries, args.repeat)
+    cold_time = time_function(engine, queries, args.repeat, before=clear_memo)
+    warm_time = time_function(engine, queries, args.repeat)
+
+    print(f"{'scorer':<16}{'time':>12}{'songs/s':>12}{'speedup':>10}")
+    for name, elapsed in (("legacy", legacy_time), ("engine (cold)", cold_time), ("engine (warm)", warm_time)):
+        print(f"{name:<16}{elapsed * 1000:>10.1f}ms{len(queries) / elapsed:>12.0f}{legacy_time / elapsed:>9.1f}x")
+
+    print(f"\n매칭된 곡: {found}/{len(queries)}")
+    print(f"parity: {'OK' if not mismatches else f'FAIL ({len(mismatches)})'}")
+    for title, artist, tracks in mismatches[:3]:
+        print(f"    {title} - {artist}: {legacy_find_best_match(tracks, title, artist)} != {engine(tracks, title, artist)}")
+    return 0 if not mismatches else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
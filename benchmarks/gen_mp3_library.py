@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+합성 MP3 라이브러리 생성기 (음원 없이 스캔/태그 I/O 측정용)
+
+짧은 무음 MPEG-1 Layer III 프레임 몇 개에 다양한 ID3 태그를 붙인 작은 MP3 파일을 만듭니다.
+    - ID3 버전: v2.3 / v2.4 / v2.3 + v1 트레일러 / 태그 없음
+    - 텍스트 인코딩: Latin-1, UTF-16(BOM), UTF-16BE·UTF-8(v2.4만)
+    - 태그 뒤 패딩: 0 / 256 / 1024 / 4096바이트 (패딩이 부족하면 저장 시 파일 전체를 다시 씀)
+곡명/아티스트/연도/장르는 번들 CSV에서 순서대로 가져오며(한글 포함), 같은 seed면 같은 파일이 만들어집니다.
+외부 패키지가 필요 없습니다.
+
+사용법:
+    python benchmarks/gen_mp3_library.py /tmp/mp3lib --count 10000
+    python benchmarks/gen_mp3_library.py /tmp/mp3lib --count 1000 --frames 40 --seed 7
+"""
+
+import os
+import sys
+import csv
+import random
+import struct
+import argparse
+from typing import Dict, Iterator, List, Optional
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_CSV = os.path.join(PROJECT_ROOT, "SmartGenreTagger_Export_20250619_023405.csv")
+
+# MPEG-1 Layer III, 128kbps, 44.1kHz, 보호 비트 없음, 조인트 스테레오
+FRAME_HEADER = b"\xff\xfb\x90\x44"
+FRAME_SIZE = 144 * 128000 // 44100      # 417바이트 (패딩 비트 없음)
+FRAME_SAMPLES = 1152
+SAMPLE_RATE = 44100
+
+# (ID3 주 버전 또는 None, v1 트레일러 여부)
+TAG_LAYOUTS = [(3, False), (4, False), (3, True), (None, False)]
+PADDINGS = [0, 256, 1024, 4096]
+# 인코딩 바이트 → (파이썬 코덱, 지원 ID3 버전)
+ENCODINGS = {
+    0: ("latin-1", (3, 4)),
+    1: ("utf-16", (3, 4)),
+    2: ("utf-16-be", (4,)),
+    3: ("utf-8", (4,)),
+}
+
+
+def syncsafe(value: int) -> bytes:
+    """ID3v2 syncsafe 정수 (바이트마다 7비트)"""
+    return bytes(((value >> shift) & 0x7F) for shift in (21, 14, 7, 0))
+
+
+def mpeg_audio(frames: int) -> bytes:
+    """무음 MPEG 프레임 frames개 (사이드 정보와 메인 데이터가 0이라 그대로 디코딩 가능)"""
+    frame = FRAME_HEADER + bytes(FRAME_SIZE - len(FRAME_HEADER))
+    return frame * frames
+
+
+def text_frame(frame_id: str, text: str, version: int, encoding: int) -> bytes:
+    codec, versions = ENCODINGS[encoding]
+    if version not in versions:
+        encoding, codec = 1, "utf-16"
+    try:
+        payload = bytes([encoding]) + text.encode(codec)
+    except UnicodeEncodeError:
+        # Latin-1로 표현할 수 없는 제목(한글 등)은 UTF-16으로
+        payload = b"\x01" + text.encode("utf-16")
+    size = syncsafe(len(payload)) if version == 4 else struct.pack(">I", len(payload))
+    return frame_id.encode("ascii") + size + b"\x00\x00" + payload
+
+
+def id3v2_tag(fields: Dict[str, str], version: int, encoding: int, padding: int) -> bytes:
+    year_frame = "TDRC" if version == 4 else "TYER"
+    frames = b"".join(
+        text_frame(frame_id, fields[key], version, encoding)
+        for frame_id, key in (("TIT2", "title"), ("TPE1", "artist"), ("TALB", "album"),
+                              ("TCON", "genre"), (year_frame, "year"))
+        if fields.get(key))
+    body = frames + bytes(padding)
+    return b"ID3" + bytes([version, 0, 0]) + syncsafe(len(body)) + body
+
+
+def id3v1_tag(fields: Dict[str, str]) -> bytes:
+    def field(value: str, size: int) -> bytes:
+        return value.encode("latin-1", "replace")[:size].ljust(size, b"\x00")
+    return (b"TAG" + field(fields.get("title", ""), 30) + field(fields.get("artist", ""), 30)
+            + field(fields.get("album", ""), 30) + field(fields.get("year", ""), 4)
+            + bytes(30) + b"\xff")
+
+
+def mp3_bytes(fields: Dict[str, str], version: Optional[int], v1: bool, encoding: int,
+              padding: int, frames: int) -> bytes:
+    data = id3v2_tag(fields, version, encoding, padding) if version else b""
+    data += mpeg_audio(frames)
+    if v1:
+        data += id3v1_tag(fields)
+    return data
+
+
+def load_track_fields(csv_path: str) -> List[Dict[str, str]]:
+    """CSV의 곡명/아티스트/연도/장르 (없으면 합성 값)"""
+    rows = []
+    if csv_path and os.path.isfile(csv_path):
+        with open(csv_path, newline="", encoding="utf-8-sig") as f:
+            for row in csv.DictReader(f):
+                title, artist = row.get("제목", "").strip(), row.get("아티스트", "").strip()
+                if title and artist:
+                    rows.append({
+                        "title": title,
+                        "artist": artist,
+                        "year": row.get("연도", "").strip().split(".")[0],
+                        "genre": row.get("장르", "").strip(),
+                    })
+    return rows or [{"title": f"Track {i}", "artist": f"Artist {i % 97}", "year": str(1990 + i % 35),
+                     "genre": "Hip Hop"} for i in range(1000)]
+
+
+def iter_library(count: int, frames: int = 10, seed: int = 42,
+                 csv_path: str = DEFAULT_CSV) -> Iterator[tuple]:
+    """(파일명, 내용) count개 생성"""
+    rng = random.Random(seed)
+    tracks = load_track_fields(csv_path)
+    width = len(str(max(count - 1, 0)))
+    for i in range(count):
+        fields = dict(tracks[i % len(tracks)], album=f"Synthetic Album {i % 500}")
+        version, v1 = rng.choice(TAG_LAYOUTS)
+        encoding = rng.choice(list(ENCODINGS))
+        padding = rng.choice(PADDINGS)
+        # 일부는 연도/장르가 없는 곡 (연도 채움, 장르 추천 경로)
+        if rng.random() < 0.2:
+            fields["year"] = ""
+        if rng.random() < 0.2:
+            fields["genre"] = ""
+        yield f"{i:0{width}d}.mp3", mp3_bytes(fields, version, v1, encoding, padding, frames)
+
+
+def generate_library(folder: str, count: int, frames: int = 10, seed: int = 42,
+                     csv_path: str = DEFAULT_CSV) -> int:
+    """folder에 MP3 count개 생성, 쓴 전체 바이트 수 반환"""
+    os.makedirs(folder, exist_ok=True)
+    total = 0
+    for name, data in iter_library(count, frames, seed, csv_path):
+        with open(os.path.join(folder, name), "wb") as f:
+            f.write(data)
+        total += len(data)
+    return total
+
+
+def duration_seconds(frames: int) -> float:
+    return frames * FRAME_SAMPLES / SAMPLE_RATE
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="합성 MP3 라이브러리 생성")
+    parser.add_argument("folder", help="생성할 폴더")
+    parser.add_argument("-n", "--count", type=int, default=1000, help="파일 수 (기본 1000)")
+    parser.add_argument("--frames", type=int, default=10,
+                        help="파일당 MPEG 프레임 수 (기본 10 = 약 0.26초, 4KB)")
+    parser.add_argument("--csv", default=DEFAULT_CSV, help="곡 정보를 가져올 CSV")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    total = generate_library(args.folder, args.count, args.frames, args.seed, args.csv)
+    print(f"{args.count}개 파일 생성: {args.folder} ({total / 1024 / 1024:.1f}MB, "
+          f"곡당 {duration_seconds(args.frames):.2f}초)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,58 +1,102 @@
 import os
-import sys
+import threading
 import logging
-from dotenv import load_dotenv
-from PySide6.QtWidgets import QApplication, QMessageBox
+from typing import Dict, List, NamedTuple, Optional
 
 # eyed3 로그 레벨 설정 (경고 메시지 숨기기)
 logging.getLogger("eyed3").setLevel(logging.ERROR)
 
-# 환경변수 로드
-load_dotenv()
+
+class MissingCredential(NamedTuple):
+    """누락된 인증 정보 (구조화된 설정 오류 항목)"""
+    key: str
+    description: str
+    required: bool
+
+    @property
+    def message(self) -> str:
+        return f"{self.key} 환경변수가 설정되지 않았습니다. ({self.description})"
+
+
+class ConfigError(Exception):
+    """필수 인증 정보가 누락되었을 때 발생하는 오류"""
+
+    def __init__(self, missing: List[MissingCredential]):
+        self.missing = list(missing)
+        super().__init__("\n".join(m.message for m in self.missing))
+
 
 class Config:
-    """애플리케이션 설정 관리 클래스"""
-    
-    def __init__(self):
-        self.spotify_client_id = self._get_spotify_client_id() if os.getenv('SPOTIFY_CLIENT_ID') else None
-        self.spotify_client_secret = self._get_spotify_client_secret() if os.getenv('SPOTIFY_CLIENT_SECRET') else None
-        self.openai_api_key = self._get_openai_api_key()
-        self.discogs_token = self._get_discogs_token()
-        
-    def _get_spotify_client_id(self):
-        """Spotify Client ID를 환경변수에서 가져오기"""
-        client_id = os.getenv('SPOTIFY_CLIENT_ID')
-        if not client_id:
-            app = QApplication(sys.argv)
-            QMessageBox.critical(None, "오류", "SPOTIFY_CLIENT_ID 환경변수가 설정되지 않았습니다.\n.env 파일을 확인해주세요.")
-            sys.exit()
-        return client_id
-    
-    def _get_spotify_client_secret(self):
-        """Spotify Client Secret을 환경변수에서 가져오기"""
-        client_secret = os.getenv('SPOTIFY_CLIENT_SECRET')
-        if not client_secret:
-            app = QApplication(sys.argv)
-            QMessageBox.critical(None, "오류", "SPOTIFY_CLIENT_SECRET 환경변수가 설정되지 않았습니다.\n.env 파일을 확인해주세요.")
-            sys.exit()
-        return client_secret
-        
-    def _get_openai_api_key(self):
-        """OpenAI API 키를 환경변수에서 가져오기 (필수)"""
-        api_key = os.getenv('OPENAI_API_KEY')
-        if not api_key:
-            app = QApplication(sys.argv)
-            QMessageBox.critical(None, "오류", "OPENAI_API_KEY 환경변수가 설정되지 않았습니다.\n.env 파일을 확인해주세요.")
-            sys.exit()
-        return api_key
-
-    def _get_discogs_token(self):
-        token = os.getenv('DISCOGS_TOKEN')
-        if not token:
-            app = QApplication(sys.argv)
-            QMessageBox.critical(None, "오류", "DISCOGS_TOKEN 환경변수가 설정되지 않았습니다.\n.env 파일을 확인해주세요.")
-            sys.exit()
-        return token
-
-# 전역 설정 인스턴스
-config = Config() 
\ No newline at end of file
+    """애플리케이션 설정 관리 클래스
+
+    import 시점에는 아무 것도 검증하지 않는다. .env는 값에 처음 접근할 때 한 번만 로드하고,
+    누락된 키는 missing_credentials()/validate()로 호출자가 필요할 때 확인한다.
+    (GUI 대화상자나 sys.exit 없이 서브프로세스, 헤드리스 환경에서도 안전하게 import 가능)
+    """
+
+    # 환경변수 키 → (용도, 필수 여부)
+    CREDENTIALS = {
+        'OPENAI_API_KEY': ("OpenAI GPT 장르 추천", True),
+        'DISCOGS_TOKEN': ("Discogs 장르 검색", True),
+        'SPOTIFY_CLIENT_ID': ("Spotify 검색", False),
+        'SPOTIFY_CLIENT_SECRET': ("Spotify 검색", False),
+    }
+
+    def __init__(self, env: Optional[Dict[str, str]] = None):
+        # env를 지정하면 .env/os.environ 대신 해당 값만 사용 (워커 프로세스, 벤치마크용)
+        self._env = env
+        self._env_loaded = env is not None
+        self._lock = threading.Lock()
+
+    def _load_env(self):
+        """.env 파일을 한 번만 로드"""
+        if self._env_loaded:
+            return
+        with self._lock:
+            if not self._env_loaded:
+                from dotenv import load_dotenv
+                load_dotenv()
+                self._env_loaded = True
+
+    def get(self, key: str, default: Optional[str] = None) -> Optional[str]:
+        """설정 값 조회 (빈 문자열은 누락으로 취급)"""
+        self._load_env()
+        source = self._env if self._env is not None else os.environ
+        return source.get(key) or default
+
+    @property
+    def spotify_client_id(self) -> Optional[str]:
+        return self.get('SPOTIFY_CLIENT_ID')
+
+    @property
+    def spotify_client_secret(self) -> Optional[str]:
+        return self.get('SPOTIFY_CLIENT_SECRET')
+
+    @property
+    def openai_api_key(self) -> Optional[str]:
+        return self.get('OPENAI_API_KEY')
+
+    @property
+    def discogs_token(self) -> Optional[str]:
+        return self.get('DISCOGS_TOKEN')
+
+    def missing_credentials(self, keys: Optional[List[str]] = None) -> List[MissingCredential]:
+        """누락된 인증 정보 목록 반환 (keys를 생략하면 필수 키 전체 검사)"""
+        if keys is None:
+            keys = [key for key, (_, required) in self.CREDENTIALS.items() if required]
+        missing = []
+        for key in keys:
+            if not self.get(key):
+                description, required = self.CREDENTIALS.get(key, ("", True))
+                missing.append(MissingCredential(key, description, required))
+        return missing
+
+    def validate(self, keys: Optional[List[str]] = None):
+        """누락된 인증 정보가 있으면 ConfigError 발생"""
+        missing = self.missing_credentials(keys)
+        if missing:
+            raise ConfigError(missing)
+
+
+# 전역 설정 인스턴스 (생성 시 검증하지 않음)
+config = Config()
@@ -0,0 +1,243 @@
+"""
+곡 목록 내보내기 엔진
+GUI 스레드에서 곡 정보를 타입이 정해진 행으로 한 번에 스냅샷한 뒤, 백그라운드에서 CSV, Parquet,
+Arrow IPC 파일로 기록한다. 연도와 Spotify 인기도는 정수 컬럼으로 저장한다. ('2021.0' 같은 값 없음)
+Arrow IPC(.arrow/.feather, 비압축) 파일은 load_table()에서 메모리 매핑으로 복사 없이 읽을 수 있다.
+ChangeTracker는 편집/저장/장르 추천으로 바뀐 행에 버전을 매겨, 마지막 내보내기 이후 바뀐 행만
+변경 로그(JSONL/CSV)로 내보낼 수 있게 한다.
+pyarrow는 Parquet/Arrow 형식을 쓸 때만 필요하다.
+"""
+
+import os
+import csv
+import json
+import threading
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional
+
+# (컬럼명, 타입) - CSV 헤더는 기존 내보내기와 같음
+EXPORT_COLUMNS = (
+    ('파일경로', 'string'),
+    ('파일명', 'string'),
+    ('제목', 'string'),
+    ('아티스트', 'string'),
+    ('연도', 'int32'),
+    ('장르', 'string'),
+    ('추천장르', 'string'),
+    ('Spotify_인기도', 'int32'),
+    ('Spotify_URL', 'string'),
+)
+COLUMN_NAMES = [name for name, _ in EXPORT_COLUMNS]
+
+# 변경 로그 행 = 내보내기 행 + 변경 종류/버전
+DELTA_COLUMNS = EXPORT_COLUMNS + (
+    ('변경종류', 'string'),
+    ('변경버전', 'int64'),
+)
+DELTA_COLUMN_NAMES = [name for name, _ in DELTA_COLUMNS]
+
+# 변경 종류
+CHANGE_EDIT = 'edit'            # 연도/추천 장르 직접 편집
+CHANGE_RECOMMEND = 'recommend'  # 장르 추천 결과 반영
+CHANGE_SAVE = 'save'            # 파일 태그 저장
+CHANGE_CLEAR = 'clear'          # 추천 장르 초기화
+
+# 확장자 → 형식
+EXPORT_FORMATS = {
+    '.csv': 'csv',
+    '.parquet': 'parquet',
+    '.arrow': 'arrow',
+    '.feather': 'arrow',
+    '.jsonl': 'jsonl',
+}
+
+
+class ExportError(Exception):
+    """내보내기 실패 (지원하지 않는 형식, pyarrow 미설치 등)"""
+
+
+def parse_int(value) -> Optional[int]:
+    """정수 컬럼 값 변환 ('2021', '2021.0', '2021 ✓', 2021.0 → 2021 / 빈 값, 숫자 아님 → None)"""
+    if value is None or value == '':
+        return None
+    if isinstance(value, (int, float)):
+        return int(value) if value == value else None  # NaN 제외
+    text = str(value).replace(' ✓', '').strip()
+    try:
+        return int(float(text)) if text else None
+    except ValueError:
+        return None
+
+
+def track_rows(mp3_data: Iterable[Dict], spotify_lookup: Optional[Callable] = None) -> List[Dict]:
+    """곡 정보를 내보내기용 행으로 스냅샷 (GUI 스레드에서 호출, 이후 원본이 바뀌어도 영향 없음)"""
+    rows = []
+    for data in mp3_data:
+        title = data.get('title', '') or ''
+        artist = data.get('artist', '') or ''
+        spotify = (spotify_lookup(title, artist) if spotify_lookup else None) or {}
+        rows.append({
+            '파일경로': data.get('path', '') or '',
+            '파일명': data.get('filename', '') or '',
+            '제목': title,
+            '아티스트': artist,
+            '연도': parse_int(data.get('year')),
+            '장르': data.get('genre', '') or '',
+            '추천장르': data.get('genre_suggestion', '') or '',
+            'Spotify_인기도': parse_int(spotify.get('popularity')),
+            'Spotify_URL': spotify.get('url', '') or '',
+        })
+    return rows
+
+
+def format_for_path(path: str) -> str:
+    fmt = EXPORT_FORMATS.get(os.path.splitext(path)[1].lower())
+    if not fmt:
+        raise ExportError(f"지원하지 않는 형식입니다: {path}\n(.csv, .parquet, .arrow, .feather, .jsonl)")
+    return fmt
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow
+        return pyarrow
+    except ImportError:
+        raise ExportError("Parquet/Arrow 형식에는 pyarrow가 필요합니다.\npip install pyarrow")
+
+
+def to_arrow_table(rows: List[Dict], columns=EXPORT_COLUMNS):
+    """행 목록 → 컬럼별 타입이 지정된 pyarrow.Table"""
+    pa = _import_pyarrow()
+    arrays = [pa.array([row[name] for row in rows], type=getattr(pa, kind)())
+              for name, kind in columns]
+    return pa.Table.from_arrays(arrays, names=[name for name, _ in columns])
+
+
+def _write_csv(rows: List[Dict], path: str, columns=EXPORT_COLUMNS):
+    names = [name for name, _ in columns]
+    with open(path, 'w', newline='', encoding='utf-8-sig') as f:
+        writer = csv.writer(f)
+        writer.writerow(names)
+        writer.writerows([['' if row[name] is None else row[name] for name in names] for row in rows])
+
+
+def _write_jsonl(rows: List[Dict], path: str, columns=EXPORT_COLUMNS):
+    names = [name for name, _ in columns]
+    with open(path, 'w', encoding='utf-8') as f:
+        f.writelines(json.dumps({name: row[name] for name in names}, ensure_ascii=False) + '\n'
+                     for row in rows)
+
+
+def _write_parquet(rows: List[Dict], path: str, columns=EXPORT_COLUMNS):
+    _import_pyarrow()
+    import pyarrow.parquet as pq
+    pq.write_table(to_arrow_table(rows, columns), path)
+
+
+def _write_arrow(rows: List[Dict], path: str, columns=EXPORT_COLUMNS):
+    pa = _import_pyarrow()
+    table = to_arrow_table(rows, columns)
+    # 비압축 IPC 파일: 읽을 때 메모리 매핑으로 복사 없이 사용 가능
+    with pa.OSFile(path, 'wb') as sink, pa.ipc.new_file(sink, table.schema) as writer:
+        writer.write_table(table)
+
+
+_WRITERS = {
+    'csv': _write_csv,
+    'jsonl': _write_jsonl,
+    'parquet': _write_parquet,
+    'arrow': _write_arrow,
+}
+
+
+def write_rows(rows: List[Dict], path: str, fmt: Optional[str] = None, columns=EXPORT_COLUMNS) -> int:
+    """행 목록을 파일로 기록 (백그라운드 스레드에서 호출 가능), 기록한 행 수 반환
+
+    임시 파일에 쓴 뒤 교체하므로 실패해도 기존 파일은 그대로 남는다.
+    """
+    fmt = fmt or format_for_path(path)
+    tmp_path = f"{path}.tmp"
+    try:
+        _WRITERS[fmt](rows, tmp_path, columns)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return len(rows)
+
+
+def write_delta(rows: List[Dict], path: str, fmt: Optional[str] = None) -> int:
+    """변경 로그 기록 (delta_rows() 결과), 기록한 행 수 반환"""
+    return write_rows(rows, path, fmt, DELTA_COLUMNS)
+
+
+class Change(NamedTuple):
+    version: int
+    kind: str
+
+
+class ChangeTracker:
+    """행(파일 경로)별 변경 버전 기록
+
+    변경될 때마다 전역 버전을 1씩 올려 행에 기록하고, 내보내기마다 그 시점의 버전을 남긴다.
+    changed_since(버전)은 그 버전 이후에 바뀐 행만 돌려준다. (스레드 안전)
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._changes: Dict[str, Change] = {}
+        self.version = 0
+        self.last_export = 0
+
+    def reset(self):
+        """새 목록을 불러올 때 기록 초기화 (불러온 직후 상태가 기준)"""
+        with self._lock:
+            self._changes.clear()
+            self.last_export = self.version
+
+    def mark(self, key: str, kind: str = CHANGE_EDIT) -> int:
+        """행 변경 기록, 새 버전 반환"""
+        with self._lock:
+            self.version += 1
+            self._changes[key] = Change(self.version, kind)
+            return self.version
+
+    def changed_since(self, version: Optional[int] = None) -> Dict[str, Change]:
+        """지정 버전(기본: 마지막 내보내기) 이후 바뀐 행 {키: Change}"""
+        with self._lock:
+            since = self.last_export if version is None else version
+            return {key: change for key, change in self._changes.items() if change.version > since}
+
+    def mark_exported(self, version: int):
+        """내보내기 완료 기록 (내보내기 시작 시점의 버전, 이후 변경은 다음 변경분에 포함)"""
+        with self._lock:
+            self.last_export = max(self.last_export, version)
+
+
+def delta_rows(rows: List[Dict], changes: Dict[str, Change]) -> List[Dict]:
+    """track_rows() 결과 중 바뀐 행만 골라 변경 종류/버전을 붙임 (버전 순)"""
+    delta = []
+    for row in rows:
+        change = changes.get(row['파일경로'])
+        if change:
+            delta.append(dict(row, 변경종류=change.kind, 변경버전=change.version))
+    delta.sort(key=lambda row: row['변경버전'])
+    return delta
+
+
+def load_table(path: str):
+    """내보낸 파일을 pyarrow.Table로 로드 (Arrow IPC는 메모리 매핑, 복사 없음)"""
+    pa = _import_pyarrow()
+    fmt = format_for_path(path)
+    if fmt == 'arrow':
+        return pa.ipc.open_file(pa.memory_map(path, 'r')).read_all()
+    if fmt == 'parquet':
+        import pyarrow.parquet as pq
+        return pq.read_table(path, memory_map=True)
+    # 변경 로그 컬럼까지 타입 지정 (없는 컬럼은 무시됨)
+    types = {name: getattr(pa, kind)() for name, kind in DELTA_COLUMNS}
+    if fmt == 'jsonl':
+        import pyarrow.json as pa_json
+        return pa_json.read_json(path, parse_options=pa_json.ParseOptions(
+            explicit_schema=pa.schema(list(types.items())), unexpected_field_behavior='ignore'))
+    import pyarrow.csv as pa_csv
+    return pa_csv.read_csv(path, convert_options=pa_csv.ConvertOptions(column_types=types))
@@ -0,0 +1,220 @@
+"""
+장르 정규화 엔진
+지역/언어/연도/아티스트명 필터와 복합 장르 분해 규칙을 한 번만 컴파일해 두고
+장르 문자열을 한 번의 순회로 처리한다. (music_genre_service의 필터 함수들과 동일한 결과)
+"""
+
+import re
+from functools import lru_cache
+from typing import List, Optional
+
+# 제거할 지역/언어/국가/연도 태그들 (부분 문자열 일치, 대소문자 무관)
+REGIONAL_TERMS = (
+    # 지역 힙합
+    "Southern Hip Hop", "East Coast Hip Hop", "West Coast Hip Hop", "Midwest Hip Hop",
+    # 지역명 단독
+    "Southern", "East Coast", "West Coast", "Midwest",
+    # 언어명
+    "English", "American", "British", "German", "French",
+    "Italian", "Spanish", "Japanese", "Chinese", "Korean",
+    # 국가명
+    "USA", "US", "UK", "Germany", "France", "Italy", "Spain", "Japan", "China",
+    # 연도 관련
+    "2010s", "2000s", "1990s", "90s", "00s", "10s", "20s",
+)
+
+# 지역 태그가 포함되어 있어도 유지하는 장르들
+ALLOWED_EXCEPTIONS = ("uk drill", "k-pop", "k-rap", "latin", "afrobeats", "hardcore")
+
+# 특별 변환 규칙 (하이픈 변환 전에 먼저 처리, 앞쪽 규칙 우선)
+SPECIAL_CONVERSIONS = (
+    ('korean hip hop', 'K-Rap'),
+    ('korean rap', 'K-Rap'),
+    ('k rap', 'K-Rap'),
+    ('k-rap', 'K-Rap'),
+)
+
+# 하이픈 유지 예외 목록 (복합 장르 처리에서도 제외)
+HYPHEN_EXCEPTIONS = frozenset(['k-pop', 'j-pop', 'c-pop', 'k-rap'])
+
+# 의미 없는 태그들
+MEANINGLESS_TAGS = frozenset(['contemporary', 'modern', 'new', 'current', 'recent', 'latest', 'music'])
+
+# 대분류 키워드들 (앞쪽이 우선순위가 높음)
+MAIN_GENRES = ('Hip Hop', 'R&B', 'Rock', 'Pop', 'EDM', 'Electronic', 'Jazz', 'Blues', 'Country', 'Folk')
+
+DEFAULT_GENRE = "Hip Hop"
+MAX_GENRES = 4
+
+
+def _alternation(terms) -> str:
+    """부분 문자열 검색용 alternation 패턴 (긴 용어 우선)"""
+    return '|'.join(re.escape(t) for t in sorted(set(terms), key=len, reverse=True))
+
+
+def _capitalize_match(match) -> str:
+    return match.group(0).capitalize()
+
+
+class GenreNormalizer:
+    """미리 컴파일된 정규식과 조회 테이블로 장르 필터를 적용하는 엔진"""
+
+    def __init__(self):
+        self._regional_re = re.compile(_alternation(t.lower() for t in REGIONAL_TERMS))
+        self._exception_re = re.compile(_alternation(ALLOWED_EXCEPTIONS))
+        self._special_re = re.compile(_alternation(key for key, _ in SPECIAL_CONVERSIONS))
+        # 겹치는 위치까지 모두 찾기 위해 lookahead 사용 → 우선순위가 가장 높은 대분류 선택
+        self._main_re = re.compile('(?=(%s))' % _alternation(m.lower() for m in MAIN_GENRES))
+        self._main_priority = {m.lower(): (i, m) for i, m in enumerate(MAIN_GENRES)}
+        self._decade_re = re.compile(r'(\b(19|20)\d{2}s\b|\b\d{2}s\b|\bdecade\b|\bera\b)', re.IGNORECASE)
+        self._word_re = re.compile(r'\w+')
+
+    # ------------------------------------------------------------------
+    # 개별 판정
+    # ------------------------------------------------------------------
+
+    def is_regional(self, genre: str) -> bool:
+        """지역/언어/국가/연도 태그 여부 (허용 예외 제외)"""
+        genre_lower = genre.lower()
+        return bool(self._regional_re.search(genre_lower)) and not self._exception_re.search(genre_lower)
+
+    def is_decade(self, genre: str) -> bool:
+        """연도/시대 정보 포함 여부"""
+        return bool(self._decade_re.search(genre))
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _artist_terms(artist: str) -> tuple:
+        """아티스트명 전체와 3글자 이상 단어들 (아티스트별 1회 계산)
+        아티스트마다 정규식을 컴파일하는 비용이 검색보다 커서 부분 문자열 비교를 사용한다.
+        빈 아티스트명은 모든 장르와 일치한다 (기존 동작 유지)."""
+        artist_lower = artist.lower()
+        words = artist_lower.replace('.', '').replace('-', ' ').split()
+        return tuple(dict.fromkeys([artist_lower] + [w for w in words if len(w) > 2]))
+
+    def contains_artist(self, genre: str, artist: str) -> bool:
+        """장르명에 아티스트명(혹은 주요 단어)이 포함되어 있는지 여부"""
+        genre_lower = genre.lower()
+        return any(term in genre_lower for term in self._artist_terms(artist))
+
+    # ------------------------------------------------------------------
+    # 장르 리스트/문자열 처리
+    # ------------------------------------------------------------------
+
+    def filter_artist(self, genres: List[str], artist: str) -> List[str]:
+        """장르 리스트에서 아티스트명이 포함된 장르 제거"""
+        terms = self._artist_terms(artist)
+        result = []
+        for g in genres:
+            g_lower = g.lower()
+            if not any(term in g_lower for term in terms):
+                result.append(g)
+        return result
+
+    def filter_decades(self, genres: List[str]) -> List[str]:
+        """연도/시대 관련 장르 제거"""
+        search = self._decade_re.search
+        return [g for g in genres if not search(g)]
+
+    def filter_genre_list(self, genres: List[str], artist: Optional[str] = None) -> List[str]:
+        """연도 필터와 아티스트명 필터를 한 번의 순회로 적용"""
+        decade_search = self._decade_re.search
+        terms = self._artist_terms(artist) if artist is not None else ()
+        result = []
+        for g in genres:
+            if decade_search(g):
+                continue
+            if terms:
+                g_lower = g.lower()
+                if any(term in g_lower for term in terms):
+                    continue
+            result.append(g)
+        return result
+
+    def _filter_regional_tokens(self, genre_result: str) -> List[str]:
+        regional_search = self._regional_re.search
+        exception_search = self._exception_re.search
+        filtered = []
+        for genre in genre_result.split('/'):
+            genre = genre.strip()
+            if not genre:
+                continue
+            genre_lower = genre.lower()
+            if regional_search(genre_lower) and not exception_search(genre_lower):
+                continue
+            filtered.append(genre)
+
+        # 필터링 후 장르가 부족하면 기본 장르 추가
+        if not filtered:
+            filtered = [DEFAULT_GENRE]
+        elif len(filtered) < 2 and DEFAULT_GENRE not in filtered[0]:
+            filtered.insert(0, DEFAULT_GENRE)
+        return filtered[:MAX_GENRES]
+
+    def filter_regional(self, genre_result: str) -> str:
+        """'A / B / C' 형식 결과에서 지역/언어/국가/연도 장르 제거"""
+        return ' / '.join(self._filter_regional_tokens(genre_result))
+
+    def titlecase(self, s: str) -> str:
+        """각 단어의 첫 글자를 대문자로 변경 (구분자 유지)"""
+        return self._word_re.sub(_capitalize_match, s)
+
+    def refine(self, genre_result: str) -> str:
+        """GPT 결과 후처리: 지역 필터 + 대문자 변환을 한 번에 적용 (장르마다 한 번씩만 처리)"""
+        sub = self._word_re.sub
+        return ' / '.join(sub(_capitalize_match, g) for g in self._filter_regional_tokens(genre_result))
+
+    def clean_compound(self, genre_string: str) -> str:
+        """복합 장르에서 수식어만 추출하고 정리 (하이픈 처리 포함, 특별 예외 처리)"""
+        if not genre_string:
+            return genre_string
+
+        processed_genres = []
+        special_genres = []  # 특별 처리된 장르들은 마지막에 추가
+        for genre in genre_string.split('/'):
+            genre = genre.strip()
+            genre_lower = genre.lower().strip()
+            if not genre_lower or genre_lower in MEANINGLESS_TAGS:
+                continue
+
+            if self._special_re.search(genre_lower):
+                special_genres.append(next(value for key, value in SPECIAL_CONVERSIONS if key in genre_lower))
+                continue
+
+            if genre_lower in HYPHEN_EXCEPTIONS:
+                special_genres.append(genre.title())  # K-Pop, J-Pop 등
+            else:
+                processed_genres.append(' '.join(genre.replace('-', ' ').split()))
+
+        cleaned_genres = []
+        main_genre_found = None
+        for genre in processed_genres:
+            matches = self._main_re.findall(genre.lower())
+            if not matches:
+                # 대분류가 포함되지 않은 순수 세부 장르
+                cleaned_genres.append(genre)
+                continue
+            main = min(self._main_priority[m] for m in matches)[1]
+            if not main_genre_found:
+                main_genre_found = main
+                cleaned_genres.append(main)
+            # 복합 장르에서 수식어 추출
+            modifier = genre.replace(main, '').strip()
+            if modifier and modifier.lower() not in MEANINGLESS_TAGS:
+                cleaned_genres.append(modifier)
+
+        cleaned_genres.extend(special_genres)
+
+        # 중복 제거하면서 순서 유지
+        unique_genres = []
+        seen = set()
+        for g in cleaned_genres:
+            g = g.strip()
+            if g and g not in seen and g.lower() not in MEANINGLESS_TAGS:
+                seen.add(g)
+                unique_genres.append(g)
+        return ' / '.join(unique_genres[:MAX_GENRES])
+
+
+# 전역 엔진 인스턴스 (모듈 로드 시 한 번만 컴파일)
+genre_normalizer = GenreNormalizer()
@@ -0,0 +1,346 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+로컬 오디오 특징 기반 장르 예측 (장르 사전 확률)
+MP3를 디코딩해 BPM, 스펙트럼 중심, MFCC 요약(평균/표준편차)을 NumPy만으로 계산하고,
+이미 태깅된 라이브러리(TCON 장르 태그 또는 내보낸 CSV)로 가우시안 나이브 베이즈 분류기를 학습한다.
+MusicGenreService는 예측 확신도가 높으면 원격 검색(MusicBrainz/Discogs/GPT) 없이 이 장르를 쓰고,
+중간 정도면 GPT 정제 입력에 힌트로 추가한다. 모델 파일이 없으면 아무 것도 하지 않는다.
+
+사용법 (학습):
+    python genre_prior.py /music --recursive
+    python genre_prior.py --csv SmartGenreTagger_Export_20250619_023405.csv
+"""
+
+import os
+import re
+import sys
+import csv
+import pickle
+import random
+import logging
+import argparse
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from audio_analysis import decode_file
+from genre_normalizer import genre_normalizer
+
+logger = logging.getLogger(__name__)
+
+GENRE_PRIOR_FILE = ".genre_prior.pkl"
+FEATURE_VERSION = 1
+
+# 특징 추출 설정
+FEATURE_RATE = 22050        # 이 샘플레이트 근처로 줄여서 계산
+SEGMENT_OFFSET = 30.0       # 인트로를 건너뛰고 이 위치부터
+SEGMENT_SECONDS = 30.0      # 이 길이만 분석
+N_FFT = 2048
+HOP_LENGTH = 512
+N_MELS = 40
+N_MFCC = 13
+BPM_RANGE = (60, 200)
+
+# 학습/예측 설정
+MIN_CLASS_SAMPLES = 10      # 이보다 적게 태깅된 장르는 학습에서 제외
+VAR_SMOOTHING = 1e-2
+CONFIDENT_PROBABILITY = 0.9  # 이 이상이면 원격 검색 없이 사용
+HINT_PROBABILITY = 0.6       # 이 이상이면 GPT 정제 입력에 힌트로 추가
+
+
+def _numpy():
+    try:
+        import numpy
+        return numpy
+    except ImportError:
+        raise RuntimeError("로컬 장르 예측에는 numpy가 필요합니다. (pip install numpy)")
+
+
+def primary_genre(tag: str) -> str:
+    """장르 태그의 대표 장르 ('Hip-Hop / R&B' → 'Hip Hop', 'hip  hop' → 'Hip Hop')"""
+    first = re.sub(r'\s+', ' ', (tag or '').split('/')[0]).strip().lower()
+    return genre_normalizer.titlecase(re.sub(r'\bhip[\s\-]*hop\b', 'hip hop', first))
+
+
+def _mel_filterbank(sample_rate: int):
+    """(N_MELS, N_FFT//2+1) 삼각 멜 필터 행렬"""
+    np = _numpy()
+    to_mel = lambda f: 2595 * np.log10(1 + f / 700)
+    to_hz = lambda m: 700 * (10 ** (m / 2595) - 1)
+    hz = to_hz(np.linspace(to_mel(0), to_mel(sample_rate / 2), N_MELS + 2))
+    bins = np.fft.rfftfreq(N_FFT, 1 / sample_rate)
+    lower, center, upper = hz[:-2, None], hz[1:-1, None], hz[2:, None]
+    rising = (bins - lower) / (center - lower)
+    falling = (upper - bins) / (upper - center)
+    return np.maximum(0, np.minimum(rising, falling))
+
+
+def _dct_matrix():
+    """(N_MFCC, N_MELS) DCT-II 행렬"""
+    np = _numpy()
+    n = np.arange(N_MELS)
+    k = np.arange(N_MFCC)[:, None]
+    return np.cos(np.pi / N_MELS * (n + 0.5) * k)
+
+
+def extract_features(samples, sample_rate: int) -> List[float]:
+    """모노 샘플 → [BPM, 스펙트럼 중심 평균/표준편차, MFCC 평균 13개, MFCC 표준편차 13개]"""
+    np = _numpy()
+    # 샘플레이트를 FEATURE_RATE 근처로 줄임 (정수배 평균)
+    factor = max(1, int(sample_rate // FEATURE_RATE))
+    x = np.asarray(samples, dtype=np.float32)
+    x = x[:len(x) // factor * factor].reshape(-1, factor).mean(axis=1)
+    sr = sample_rate / factor
+
+    start = int(SEGMENT_OFFSET * sr) if len(x) > (SEGMENT_OFFSET + SEGMENT_SECONDS) * sr else 0
+    x = x[start:start + int(SEGMENT_SECONDS * sr)]
+    count = 1 + (len(x) - N_FFT) // HOP_LENGTH
+    if count < 2:
+        raise ValueError("분석하기에 너무 짧은 곡입니다.")
+
+    index = np.arange(N_FFT)[None, :] + HOP_LENGTH * np.arange(count)[:, None]
+    spectrum = np.abs(np.fft.rfft(x[index] * np.hanning(N_FFT), axis=1)) ** 2
+
+    freqs = np.fft.rfftfreq(N_FFT, 1 / sr)
+    centroid = (spectrum @ freqs) / (spectrum.sum(axis=1) + 1e-10)
+
+    log_mel = np.log(spectrum @ _mel_filterbank(sr).T + 1e-10)
+    mfcc = log_mel @ _dct_matrix().T
+
+    # BPM: 멜 대역 에너지 증가량(온셋 강도)의 자기상관이 가장 큰 주기
+    onset = np.maximum(np.diff(log_mel, axis=0), 0).sum(axis=1)
+    onset -= onset.mean()
+    autocorr = np.fft.irfft(np.abs(np.fft.rfft(onset, 2 * len(onset))) ** 2)[:len(onset)]
+    frame_rate = sr / HOP_LENGTH
+    min_lag = max(1, int(60 * frame_rate / BPM_RANGE[1]))
+    max_lag = min(len(autocorr) - 1, int(60 * frame_rate / BPM_RANGE[0]))
+    bpm = 0.0
+    if max_lag > min_lag:
+        lag = min_lag + int(np.argmax(autocorr[min_lag:max_lag + 1]))
+        bpm = 60 * frame_rate / lag
+
+    return [float(bpm), float(centroid.mean()), float(centroid.std()),
+            *mfcc.mean(axis=0).tolist(), *mfcc.std(axis=0).tolist()]
+
+
+def track_features(path: str, data: Optional[bytes] = None) -> List[float]:
+    """MP3 파일의 특징 벡터"""
+    samples, sample_rate = decode_file(path, data)
+    return extract_features(samples, sample_rate)
+
+
+class GenrePrior:
+    """특징 벡터 → 장르 확률 (가우시안 나이브 베이즈, 첫 사용 시 모델 파일 로드)"""
+
+    def __init__(self, model_file: str = GENRE_PRIOR_FILE):
+        self.model_file = model_file
+        self.lock = threading.Lock()
+        self._model: Optional[Dict] = None
+        self._loaded = False
+
+    def _ensure_loaded(self) -> Optional[Dict]:
+        if not self._loaded:
+            with self.lock:
+                if not self._loaded:
+                    self._model = self._load_model()
+                    self._loaded = True
+        return self._model
+
+    def _load_model(self) -> Optional[Dict]:
+        try:
+            with open(self.model_file, "rb") as f:
+                model = pickle.load(f)
+        except Exception:
+            return None
+        if model.get('feature_version') != FEATURE_VERSION:
+            logger.warning("[장르 예측] 특징 버전이 달라 모델을 사용하지 않습니다: %s", self.model_file)
+            return None
+        logger.info("[장르 예측] 모델 로드: %s (%s개 장르)", self.model_file, len(model['classes']))
+        return model
+
+    def available(self) -> bool:
+        """학습된 모델이 있고 numpy를 쓸 수 있는지"""
+        if self._ensure_loaded() is None:
+            return False
+        try:
+            _numpy()
+            return True
+        except RuntimeError:
+            return False
+
+    def fit(self, features: List[List[float]], genres: List[str]) -> Dict:
+        """특징 벡터와 장르 태그로 학습 (샘플이 적은 장르 제외), 모델 반환"""
+        np = _numpy()
+        labels = [primary_genre(g) for g in genres]
+        counts: Dict[str, int] = {}
+        for label in labels:
+            counts[label] = counts.get(label, 0) + 1
+        classes = sorted(label for label, n in counts.items() if label and n >= MIN_CLASS_SAMPLES)
+        if len(classes) < 2:
+            raise ValueError(f"학습할 장르가 부족합니다. (장르별 {MIN_CLASS_SAMPLES}곡 이상 필요)")
+
+        keep = [i for i, label in enumerate(labels) if label in classes]
+        X = np.asarray([features[i] for i in keep], dtype=np.float64)
+        y = np.asarray([classes.index(labels[i]) for i in keep])
+
+        mean = X.mean(axis=0)
+        scale = X.std(axis=0) + 1e-9
+        Z = (X - mean) / scale
+        self._model = {
+            'feature_version': FEATURE_VERSION,
+            'classes': classes,
+            'mean': mean,
+            'scale': scale,
+            'class_mean': np.stack([Z[y == c].mean(axis=0) for c in range(len(classes))]),
+            'class_var': np.stack([Z[y == c].var(axis=0) + VAR_SMOOTHING for c in range(len(classes))]),
+            'log_prior': np.log(np.bincount(y, minlength=len(classes)) / len(y)),
+        }
+        self._loaded = True
+        return self._model
+
+    def predict_proba(self, features: List[float]) -> List[Tuple[str, float]]:
+        """[(장르, 확률)] 확률 높은 순"""
+        model = self._ensure_loaded()
+        if model is None:
+            return []
+        np = _numpy()
+        z = (np.asarray(features, dtype=np.float64) - model['mean']) / model['scale']
+        var = model['class_var']
+        log_likelihood = -0.5 * (np.log(2 * np.pi * var) + (z - model['class_mean']) ** 2 / var).sum(axis=1)
+        log_posterior = log_likelihood + model['log_prior']
+        probs = np.exp(log_posterior - log_posterior.max())
+        probs /= probs.sum()
+        order = np.argsort(-probs)
+        return [(model['classes'][i], float(probs[i])) for i in order]
+
+    def predict(self, features: List[float]) -> Optional[Tuple[str, float]]:
+        """가장 가능성 높은 (장르, 확률), 모델이 없으면 None"""
+        ranked = self.predict_proba(features)
+        return ranked[0] if ranked else None
+
+    def features_for(self, path: str) -> List[float]:
+        """라이브러리 인덱스에 저장된 특징 사용, 없으면 계산 후 저장"""
+        from library_index import library_index
+        record = library_index.get(path) or {}
+        stored = record.get('features')
+        if stored and stored.get('version') == FEATURE_VERSION:
+            return stored['values']
+        values = track_features(path)
+        library_index.update(path, features={'version': FEATURE_VERSION, 'values': values})
+        return values
+
+    def predict_file(self, path: str) -> Optional[Tuple[str, float]]:
+        if not self.available():
+            return None
+        return self.predict(self.features_for(path))
+
+    def save(self):
+        with self.lock:
+            tmp_file = f"{self.model_file}.tmp"
+            with open(tmp_file, "wb") as f:
+                pickle.dump(self._model, f)
+            os.replace(tmp_file, self.model_file)
+        logger.info("[장르 예측] 모델 저장: %s", self.model_file)
+
+
+# 전역 장르 예측 인스턴스
+genre_prior = GenrePrior()
+
+
+# =============================================================================
+# 학습 CLI
+# =============================================================================
+
+def _tagged_tracks(folder: Optional[str], recursive: bool, csv_path: Optional[str]) -> Iterable[Tuple[str, str]]:
+    """(파일 경로, 장르 태그) - CSV가 있으면 파일경로/장르 컬럼, 없으면 폴더의 TCON 태그"""
+    if csv_path:
+        with open(csv_path, newline='', encoding='utf-8-sig') as f:
+            for row in csv.DictReader(f):
+                if row.get('장르') and os.path.exists(row.get('파일경로', '')):
+                    yield row['파일경로'], row['장르']
+        return
+    from audio_manager import AudioFileProcessor
+    from library_index import library_index
+    for path in AudioFileProcessor.iter_mp3_files(folder, recursive=recursive):
+        record = library_index.load_metadata(path, AudioFileProcessor.extract_metadata)
+        if record and record.get('genre'):
+            yield path, record['genre']
+
+
+def _holdout_report(prior: GenrePrior, features: List[List[float]], genres: List[str]):
+    """20% 검증 세트에서 확신 구간의 정확도와 적용 비율 출력"""
+    order = list(range(len(features)))
+    random.Random(0).shuffle(order)
+    split = len(order) // 5
+    test, train = order[:split], order[split:]
+    prior.fit([features[i] for i in train], [genres[i] for i in train])
+    classes = set(prior._model['classes'])
+    confident = correct = evaluated = 0
+    for i in test:
+        label = primary_genre(genres[i])
+        if label not in classes:
+            continue
+        evaluated += 1
+        genre, probability = prior.predict(features[i])
+        if probability >= CONFIDENT_PROBABILITY:
+            confident += 1
+            correct += genre == label
+    if evaluated:
+        accuracy = f"{correct / confident:.1%}" if confident else "-"
+        print(f"검증: {evaluated}곡 중 {confident}곡({confident / evaluated:.1%})이 확신 구간, 정확도 {accuracy}",
+              file=sys.stderr)
+
+
+def main(argv: Optional[list] = None) -> int:
+    from batch_common import EXIT_OK, EXIT_USAGE, ordered_map
+    from library_index import library_index
+
+    parser = argparse.ArgumentParser(description="태깅된 라이브러리로 로컬 장르 예측 모델 학습")
+    parser.add_argument("folder", nargs="?", help="장르 태그가 있는 MP3 폴더")
+    parser.add_argument("-r", "--recursive", action="store_true", help="하위 폴더까지 스캔")
+    parser.add_argument("--csv", help="파일경로/장르 컬럼이 있는 내보내기 CSV (폴더 대신 사용)")
+    parser.add_argument("-w", "--workers", type=int, default=os.cpu_count() or 2, help="특징 추출 동시 작업 수")
+    parser.add_argument("-o", "--output", default=GENRE_PRIOR_FILE, help="모델 파일 경로")
+    args = parser.parse_args(argv)
+
+    if not args.folder and not args.csv:
+        parser.error("폴더 또는 --csv 중 하나가 필요합니다.")
+    if args.folder and not os.path.isdir(args.folder):
+        print(f"오류: 폴더를 찾을 수 없습니다: {args.folder}", file=sys.stderr)
+        return EXIT_USAGE
+
+    prior = GenrePrior(args.output)
+    tracks = list(_tagged_tracks(args.folder, args.recursive, args.csv))
+    print(f"태깅된 곡 {len(tracks)}개에서 특징 추출 중...", file=sys.stderr)
+
+    def features_or_none(track):
+        path, genre = track
+        # 인덱스에 없던 곡(CSV 입력)도 특징을 저장할 수 있도록 메타데이터 먼저 등록
+        if library_index.get(path) is None:
+            from audio_manager import AudioFileProcessor
+            library_index.load_metadata(path, AudioFileProcessor.extract_metadata)
+        try:
+            return prior.features_for(path), genre
+        except Exception as e:
+            print(f"특징 추출 실패 {os.path.basename(path)}: {e}", file=sys.stderr)
+            return None
+
+    samples = [result for result in ordered_map(features_or_none, tracks, max(1, args.workers)) if result]
+    library_index.save()
+    features = [f for f, _ in samples]
+    genres = [g for _, g in samples]
+
+    try:
+        _holdout_report(prior, features, genres)
+        model = prior.fit(features, genres)
+    except ValueError as e:
+        print(f"오류: {e}", file=sys.stderr)
+        return EXIT_USAGE
+    prior.save()
+    print(f"학습 완료: {len(features)}곡, 장르 {len(model['classes'])}개 ({', '.join(model['classes'])})",
+          file=sys.stderr)
+    return EXIT_OK
+
+
+if __name__ == "__main__":
+    sys.exit(main())
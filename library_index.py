@@ -0,0 +1,120 @@
+"""
+라이브러리 메타데이터 인덱스
+스캔할 때 추출한 곡 정보(재생 길이 포함)를 파일 크기/수정 시각과 함께 pickle 파일로 보관해,
+바뀌지 않은 파일은 다음 스캔에서 태그를 다시 읽지 않는다.
+태그를 저장하면 수정 시각이 바뀌므로 다음 스캔에서 자동으로 다시 추출된다.
+곡 분석 결과(audio_analysis) 같은 추가 정보도 같은 항목에 저장한다.
+"""
+
+import os
+import pickle
+import logging
+import threading
+from typing import Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+LIBRARY_INDEX_FILE = ".library_index.pkl"
+
+
+def _file_signature(path: str) -> Optional[Tuple[int, int]]:
+    """(크기, 수정 시각 ns) - 파일이 없으면 None"""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_size, stat.st_mtime_ns
+
+
+class LibraryIndex:
+    """경로 → (파일 서명, 메타데이터) 인덱스 (스레드 안전, 첫 사용 시 파일 로드)"""
+
+    def __init__(self, index_file: str = LIBRARY_INDEX_FILE, autosave_every: int = 50):
+        self.index_file = index_file
+        self.autosave_every = autosave_every
+        self.lock = threading.Lock()
+        self._entries: Optional[Dict[str, Tuple[Tuple[int, int], Dict]]] = None
+        self._dirty = 0
+        self.hits = 0
+        self.misses = 0
+
+    def _ensure_loaded(self) -> Dict:
+        if self._entries is None:
+            with self.lock:
+                if self._entries is None:
+                    self._entries = self._load_index()
+        return self._entries
+
+    def _load_index(self) -> Dict:
+        try:
+            with open(self.index_file, "rb") as f:
+                entries = pickle.load(f)
+            logger.info("[라이브러리 인덱스] 파일에서 로드: %s (%s곡)", self.index_file, len(entries))
+            return entries
+        except Exception:
+            logger.info("[라이브러리 인덱스] 새 인덱스 생성: %s", self.index_file)
+            return {}
+
+    def get(self, path: str) -> Optional[Dict]:
+        """파일이 바뀌지 않았으면 저장된 메타데이터 사본, 아니면 None"""
+        entry = self._ensure_loaded().get(path)
+        if entry is None or entry[0] != _file_signature(path):
+            return None
+        return dict(entry[1])
+
+    def put(self, path: str, record: Dict):
+        signature = _file_signature(path)
+        if signature is None:
+            return
+        entries = self._ensure_loaded()
+        with self.lock:
+            entries[path] = (signature, dict(record))
+            self._dirty += 1
+
+    def update(self, path: str, **fields):
+        """저장된 항목의 일부 필드만 갱신 (항목이 없거나 파일이 바뀌었으면 무시)
+
+        백그라운드 분석처럼 스캔 이후에 채워지는 정보용이며, autosave_every건마다 파일로 저장한다.
+        """
+        entries = self._ensure_loaded()
+        signature = _file_signature(path)
+        with self.lock:
+            entry = entries.get(path)
+            if entry is None or entry[0] != signature:
+                return
+            entries[path] = (signature, {**entry[1], **fields})
+            self._dirty += 1
+            autosave = self.autosave_every and self._dirty >= self.autosave_every
+        if autosave:
+            self.save()
+
+    def load_metadata(self, path: str, extract: Callable[[str], Optional[Dict]]) -> Optional[Dict]:
+        """인덱스에 있으면 그대로, 없거나 파일이 바뀌었으면 extract(path)로 추출 후 저장"""
+        record = self.get(path)
+        if record is not None:
+            self.hits += 1
+            return record
+        self.misses += 1
+        record = extract(path)
+        if record is not None:
+            self.put(path, record)
+        return record
+
+    def save(self):
+        """변경이 있으면 임시 파일에 쓴 뒤 교체 (중단되어도 기존 인덱스 보존)"""
+        if not self._dirty:
+            return
+        with self.lock:
+            tmp_file = f"{self.index_file}.tmp"
+            try:
+                with open(tmp_file, "wb") as f:
+                    pickle.dump(self._entries, f)
+                os.replace(tmp_file, self.index_file)
+                self._dirty = 0
+                logger.info("[라이브러리 인덱스] 저장 완료: %s (%s곡)", self.index_file, len(self._entries))
+            except Exception as e:
+                logger.error("[라이브러리 인덱스] 저장 실패: %s", e)
+
+
+# 전역 라이브러리 인덱스 인스턴스
+library_index = LibraryIndex()
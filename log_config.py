@@ -0,0 +1,116 @@
+"""
+로그 설정
+각 모듈은 logging.getLogger(__name__)으로 로그를 남기고, 실제 출력은 루트 로거의 QueueHandler가
+큐에 넣은 레코드를 백그라운드 QueueListener 스레드가 표준 에러로 쓴다. 작업 스레드는 큐에 넣기만 하므로
+출력 락을 두고 서로 기다리지 않는다.
+메시지는 logger.debug("... %s", 값) 형식이라 레벨이 꺼져 있으면 레벨 비교 한 번으로 끝나고 문자열도 만들지 않는다.
+
+레벨 지정 형식: "기본레벨,모듈=레벨,..." 예) "INFO,music_genre_service=DEBUG,audio_manager=WARNING"
+환경변수 SMARTGENRETAGGER_LOG 또는 CLI --log-level로 지정하며, 지정하지 않으면
+GUI는 INFO, 일괄 처리(CLI)는 WARNING(조용한 모드)이 기본이다.
+"""
+
+import os
+import sys
+import queue
+import atexit
+import logging
+import logging.handlers
+import threading
+from typing import Dict, Optional, TextIO, Tuple
+
+LOG_ENV = "SMARTGENRETAGGER_LOG"
+LOG_FORMAT = "%(asctime)s %(levelname)-7s %(name)s: %(message)s"
+LOG_DATE_FORMAT = "%H:%M:%S"
+
+GUI_LEVEL = logging.INFO
+BULK_LEVEL = logging.WARNING  # 일괄 처리 기본: 경고 이상만 출력
+
+# 외부 라이브러리 기본 레벨 (요청마다 남기는 로그 숨기기)
+LIBRARY_LEVELS = {
+    'eyed3': logging.ERROR,
+    'musicbrainzngs': logging.WARNING,
+    'discogs_client': logging.WARNING,
+    'openai': logging.WARNING,
+    'httpx': logging.WARNING,
+    'urllib3': logging.WARNING,
+    'spotipy': logging.WARNING,
+}
+
+_lock = threading.Lock()
+_listener: Optional[logging.handlers.QueueListener] = None
+_queue_handler: Optional[logging.handlers.QueueHandler] = None
+
+
+def parse_level(name: str) -> int:
+    """'debug', 'INFO', '20' → 로깅 레벨 값"""
+    name = name.strip().upper()
+    if name.isdigit():
+        return int(name)
+    level = logging.getLevelName(name)
+    if not isinstance(level, int):
+        raise ValueError(f"알 수 없는 로그 레벨: {name}")
+    return level
+
+
+def parse_levels(spec: Optional[str]) -> Tuple[Optional[int], Dict[str, int]]:
+    """"INFO,music_genre_service=DEBUG" → (기본 레벨 또는 None, {모듈: 레벨})"""
+    default = None
+    modules: Dict[str, int] = {}
+    for part in (spec or "").split(","):
+        part = part.strip()
+        if not part:
+            continue
+        name, sep, level = part.rpartition("=")
+        if sep:
+            modules[name.strip()] = parse_level(level)
+        else:
+            default = parse_level(level)
+    return default, modules
+
+
+def setup_logging(level: int = GUI_LEVEL, spec: Optional[str] = None,
+                  stream: Optional[TextIO] = None) -> logging.handlers.QueueListener:
+    """루트 로거에 큐 핸들러와 출력 스레드 설치 (다시 호출하면 레벨만 다시 적용)
+
+    level: 기본 레벨, spec: 레벨 지정 문자열 (없으면 환경변수 SMARTGENRETAGGER_LOG) - spec이 level보다 우선
+    """
+    global _listener, _queue_handler
+    default, modules = parse_levels(os.environ.get(LOG_ENV) if spec is None else spec)
+    root = logging.getLogger()
+    root.setLevel(level if default is None else default)
+    for name, library_level in LIBRARY_LEVELS.items():
+        logging.getLogger(name).setLevel(library_level)
+    for name, module_level in modules.items():
+        logging.getLogger(name).setLevel(module_level)
+
+    with _lock:
+        if _listener is None:
+            handler = logging.StreamHandler(stream or sys.stderr)
+            handler.setFormatter(logging.Formatter(LOG_FORMAT, LOG_DATE_FORMAT))
+            log_queue = queue.SimpleQueue()
+            _queue_handler = logging.handlers.QueueHandler(log_queue)
+            root.addHandler(_queue_handler)
+            _listener = logging.handlers.QueueListener(log_queue, handler, respect_handler_level=True)
+            _listener.start()
+            atexit.register(shutdown_logging)
+        return _listener
+
+
+def shutdown_logging():
+    """큐에 남은 로그를 모두 출력하고 출력 스레드 종료"""
+    global _listener, _queue_handler
+    with _lock:
+        listener, handler = _listener, _queue_handler
+        _listener = _queue_handler = None
+    if handler is not None:
+        logging.getLogger().removeHandler(handler)
+    if listener is not None:
+        listener.stop()
+
+
+def bulk_level(verbose: int = 0, quiet: bool = False) -> int:
+    """CLI 옵션 → 기본 레벨 (-q: ERROR, 기본: WARNING, -v: INFO, -vv: DEBUG)"""
+    if quiet:
+        return logging.ERROR
+    return (BULK_LEVEL, logging.INFO, logging.DEBUG)[min(verbose, 2)]
@@ -5,21 +5,61 @@ SmartGenreTagger - AI 기반 MP3 장르 태그 편집기
 """
 
 import sys
-from PySide6.QtWidgets import QApplication
+import logging
+import importlib
+import threading
+from PySide6.QtWidgets import QApplication, QMessageBox
+from PySide6.QtCore import QTimer
+from config import config
+from log_config import GUI_LEVEL, setup_logging
 from main_window import SmartGenreTaggerMainWindow
 
+# 창이 뜬 뒤 백그라운드에서 미리 로드할 무거운 모듈들 (첫 사용 시 지연 방지)
+DEFERRED_MODULES = ("eyed3", "mutagen.id3", "musicbrainzngs", "discogs_client", "openai", "pygame")
+
+
+def preload_deferred_modules():
+    """지연 로드 대상 모듈을 미리 import (실패해도 실제 사용 시점에 다시 시도됨)"""
+    for name in DEFERRED_MODULES:
+        try:
+            importlib.import_module(name)
+        except Exception:
+            pass
+
+
+def warn_missing_credentials(window):
+    """누락된 API 키 안내 (앱은 계속 사용 가능, 장르 추천 시 다시 확인)"""
+    missing = config.missing_credentials()
+    if missing:
+        details = "\n".join(f"• {m.message}" for m in missing)
+        QMessageBox.warning(window, "설정 확인", f"{details}\n\n.env 파일을 확인해주세요.\n태그 편집과 재생은 계속 사용할 수 있습니다.")
+
 
 def main():
     """애플리케이션 메인 함수"""
+    # 로그는 백그라운드 스레드에서 출력 (레벨: 환경변수 SMARTGENRETAGGER_LOG, 기본 INFO)
+    try:
+        setup_logging(GUI_LEVEL)
+    except ValueError as e:
+        setup_logging(GUI_LEVEL, spec="")
+        logging.getLogger(__name__).warning("로그 레벨 설정 무시: %s", e)
+
     app = QApplication(sys.argv)
-    
+
     # 메인 윈도우 생성 및 표시
     window = SmartGenreTaggerMainWindow()
     window.show()
-    
+
+    # 설정 검증은 창이 뜬 뒤에 수행 (import 시점에 막지 않음)
+    QTimer.singleShot(0, lambda: warn_missing_credentials(window))
+
+    # 첫 화면이 그려진 다음 무거운 모듈 예열
+    QTimer.singleShot(0, lambda: threading.Thread(
+        target=preload_deferred_modules, name="module-preloader", daemon=True).start())
+
     # 애플리케이션 실행
     sys.exit(app.exec())
 
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    main()
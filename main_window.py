@@ -1,16 +1,33 @@
 import os
-import csv
+import logging
 from datetime import datetime
 from PySide6.QtWidgets import (QMainWindow, QVBoxLayout, QHBoxLayout, QWidget, QMessageBox, 
                                QFileDialog, QApplication, QLabel, QMenu, QProgressDialog, QPushButton)
 from PySide6.QtCore import QTimer, Qt
 from concurrent.futures import ThreadPoolExecutor, as_completed
-import asyncio
 
 from ui_components import (EditableTreeWidget, ControlButtonsWidget, 
                           AudioControlWidget, InlineEditor)
 from audio_manager import AudioFileProcessor, AudioPlayer
-from music_genre_service import music_genre_service, clean_title
+from config import config
+from music_genre_service import music_genre_service, clean_title, get_musicbrainz
+from library_index import library_index
+from audio_prefetch import PREFETCH_AHEAD
+from audio_analysis import analyze_file, needs_analysis
+from profiling import profiler
+from exporter import (format_for_path, track_rows, write_rows, write_delta, delta_rows, ChangeTracker,
+                      CHANGE_EDIT, CHANGE_RECOMMEND, CHANGE_SAVE, CHANGE_CLEAR)
+
+logger = logging.getLogger(__name__)
+
+# 백그라운드 내보내기 완료 확인 주기
+EXPORT_POLL_MS = 100
+
+# 훅 분석 완료 확인 주기
+ANALYSIS_POLL_MS = 100
+
+# 재생 중 시크바 갱신 주기 (표시는 초 단위가 바뀔 때만 갱신)
+SEEKBAR_INTERVAL_MS = 250
 
 
 class SmartGenreTaggerMainWindow(QMainWindow):
@@ -49,13 +66,26 @@ class SmartGenreTaggerMainWindow(QMainWindow):
         # 편집 관련
         self.inline_editor = None
         
+        # 파일 내보내기 (한 번에 하나씩 백그라운드에서 기록)
+        self.export_executor = ThreadPoolExecutor(max_workers=1)
+        self.export_future = None
+        self.export_profile = None  # 내보내기 프로파일 (파일 쓰기가 끝날 때 저장)
+        
+        # 편집/저장/추천으로 바뀐 행 기록 (변경분 내보내기용)
+        self.changes = ChangeTracker()
+        
         # UI 구성
         self.setup_ui()
         
-        # 타이머 설정 (시크바 업데이트용)
+        # 타이머 설정 (시크바 업데이트용, 재생 중에만 동작)
         self.timer = QTimer()
+        self.timer.setInterval(SEEKBAR_INTERVAL_MS)
         self.timer.timeout.connect(self.update_seekbar)
-        self.timer.start(500)  # 500ms마다 업데이트 (성능 최적화)
+        self._shown_second = None  # 마지막으로 표시한 재생 위치(초)
+        
+        # 곡 분석 (훅 위치/음량) - 선택한 곡 주변을 백그라운드에서 한 곡씩 분석
+        self.analysis_executor = ThreadPoolExecutor(max_workers=1)
+        self.analysis_pending = {}
     
     def setup_ui(self):
         """UI 설정"""
@@ -74,6 +104,9 @@ class SmartGenreTaggerMainWindow(QMainWindow):
         self.control_buttons.save_selected_requested.connect(self.save_selected_items)
         self.control_buttons.save_all_requested.connect(self.save_all_changes)
         self.control_buttons.csv_export_requested.connect(self.export_to_csv)
+        self.control_buttons.delta_export_requested.connect(self.export_changes)
+        self.control_buttons.profile_toggled.connect(self.toggle_profiling)
+        self.control_buttons.set_profile_checked(profiler.enabled)
         main_layout.addWidget(self.control_buttons)
         
         # 트리 위젯
@@ -82,6 +115,7 @@ class SmartGenreTaggerMainWindow(QMainWindow):
         self.tree.gpt_edit_requested.connect(self.edit_genre_suggestion)
         self.tree.copy_requested.connect(self.copy_to_clipboard)
         self.tree.context_menu_requested.connect(self.show_copy_context_menu)
+        self.tree.currentItemChanged.connect(self.prefetch_around_selection)
         main_layout.addWidget(self.tree)
         
         # 페이징 컨트롤
@@ -106,6 +140,7 @@ class SmartGenreTaggerMainWindow(QMainWindow):
         self.audio_control.seek_started.connect(self.on_seekbar_press)
         self.audio_control.seek_finished.connect(self.on_seekbar_release)
         self.audio_control.copy_filename_requested.connect(self.copy_current_filename)
+        self.audio_control.hook_jump_requested.connect(self.jump_to_hook)
         main_layout.addWidget(self.audio_control)
         
         # 상태바
@@ -131,10 +166,28 @@ class SmartGenreTaggerMainWindow(QMainWindow):
                 QMessageBox.information(self, "알림", "선택한 폴더에 MP3 파일이 없습니다.")
                 self.status_label.setText("총 0개의 MP3 파일")
     
+    def toggle_profiling(self, enabled):
+        """프로파일 켜기/끄기 (폴더: 환경변수 SMARTGENRETAGGER_PROFILE 또는 ./profiles)"""
+        try:
+            if enabled:
+                output_dir = profiler.enable()
+                self.status_label.setText(f"⏱️ 프로파일 켜짐 - 동작마다 저장: {output_dir}")
+            else:
+                profiler.disable()
+                self.status_label.setText("⏱️ 프로파일 꺼짐")
+        except OSError as e:
+            self.control_buttons.set_profile_checked(profiler.enabled)
+            QMessageBox.warning(self, "경고", f"프로파일 폴더를 만들 수 없습니다:\n{str(e)}")
+            return
+        QTimer.singleShot(3000, self.update_status)
+    
+    @profiler.profiled("load")
     def load_all_files(self):
         """모든 파일 로드 (페이징 적용, None 체크)"""
         self.tree.clear()
         self.mp3_data.clear()
+        self.changes.reset()
+        self.audio_player.prefetcher.clear()
         total_files = len(self.file_list)
         if total_files == 0:
             return
@@ -149,20 +202,22 @@ class SmartGenreTaggerMainWindow(QMainWindow):
         try:
             for i, file_path in enumerate(self.file_list):
                 if progress.wasCanceled():
-                    print("파일 로딩이 사용자에 의해 취소되었습니다.")
+                    logger.info("파일 로딩이 사용자에 의해 취소되었습니다.")
                     break
                 progress.setLabelText(f"MP3 파일을 로드하는 중... ({i+1}/{total_files})")
                 progress.setValue(i)
                 QApplication.processEvents()
-                data = AudioFileProcessor.extract_metadata(file_path)
+                # 바뀌지 않은 파일은 인덱스에 저장된 메타데이터(재생 길이 포함) 사용
+                data = library_index.load_metadata(file_path, AudioFileProcessor.extract_metadata)
                 if data is not None:
                     self.mp3_data.append(data)
             progress.setValue(total_files)
         except Exception as e:
-            print(f"파일 로딩 중 오류 발생: {e}")
+            logger.error("파일 로딩 중 오류 발생: %s", e)
             QMessageBox.critical(self, "오류", f"파일 로딩 중 오류가 발생했습니다:\n{str(e)}")
         finally:
             progress.close()
+            library_index.save()
             loaded_count = len(self.mp3_data)
             if loaded_count > 0:
                 self.show_page(0)
@@ -230,7 +285,7 @@ class SmartGenreTaggerMainWindow(QMainWindow):
             
             # 데이터 업데이트
             data = self.mp3_data[data_index]
-            print(f"Debug: 편집 완료 - 파일: {data['filename']}, 입력값: '{new_value}', 원본: '{data['original_year']}'")
+            logger.debug("편집 완료 - 파일: %s, 입력값: '%s', 원본: '%s'", data['filename'], new_value, data['original_year'])
             
             # 연도 변경 감지 및 표시 설정
             if new_value and new_value.isdigit():
@@ -243,24 +298,25 @@ class SmartGenreTaggerMainWindow(QMainWindow):
                 if not data['original_year'] or new_value != data['original_year']:
                     data['year_added'] = True
                     data['year'] = new_value + " ✓"  # 수정/추가된 연도에 체크 표시
-                    print(f"Debug: 연도 수정/추가됨 - {data['year']}")
+                    logger.debug("연도 수정/추가됨 - %s", data['year'])
                 else:
                     data['year_added'] = False
                     data['year'] = new_value
-                    print(f"Debug: 연도 동일함 - {data['year']}")
+                    logger.debug("연도 동일함 - %s", data['year'])
             elif new_value and not new_value.isdigit():
                 QMessageBox.critical(self, "입력 오류", "연도는 4자리 숫자만 입력 가능합니다.\n예: 2023")
                 return
             else:
                 data['year_added'] = False
                 data['year'] = new_value
-                print(f"Debug: 연도 비어있음 - {data['year']}")
+                logger.debug("연도 비어있음 - %s", data['year'])
             
             # 트리 아이템 업데이트
             item.setText(2, data['year'])
+            self.changes.mark(data['path'], CHANGE_EDIT)
             
         except Exception as e:
-            print(f"Error in finish_year_edit: {e}")
+            logger.error("Error in finish_year_edit: %s", e)
     
     def finish_genre_edit(self, data_index, item):
         """장르 추천 편집 완료 (strip 적용)"""
@@ -271,14 +327,37 @@ class SmartGenreTaggerMainWindow(QMainWindow):
             self.inline_editor.finish_current_edit()
             self.mp3_data[data_index]['genre_suggestion'] = new_value
             item.setText(4, new_value)
+            self.changes.mark(self.mp3_data[data_index]['path'], CHANGE_EDIT)
         except Exception as e:
-            print(f"Error in finish_genre_edit: {e}")
+            logger.error("Error in finish_genre_edit: %s", e)
+    
+    def set_genre_suggestion(self, data_index, suggestion):
+        """추천 결과를 행에 반영 (워커에 넘긴 연도가 바뀌기 전에 호출)
+        장르 캐시에 없는 추천은 로컬 예측 추정이므로 표시해 두고, 그대로 저장해도 확정 장르로 캐시하지 않는다."""
+        data = self.mp3_data[data_index]
+        data['genre_suggestion'] = suggestion
+        if music_genre_service.has_cached_genre(data.get('title', 'Unknown'), data.get('artist', 'Unknown'), data.get('year', '')):
+            data.pop('unconfirmed_suggestion', None)
+        else:
+            data['unconfirmed_suggestion'] = suggestion
+    
+    def check_credentials(self):
+        """장르 추천에 필요한 API 키 확인 (누락 시 안내 후 False)"""
+        missing = config.missing_credentials()
+        if missing:
+            details = "\n".join(f"• {m.message}" for m in missing)
+            QMessageBox.critical(self, "설정 오류", f"장르 추천에 필요한 API 키가 없습니다.\n\n{details}\n\n.env 파일을 확인해주세요.")
+            return False
+        return True
     
+    @profiler.profiled("recommend_all")
     def get_all_genre_suggestions(self):
         """모든 파일에 대해 장르 추천 (3개 병렬, 캐시 활용, UI는 트리 순서대로, 중간 저장, 연도 자동 채움, 디버깅 로그 추가)"""
         if not self.mp3_data:
             QMessageBox.information(self, "알림", "먼저 MP3 파일을 로드해주세요.")
             return
+        if not self.check_credentials():
+            return
         self.genre_stop_requested = False
         music_genre_service.set_stop_flag(False)  # 서비스 중지 플래그 초기화
         self.control_buttons.set_gpt_buttons_enabled(False)
@@ -297,7 +376,7 @@ class SmartGenreTaggerMainWindow(QMainWindow):
         def recommend_worker(i, data_index, data):
             """개선된 워커 - 실시간 진행 상황 포함"""
             if self.genre_stop_requested or music_genre_service.is_stop_requested():
-                print(f"[DEBUG] 중지 요청 감지: 워커 {i} 즉시 종료")
+                logger.debug("중지 요청 감지: 워커 %s 즉시 종료", i)
                 return i, data_index, "중지됨", ""
             
             title = data.get('title', 'Unknown')
@@ -306,18 +385,19 @@ class SmartGenreTaggerMainWindow(QMainWindow):
             original_genre = data.get('genre', '')
             
             # 현재 처리 중인 곡 정보 출력 (실시간)
-            print(f"🎵 [{i+1:3d}] 처리 중: {title} - {artist}")
+            logger.debug("🎵 [%3d] 처리 중: %s - %s", i+1, title, artist)
             
-            suggestion, year_value = music_genre_service.get_genre_recommendation(title, artist, year, original_genre)
+            suggestion, year_value = music_genre_service.get_genre_recommendation(
+                title, artist, year, original_genre, data.get('path'))
             
             if suggestion == "중지됨" or self.genre_stop_requested:
-                print(f"[DEBUG] 워커 {i} 중지됨")
+                logger.debug("워커 %s 중지됨", i)
                 return i, data_index, "중지됨", ""
             
             # 연도 추출 로직 (기존과 동일)
             if not year_value and not self.genre_stop_requested:
                 try:
-                    import musicbrainzngs
+                    musicbrainzngs = get_musicbrainz()
                     title_for_search = clean_title(title)
                     query = f'recording:"{title_for_search}" AND artist:"{artist}"'
                     result = musicbrainzngs.search_recordings(query=query, limit=1)
@@ -331,7 +411,6 @@ class SmartGenreTaggerMainWindow(QMainWindow):
             
             return i, data_index, suggestion, year_value
         try:
-            from musicbrainzngs import musicbrainz
             with ThreadPoolExecutor(max_workers=3) as executor:
                 futures = []
                 for i in range(total_files):
@@ -345,7 +424,7 @@ class SmartGenreTaggerMainWindow(QMainWindow):
                     # 매 곡마다 취소 상태 체크 (UI 응답성 보장)
                     QApplication.processEvents()
                     if self.genre_stop_requested or progress.wasCanceled():
-                        print("장르 추천이 사용자에 의해 중지되었습니다.")
+                        logger.info("장르 추천이 사용자에 의해 중지되었습니다.")
                         self.genre_stop_requested = True
                         music_genre_service.set_stop_flag(True)
                         # 모든 미완료 future들을 강제 취소 시도
@@ -354,7 +433,7 @@ class SmartGenreTaggerMainWindow(QMainWindow):
                             if not f.done():
                                 if f.cancel():
                                     cancelled_count += 1
-                        print(f"[DEBUG] {cancelled_count}개 작업 취소 시도")
+                        logger.debug("%s개 작업 취소 시도", cancelled_count)
                         # executor를 강제 종료
                         try:
                             executor.shutdown(wait=False)
@@ -385,15 +464,16 @@ class SmartGenreTaggerMainWindow(QMainWindow):
                             # 디버깅 로그 간소화 (오류 발생시에만 출력)
                             actual_data_index = self.get_data_index_from_item(item)
                             if data_index != actual_data_index:
-                                print(f"⚠️  데이터 인덱스 불일치: {data_index} != {actual_data_index} ({self.mp3_data[data_index]['title']})")
-                            self.mp3_data[data_index]['genre_suggestion'] = suggestion
+                                logger.warning("⚠️  데이터 인덱스 불일치: %s != %s (%s)", data_index, actual_data_index, self.mp3_data[data_index]['title'])
+                            self.set_genre_suggestion(data_index, suggestion)
                             item.setText(4, suggestion)
+                            self.changes.mark(self.mp3_data[data_index]['path'], CHANGE_RECOMMEND)
                             # 연도 정보가 비어있고 새로 추출된 연도가 있으면 체크 표시와 함께 반영
                             if (not self.mp3_data[data_index]['year'] or self.mp3_data[data_index]['year'].strip() == '') and year_value and year_value.isdigit() and len(year_value) == 4:
                                 self.mp3_data[data_index]['year'] = year_value + ' ✓'
                                 self.mp3_data[data_index]['year_added'] = True
                                 item.setText(2, self.mp3_data[data_index]['year'])
-                                print(f"연도 자동 채움: {self.mp3_data[data_index]['filename']} -> {self.mp3_data[data_index]['year']}")
+                                logger.debug("연도 자동 채움: %s -> %s", self.mp3_data[data_index]['filename'], self.mp3_data[data_index]['year'])
             progress.setValue(total_files)
         finally:
             # 중지 플래그 초기화
@@ -410,12 +490,15 @@ class SmartGenreTaggerMainWindow(QMainWindow):
             else:
                 QMessageBox.information(self, "완료", f"총 {done_count}개 파일의 장르 추천이 완료되었습니다.")
     
+    @profiler.profiled("recommend_selected")
     def get_selected_genre_suggestions(self):
         """선택된 파일들에 대해 장르 추천 (3개 병렬, 캐시 활용, UI는 트리 순서대로, 중간 저장, 연도 자동 채움, 디버깅 로그 추가)"""
         selected_items = self.tree.selectedItems()
         if not selected_items:
             QMessageBox.information(self, "알림", "추천받을 항목을 선택해주세요.")
             return
+        if not self.check_credentials():
+            return
         
         self.genre_stop_requested = False
         music_genre_service.set_stop_flag(False)  # 서비스 중지 플래그 초기화
@@ -438,7 +521,7 @@ class SmartGenreTaggerMainWindow(QMainWindow):
         def recommend_worker(i, data_index, data):
             """개선된 워커 - 실시간 진행 상황 포함"""
             if self.genre_stop_requested or music_genre_service.is_stop_requested():
-                print(f"[DEBUG] 중지 요청 감지: 워커 {i} 즉시 종료")
+                logger.debug("중지 요청 감지: 워커 %s 즉시 종료", i)
                 return i, data_index, "중지됨", ""
             
             title = data.get('title', 'Unknown')
@@ -447,18 +530,19 @@ class SmartGenreTaggerMainWindow(QMainWindow):
             original_genre = data.get('genre', '')
             
             # 현재 처리 중인 곡 정보 출력 (실시간)
-            print(f"🎵 [{i+1:3d}] 처리 중: {title} - {artist}")
+            logger.debug("🎵 [%3d] 처리 중: %s - %s", i+1, title, artist)
             
-            suggestion, year_value = music_genre_service.get_genre_recommendation(title, artist, year, original_genre)
+            suggestion, year_value = music_genre_service.get_genre_recommendation(
+                title, artist, year, original_genre, data.get('path'))
             
             if suggestion == "중지됨" or self.genre_stop_requested:
-                print(f"[DEBUG] 워커 {i} 중지됨")
+                logger.debug("워커 %s 중지됨", i)
                 return i, data_index, "중지됨", ""
             
             # 연도 추출 로직 (기존과 동일)
             if not year_value and not self.genre_stop_requested:
                 try:
-                    import musicbrainzngs
+                    musicbrainzngs = get_musicbrainz()
                     title_for_search = clean_title(title)
                     query = f'recording:"{title_for_search}" AND artist:"{artist}"'
                     result = musicbrainzngs.search_recordings(query=query, limit=1)
@@ -473,7 +557,6 @@ class SmartGenreTaggerMainWindow(QMainWindow):
             return i, data_index, suggestion, year_value
         
         try:
-            from musicbrainzngs import musicbrainz
             with ThreadPoolExecutor(max_workers=3) as executor:
                 futures = []
                 for i, item in enumerate(selected_items):
@@ -486,7 +569,7 @@ class SmartGenreTaggerMainWindow(QMainWindow):
                     # 매 곡마다 취소 상태 체크 (UI 응답성 보장)
                     QApplication.processEvents()
                     if self.genre_stop_requested or progress.wasCanceled():
-                        print("장르 추천이 사용자에 의해 중지되었습니다.")
+                        logger.info("장르 추천이 사용자에 의해 중지되었습니다.")
                         self.genre_stop_requested = True
                         music_genre_service.set_stop_flag(True)
                         # 모든 미완료 future들을 강제 취소 시도  
@@ -495,7 +578,7 @@ class SmartGenreTaggerMainWindow(QMainWindow):
                             if not f.done():
                                 if f.cancel():
                                     cancelled_count += 1
-                        print(f"[DEBUG] {cancelled_count}개 작업 취소 시도")
+                        logger.debug("%s개 작업 취소 시도", cancelled_count)
                         # executor를 강제 종료
                         try:
                             executor.shutdown(wait=False)
@@ -523,15 +606,16 @@ class SmartGenreTaggerMainWindow(QMainWindow):
                             # 디버깅 로그 간소화 (오류 발생시에만 출력)
                             actual_data_index = self.get_data_index_from_item(item)
                             if data_index != actual_data_index:
-                                print(f"⚠️  데이터 인덱스 불일치: {data_index} != {actual_data_index} ({self.mp3_data[data_index]['title']})")
-                            self.mp3_data[data_index]['genre_suggestion'] = suggestion
+                                logger.warning("⚠️  데이터 인덱스 불일치: %s != %s (%s)", data_index, actual_data_index, self.mp3_data[data_index]['title'])
+                            self.set_genre_suggestion(data_index, suggestion)
                             item.setText(4, suggestion)
+                            self.changes.mark(self.mp3_data[data_index]['path'], CHANGE_RECOMMEND)
                             # 연도 정보가 비어있고 새로 추출된 연도가 있으면 체크 표시와 함께 반영
                             if (not self.mp3_data[data_index]['year'] or self.mp3_data[data_index]['year'].strip() == '') and year_value and year_value.isdigit() and len(year_value) == 4:
                                 self.mp3_data[data_index]['year'] = year_value + ' ✓'
                                 self.mp3_data[data_index]['year_added'] = True
                                 item.setText(2, self.mp3_data[data_index]['year'])
-                                print(f"연도 자동 채움: {self.mp3_data[data_index]['filename']} -> {self.mp3_data[data_index]['year']}")
+                                logger.debug("연도 자동 채움: %s -> %s", self.mp3_data[data_index]['filename'], self.mp3_data[data_index]['year'])
             progress.setValue(total_selected)
         finally:
             # 중지 플래그 초기화
@@ -555,6 +639,7 @@ class SmartGenreTaggerMainWindow(QMainWindow):
                 return True
         return False
 
+    @profiler.profiled("save_all")
     def save_all_changes(self):
         """모든 변경사항을 저장 (유저 직접 수정시 무조건 저장, 장르 컬럼 즉시 갱신, 캐시 반영)"""
         saved_count = 0
@@ -565,7 +650,7 @@ class SmartGenreTaggerMainWindow(QMainWindow):
         processed_files = 0
         
         # 첫 번째 패스: UI에서 genre_suggestion 값을 데이터에 동기화
-        print(f"💾 전체 저장 시작: {total_files}개 파일 처리")
+        logger.info("💾 전체 저장 시작: %s개 파일 처리", total_files)
         for i, data in enumerate(self.mp3_data):
             item = self.find_tree_item_by_data_index(i)
             if item:
@@ -619,13 +704,15 @@ class SmartGenreTaggerMainWindow(QMainWindow):
                         item.setText(2, clean_year)     # 연도 컬럼 업데이트
                         item.setText(4, "")             # 추천장르 컬럼 비우기
                     
-                    # 캐시 업데이트
-                    music_genre_service.set_cached_genre(data['title'], data['artist'], clean_year, data['genre'])
+                    # 캐시 업데이트 (확인되지 않은 로컬 예측 추정을 그대로 저장한 경우 제외)
+                    if data['genre'] != data.pop('unconfirmed_suggestion', ''):
+                        music_genre_service.set_cached_genre(data['title'], data['artist'], clean_year, data['genre'])
+                    self.changes.mark(data['path'], CHANGE_SAVE)
                     
-                    print(f"💾 저장 완료: {data.get('title', 'Unknown')} -> {data['genre']}")
+                    logger.debug("💾 저장 완료: %s -> %s", data.get('title', 'Unknown'), data['genre'])
                 else:
                     error_count += 1
-                    print(f"❌ 저장 실패: {data.get('title', 'Unknown')}")
+                    logger.error("❌ 저장 실패: %s", data.get('title', 'Unknown'))
             elif year_changed:
                 if AudioFileProcessor.save_metadata(data):
                     saved_count += 1
@@ -634,17 +721,18 @@ class SmartGenreTaggerMainWindow(QMainWindow):
                     data['original_year'] = clean_year
                     if item:
                         item.setText(2, clean_year)
-                    print(f"📅 연도 저장: {data.get('title', 'Unknown')} -> {clean_year}")
+                    self.changes.mark(data['path'], CHANGE_SAVE)
+                    logger.debug("📅 연도 저장: %s -> %s", data.get('title', 'Unknown'), clean_year)
                 else:
                     error_count += 1
-                    print(f"❌ 연도 저장 실패: {data.get('title', 'Unknown')}")
+                    logger.error("❌ 연도 저장 실패: %s", data.get('title', 'Unknown'))
             
             processed_files += 1
             
             # 매 3개 파일마다 UI 업데이트 (더 자주)
             if processed_files % 3 == 0 or processed_files == total_files:
                 progress_percent = int((processed_files / total_files) * 100)
-                print(f"💾 저장 진행률: {processed_files}/{total_files} ({progress_percent}%)")
+                logger.debug("💾 저장 진행률: %s/%s (%s%%)", processed_files, total_files, progress_percent)
                 
                 # UI 즉시 반영
                 QApplication.processEvents()
@@ -654,7 +742,7 @@ class SmartGenreTaggerMainWindow(QMainWindow):
                     self.status_label.setText(f"저장 중... {processed_files}/{total_files} ({progress_percent}%)")
         
         # 저장 완료 후 최종 상태 업데이트
-        print(f"💾 전체 저장 완료: {saved_count}개 저장, {error_count}개 실패")
+        logger.info("💾 전체 저장 완료: %s개 저장, %s개 실패", saved_count, error_count)
         self.update_status()
         QApplication.processEvents()
         
@@ -666,6 +754,7 @@ class SmartGenreTaggerMainWindow(QMainWindow):
         else:
             QMessageBox.information(self, "저장 완료", "저장할 변경사항이 없습니다.")
     
+    @profiler.profiled("save_selected")
     def save_selected_items(self):
         """선택된 항목들 저장 (유저 직접 수정시 무조건 저장, 장르 컬럼 즉시 갱신, 캐시 반영)"""
         selected_items = self.tree.selectedItems()
@@ -678,7 +767,7 @@ class SmartGenreTaggerMainWindow(QMainWindow):
         total_items = len(selected_items)
         processed_items = 0
         
-        print(f"💾 선택 저장 시작: {total_items}개 파일 처리")
+        logger.info("💾 선택 저장 시작: %s개 파일 처리", total_items)
         
         # 첫 번째 패스: UI에서 genre_suggestion 값을 데이터에 동기화
         for i, item in enumerate(selected_items):
@@ -731,13 +820,15 @@ class SmartGenreTaggerMainWindow(QMainWindow):
                         item.setText(2, clean_year)     # 연도 컬럼 업데이트
                         item.setText(4, "")             # 추천장르 컬럼 비우기
                         
-                        # 캐시 업데이트
-                        music_genre_service.set_cached_genre(data['title'], data['artist'], clean_year, data['genre'])
+                        # 캐시 업데이트 (확인되지 않은 로컬 예측 추정을 그대로 저장한 경우 제외)
+                        if data['genre'] != data.pop('unconfirmed_suggestion', ''):
+                            music_genre_service.set_cached_genre(data['title'], data['artist'], clean_year, data['genre'])
+                        self.changes.mark(data['path'], CHANGE_SAVE)
                         
-                        print(f"💾 선택 저장 완료: {data.get('title', 'Unknown')} -> {data['genre']}")
+                        logger.debug("💾 선택 저장 완료: %s -> %s", data.get('title', 'Unknown'), data['genre'])
                     else:
                         error_count += 1
-                        print(f"❌ 선택 저장 실패: {data.get('title', 'Unknown')}")
+                        logger.error("❌ 선택 저장 실패: %s", data.get('title', 'Unknown'))
                 elif year_changed:
                     if AudioFileProcessor.save_metadata(data):
                         saved_count += 1
@@ -745,16 +836,17 @@ class SmartGenreTaggerMainWindow(QMainWindow):
                         data['year'] = clean_year
                         data['original_year'] = clean_year
                         item.setText(2, clean_year)
-                        print(f"📅 선택 연도 저장: {data.get('title', 'Unknown')} -> {clean_year}")
+                        self.changes.mark(data['path'], CHANGE_SAVE)
+                        logger.debug("📅 선택 연도 저장: %s -> %s", data.get('title', 'Unknown'), clean_year)
                     else:
                         error_count += 1
-                        print(f"❌ 선택 연도 저장 실패: {data.get('title', 'Unknown')}")
+                        logger.error("❌ 선택 연도 저장 실패: %s", data.get('title', 'Unknown'))
             
             processed_items += 1
             
             # 매 1개 항목마다 UI 업데이트 (선택 저장은 항목이 적으므로 더 자주)
             progress_percent = int((processed_items / total_items) * 100)
-            print(f"💾 선택 저장 진행률: {processed_items}/{total_items} ({progress_percent}%)")
+            logger.debug("💾 선택 저장 진행률: %s/%s (%s%%)", processed_items, total_items, progress_percent)
             
             # UI 즉시 반영
             QApplication.processEvents()
@@ -764,7 +856,7 @@ class SmartGenreTaggerMainWindow(QMainWindow):
                 self.status_label.setText(f"선택 저장 중... {processed_items}/{total_items} ({progress_percent}%)")
         
         # 저장 완료 후 최종 상태 업데이트
-        print(f"💾 선택 저장 완료: {saved_count}개 저장, {error_count}개 실패")
+        logger.info("💾 선택 저장 완료: %s개 저장, %s개 실패", saved_count, error_count)
         self.update_status()
         QApplication.processEvents()
         
@@ -776,19 +868,113 @@ class SmartGenreTaggerMainWindow(QMainWindow):
         else:
             QMessageBox.information(self, "저장 완료", "선택된 항목에 저장할 변경사항이 없습니다.")
     
-    def get_selected_item_path(self):
-        """현재 선택된 항목의 파일 경로 반환"""
+    def get_selected_item_data(self):
+        """현재 선택된 항목의 곡 정보 반환"""
         current_item = self.tree.currentItem()
         if current_item:
             # 정렬된 상태에서도 올바른 데이터 인덱스 사용
             data_index = self.get_data_index_from_item(current_item)
             if data_index is not None:
-                return self.mp3_data[data_index]['path']
+                return self.mp3_data[data_index]
         return None
     
+    def get_selected_item_path(self):
+        """현재 선택된 항목의 파일 경로 반환"""
+        data = self.get_selected_item_data()
+        return data['path'] if data else None
+    
+    def prefetch_around_selection(self, *_):
+        """현재 곡과 다음 몇 곡, 선택된 곡들을 백그라운드에서 미리 읽기 (미리듣기 즉시 시작)"""
+        current_item = self.tree.currentItem()
+        if current_item is None:
+            return
+        items = [current_item]
+        start = self.tree.indexOfTopLevelItem(current_item)
+        if start >= 0:
+            end = min(start + 1 + PREFETCH_AHEAD, self.tree.topLevelItemCount())
+            items.extend(self.tree.topLevelItem(i) for i in range(start + 1, end))
+        items.extend(self.tree.selectedItems()[:PREFETCH_AHEAD])
+        
+        tracks = []
+        for item in items:
+            data_index = self.get_data_index_from_item(item)
+            if data_index is not None:
+                tracks.append(self.mp3_data[data_index])
+        self.audio_player.prefetcher.prefetch(data['path'] for data in tracks)
+        self.analyze_tracks(tracks)
+    
+    def analyze_tracks(self, tracks):
+        """훅 위치가 아직 없는 곡들을 백그라운드에서 분석 (목록에서 벗어난 대기 작업은 취소)"""
+        wanted = {data['path'] for data in tracks}
+        for path, future in list(self.analysis_pending.items()):
+            if future.done() or (path not in wanted and future.cancel()):
+                del self.analysis_pending[path]
+        for data in tracks:
+            if needs_analysis(data) and data['path'] not in self.analysis_pending:
+                self.analysis_pending[data['path']] = self.analysis_executor.submit(self._analyze_track, data)
+    
+    def _analyze_track(self, data):
+        """곡 하나 분석 후 곡 정보와 라이브러리 인덱스에 저장 (분석 스레드에서 실행)"""
+        path = data['path']
+        try:
+            analysis = analyze_file(path, self.audio_player.prefetcher.get(path))
+        except Exception as e:
+            logger.warning("곡 분석 오류 %s: %s", os.path.basename(path), e)
+            return None
+        data['analysis'] = analysis
+        library_index.update(path, analysis=analysis)
+        return analysis
+    
+    def jump_to_hook(self):
+        """선택한 곡의 훅 위치부터 재생 (분석 전이면 분석을 기다린 뒤 이동)"""
+        data = self.get_selected_item_data()
+        if not data:
+            QMessageBox.information(self, "알림", "재생할 파일을 선택해주세요.")
+            return
+        if needs_analysis(data):
+            self.analyze_tracks([data])
+            self.status_label.setText("🔍 훅 위치 분석 중...")
+            self._poll_hook(data)
+            return
+        self._play_from_hook(data)
+    
+    def _poll_hook(self, data):
+        """훅 분석 완료 확인 (GUI 스레드에서 주기적으로 호출)"""
+        future = self.analysis_pending.get(data['path'])
+        if future is not None and not future.done():
+            QTimer.singleShot(ANALYSIS_POLL_MS, lambda: self._poll_hook(data))
+            return
+        self.update_status()
+        if needs_analysis(data):
+            QMessageBox.warning(self, "경고", "곡 분석에 실패해 훅 위치를 찾을 수 없습니다.")
+            return
+        self._play_from_hook(data)
+    
+    def _play_from_hook(self, data):
+        if self.audio_player.current_file != data['path'] and not self._start_playback(data):
+            return
+        if self.audio_player.jump_to_hook(data.get('analysis')):
+            self.audio_control.update_play_button(True)
+            self._shown_second = None
+            self.timer.start()
+    
+    def _start_playback(self, data):
+        """새 파일 재생 시작 및 재생 정보 표시"""
+        if not self.audio_player.play(data['path'], data.get('duration', 0)):
+            return False
+        self.audio_control.update_current_file(os.path.basename(data['path']))
+        
+        # 시크바 설정
+        if self.audio_player.song_length > 0:
+            self.audio_control.update_seekbar(0, self.audio_player.song_length)
+            total_time = AudioPlayer.format_time(self.audio_player.song_length)
+            self.audio_control.update_time_display("00:00", total_time)
+        return True
+    
     def toggle_play_pause(self):
         """재생/일시정지 토글"""
-        selected_path = self.get_selected_item_path()
+        selected_data = self.get_selected_item_data()
+        selected_path = selected_data['path'] if selected_data else None
         
         if not selected_path:
             QMessageBox.information(self, "알림", "재생할 파일을 선택해주세요.")
@@ -799,28 +985,23 @@ class SmartGenreTaggerMainWindow(QMainWindow):
                 # 현재 재생 중인 파일을 일시정지
                 self.audio_player.pause()
                 self.audio_control.update_play_button(False)
+                self.timer.stop()
             else:
                 # 새 파일 재생 또는 재개
                 if self.audio_player.current_file != selected_path:
                     # 새 파일 재생
-                    if self.audio_player.play(selected_path):
-                        filename = os.path.basename(selected_path)
-                        self.audio_control.update_current_file(filename)
-                        
-                        # 시크바 설정
-                        if self.audio_player.song_length > 0:
-                            self.audio_control.update_seekbar(0, self.audio_player.song_length)
-                            total_time = AudioPlayer.format_time(self.audio_player.song_length)
-                            self.audio_control.update_time_display("00:00", total_time)
+                    self._start_playback(selected_data)
                 else:
                     # 일시정지된 파일 재개
                     self.audio_player.resume()
                 
                 self.audio_control.update_play_button(True)
+                self._shown_second = None
+                self.timer.start()
                 
         except Exception as e:
             QMessageBox.critical(self, "재생 오류", f"파일 재생 중 오류가 발생했습니다:\n{str(e)}")
-            print(f"재생 오류: {e}")
+            logger.warning("재생 오류: %s", e)
     
     def on_seekbar_change(self, value):
         """시크바 값 변경 시 호출"""
@@ -835,16 +1016,33 @@ class SmartGenreTaggerMainWindow(QMainWindow):
         """시크바 클릭 종료"""
         if self.audio_player.seeking and self.audio_player.current_file:
             self.audio_player.set_position(self.audio_player.current_pos)
+            self._shown_second = None
         self.audio_player.seeking = False
     
     def update_seekbar(self):
-        """시크바 업데이트 (타이머에서 호출)"""
+        """시크바 업데이트 (재생 중 타이머에서 호출, 표시할 초가 바뀔 때만 위젯 갱신)"""
+        if self.audio_player.check_finished():
+            # 재생 완료
+            self.timer.stop()
+            self._shown_second = None
+            self.audio_control.update_play_button(False)
+            if self.audio_player.song_length > 0:
+                self.audio_control.update_seekbar(0)
+                total_time = AudioPlayer.format_time(self.audio_player.song_length)
+                self.audio_control.update_time_display("00:00", total_time)
+            return
+        
         if (self.audio_player.is_playing and 
             not self.audio_player.seeking and 
             self.audio_player.song_length > 0):
             
-            self.audio_control.update_seekbar(int(self.audio_player.current_pos))
-            current_time = AudioPlayer.format_time(self.audio_player.current_pos)
+            second = int(self.audio_player.get_position())
+            if second == self._shown_second:
+                return
+            self._shown_second = second
+            
+            self.audio_control.update_seekbar(second)
+            current_time = AudioPlayer.format_time(second)
             total_time = AudioPlayer.format_time(self.audio_player.song_length)
             self.audio_control.update_time_display(current_time, total_time)
     
@@ -855,13 +1053,13 @@ class SmartGenreTaggerMainWindow(QMainWindow):
             clipboard.setText(text)
             # 상태표시줄에 복사 완료 메시지 표시
             self.status_label.setText(f"📋 {field_name} 복사됨: {text}")
-            print(f"{field_name} 복사됨: {text}")
+            logger.debug("%s 복사됨: %s", field_name, text)
             
             # 3초 후 원래 상태로 복원
             QTimer.singleShot(3000, self.update_status)
         else:
             self.status_label.setText(f"❌ {field_name} 정보가 없습니다.")
-            print(f"{field_name} 정보가 없습니다.")
+            logger.debug("%s 정보가 없습니다.", field_name)
             # 3초 후 원래 상태로 복원
             QTimer.singleShot(3000, self.update_status)
     
@@ -892,7 +1090,7 @@ class SmartGenreTaggerMainWindow(QMainWindow):
         """장르 추천 중지"""
         self.genre_stop_requested = True
         self.status_label.setText("⏹️ 장르 추천 취소 중... (진행 중인 작업은 곧 멈춥니다)")
-        print("장르 추천 중지 요청됨")
+        logger.info("장르 추천 중지 요청됨")
     
     def clear_genre_recommendations(self):
         """장르 추천 정보 초기화"""
@@ -912,6 +1110,8 @@ class SmartGenreTaggerMainWindow(QMainWindow):
             for data in self.mp3_data:
                 if data.get('genre_suggestion', ''):
                     data['genre_suggestion'] = ""
+                    data.pop('unconfirmed_suggestion', None)
+                    self.changes.mark(data['path'], CHANGE_CLEAR)
                     cleared_count += 1
             
             # 트리에서 장르 추천 컬럼 초기화
@@ -920,7 +1120,7 @@ class SmartGenreTaggerMainWindow(QMainWindow):
                 item.setText(4, "")  # 장르 추천 컬럼 비우기
             
             QMessageBox.information(self, "완료", f"{cleared_count}개의 장르 추천 정보가 초기화되었습니다.")
-            print(f"장르 추천 정보 초기화 완료: {cleared_count}개")
+            logger.info("장르 추천 정보 초기화 완료: %s개", cleared_count)
     
     def update_status(self):
         """상태바 업데이트"""
@@ -983,14 +1183,17 @@ class SmartGenreTaggerMainWindow(QMainWindow):
         cpu_count = os.cpu_count() or 4
         # CPU 코어 수의 1.5배, 최소 4개, 최대 8개
         optimal_workers = min(max(int(cpu_count * 1.5), 4), 8)
-        print(f"🔧 최적 워커 수: {optimal_workers} (CPU 코어: {cpu_count})")
+        logger.info("🔧 최적 워커 수: %s (CPU 코어: %s)", optimal_workers, cpu_count)
         return optimal_workers
 
+    @profiler.profiled("recommend_all")
     def recommend_all_genres_improved(self):
         """개선된 장르 추천 - 실시간 진행 상황 표시"""
         if not self.mp3_data:
             QMessageBox.warning(self, "경고", "먼저 MP3 파일을 로드해주세요.")
             return
+        if not self.check_credentials():
+            return
         
         self.genre_stop_requested = False
         music_genre_service.set_stop_flag(False)
@@ -1006,7 +1209,7 @@ class SmartGenreTaggerMainWindow(QMainWindow):
         # 실시간 워커 함수
         def improved_worker(i, data_index, data):
             if self.genre_stop_requested or music_genre_service.is_stop_requested():
-                print(f"[DEBUG] 중지 요청 감지: 워커 {i} 즉시 종료")
+                logger.debug("중지 요청 감지: 워커 %s 즉시 종료", i)
                 return i, data_index, "중지됨", ""
             
             title = data.get('title', 'Unknown')
@@ -1015,12 +1218,13 @@ class SmartGenreTaggerMainWindow(QMainWindow):
             original_genre = data.get('genre', '')
             
             # 현재 처리 중인 곡 정보 출력 (실시간)
-            print(f"🎵 [{i+1:3d}/{total_files}] 처리 중: {title} - {artist}")
+            logger.debug("🎵 [%3d/%s] 처리 중: %s - %s", i+1, total_files, title, artist)
             
-            suggestion, year_value = music_genre_service.get_genre_recommendation(title, artist, year, original_genre)
+            suggestion, year_value = music_genre_service.get_genre_recommendation(
+                title, artist, year, original_genre, data.get('path'))
             
             if suggestion == "중지됨" or self.genre_stop_requested:
-                print(f"[DEBUG] 워커 {i} 중지됨")
+                logger.debug("워커 %s 중지됨", i)
                 return i, data_index, "중지됨", ""
             
             return i, data_index, suggestion, year_value
@@ -1040,7 +1244,7 @@ class SmartGenreTaggerMainWindow(QMainWindow):
                 # 매 곡마다 취소 상태 체크 (UI 응답성 보장)
                 QApplication.processEvents()
                 if self.genre_stop_requested or progress.wasCanceled():
-                    print("장르 추천이 사용자에 의해 중지되었습니다.")
+                    logger.info("장르 추천이 사용자에 의해 중지되었습니다.")
                     self.genre_stop_requested = True
                     music_genre_service.set_stop_flag(True)
                     
@@ -1050,7 +1254,7 @@ class SmartGenreTaggerMainWindow(QMainWindow):
                         if not f.done():
                             if f.cancel():
                                 cancelled_count += 1
-                    print(f"[DEBUG] {cancelled_count}개 작업 취소 시도")
+                    logger.debug("%s개 작업 취소 시도", cancelled_count)
                     
                     # executor를 강제 종료
                     try:
@@ -1072,9 +1276,10 @@ class SmartGenreTaggerMainWindow(QMainWindow):
                     
                     # 실시간 UI 업데이트
                     if not self.genre_stop_requested:
-                        self.mp3_data[data_index]['genre_suggestion'] = suggestion
+                        self.set_genre_suggestion(data_index, suggestion)
                         if year_value:
                             self.mp3_data[data_index]['year'] = year_value
+                        self.changes.mark(self.mp3_data[data_index]['path'], CHANGE_RECOMMEND)
                         
                         # 트리 아이템 업데이트
                         item = self.find_tree_item_by_data_index(data_index)
@@ -1097,7 +1302,7 @@ class SmartGenreTaggerMainWindow(QMainWindow):
                         QApplication.processEvents()
                         
                 except Exception as e:
-                    print(f"결과 처리 오류: {e}")
+                    logger.warning("결과 처리 오류: %s", e)
                     continue
                 
                 # 중지 체크
@@ -1116,101 +1321,127 @@ class SmartGenreTaggerMainWindow(QMainWindow):
         music_genre_service.set_stop_flag(False)
     
     def export_to_csv(self):
-        """모든 MP3 정보를 CSV 파일로 내보내기"""
+        """모든 MP3 정보를 CSV/Parquet/Arrow 파일로 내보내기 (파일 쓰기는 백그라운드)"""
         if not self.mp3_data:
             QMessageBox.warning(self, "경고", "내보낼 MP3 파일이 없습니다.\n먼저 폴더를 선택해주세요.")
             return
         
+        if self.export_future and not self.export_future.done():
+            QMessageBox.information(self, "알림", "이전 내보내기가 아직 진행 중입니다.")
+            return
+        
         # 파일 저장 대화상자
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         default_filename = f"SmartGenreTagger_Export_{timestamp}.csv"
         
-        file_path, _ = QFileDialog.getSaveFileName(
+        file_path, selected_filter = QFileDialog.getSaveFileName(
             self, 
-            "CSV 파일로 내보내기", 
+            "파일로 내보내기", 
             default_filename,
-            "CSV 파일 (*.csv);;모든 파일 (*)"
+            "CSV 파일 (*.csv);;Parquet 파일 (*.parquet);;Arrow IPC 파일 (*.arrow);;모든 파일 (*)"
         )
         
         if not file_path:
             return  # 사용자가 취소한 경우
         
+        # 확장자가 없거나 선택한 형식과 다르면 선택한 형식의 확장자 사용
+        for ext in ('.parquet', '.arrow'):
+            if ext in selected_filter and not file_path.lower().endswith(ext):
+                file_path = os.path.splitext(file_path)[0] + ext
+        
+        version = self.changes.version
         try:
-            # 진행률 표시
-            progress = QProgressDialog("CSV 파일을 생성하는 중...", "취소", 0, len(self.mp3_data), self)
-            progress.setWindowTitle("CSV 내보내기")
-            progress.setWindowModality(Qt.WindowModal)
-            progress.setMinimumDuration(0)
-            progress.setValue(0)
-            progress.setFixedSize(400, 120)
-            
-            exported_count = 0
-            
-            with open(file_path, 'w', newline='', encoding='utf-8-sig') as csvfile:
-                # CSV 헤더 정의
-                fieldnames = [
-                    '파일경로', '파일명', '제목', '아티스트', '연도', '장르', '추천장르'
-                ]
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                
-                # 헤더 쓰기
-                writer.writeheader()
-                
-                # 데이터 쓰기
-                for i, data in enumerate(self.mp3_data):
-                    if progress.wasCanceled():
-                        QMessageBox.information(self, "취소", "CSV 내보내기가 취소되었습니다.")
-                        return
-                    
-                    progress.setLabelText(f"CSV 파일을 생성하는 중... ({i+1}/{len(self.mp3_data)})")
-                    progress.setValue(i)
-                    QApplication.processEvents()
-                    
-                    # 파일 경로와 파일명 추출
-                    file_path_full = data.get('path', '')  # 'file_path' → 'path'로 수정
-                    filename = data.get('filename', '')     # 직접 filename 키 사용
-                    
-                    # 연도에서 ✓ 표시 제거
-                    year_clean = data.get('year', '').replace(' ✓', '') if data.get('year') else ''
-                    
-                    # CSV 행 데이터
-                    row_data = {
-                        '파일경로': file_path_full,
-                        '파일명': filename,
-                        '제목': data.get('title', ''),
-                        '아티스트': data.get('artist', ''),
-                        '연도': year_clean,
-                        '장르': data.get('genre', ''),
-                        '추천장르': data.get('genre_suggestion', '')
-                    }
-                    
-                    writer.writerow(row_data)
-                    exported_count += 1
-                
-                progress.setValue(len(self.mp3_data))
-            
-            progress.close()
-            
-            # 성공 메시지
-            QMessageBox.information(
-                self, 
-                "완료", 
-                f"CSV 내보내기가 완료되었습니다!\n\n"
-                f"파일: {os.path.basename(file_path)}\n"
-                f"위치: {os.path.dirname(file_path)}\n"
-                f"내보낸 곡 수: {exported_count}개"
-            )
-            
-            # 상태바 업데이트
-            self.status_label.setText(f"📊 CSV 내보내기 완료: {exported_count}개 곡")
-            QTimer.singleShot(5000, self.update_status)  # 5초 후 원래 상태로 복원
-            
+            format_for_path(file_path)
+            # 곡 정보는 GUI 스레드에서 한 번에 스냅샷하고, 파일 쓰기만 백그라운드에서 수행
+            rows = track_rows(self.mp3_data, music_genre_service.get_spotify_info)
+        except Exception as e:
+            QMessageBox.critical(self, "오류", f"내보내기를 시작할 수 없습니다:\n{str(e)}")
+            return
+        
+        self._start_export(write_rows, rows, file_path, version)
+    
+    def export_changes(self):
+        """마지막 내보내기(또는 폴더 로드) 이후 바뀐 곡만 변경 로그로 내보내기"""
+        if self.export_future and not self.export_future.done():
+            QMessageBox.information(self, "알림", "이전 내보내기가 아직 진행 중입니다.")
+            return
+        
+        version = self.changes.version
+        changes = self.changes.changed_since()
+        if not changes:
+            QMessageBox.information(self, "알림", "마지막 내보내기 이후 변경된 곡이 없습니다.")
+            return
+        
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        default_filename = f"SmartGenreTagger_Changes_{timestamp}.jsonl"
+        
+        file_path, selected_filter = QFileDialog.getSaveFileName(
+            self, 
+            "변경분 내보내기", 
+            default_filename,
+            "JSONL 변경 로그 (*.jsonl);;CSV 파일 (*.csv)"
+        )
+        
+        if not file_path:
+            return  # 사용자가 취소한 경우
+        
+        if not os.path.splitext(file_path)[1]:
+            file_path += '.csv' if '.csv' in selected_filter else '.jsonl'
+        
+        try:
+            if format_for_path(file_path) not in ('jsonl', 'csv'):
+                raise ValueError("변경 로그는 .jsonl 또는 .csv 형식만 지원합니다.")
+            changed_data = [data for data in self.mp3_data if data['path'] in changes]
+            rows = delta_rows(track_rows(changed_data, music_genre_service.get_spotify_info), changes)
+        except Exception as e:
+            QMessageBox.critical(self, "오류", f"내보내기를 시작할 수 없습니다:\n{str(e)}")
+            return
+        
+        self._start_export(write_delta, rows, file_path, version)
+    
+    def _start_export(self, writer, rows, file_path, version):
+        """스냅샷한 행을 백그라운드에서 기록하고 완료를 기다림"""
+        self.status_label.setText(f"📊 내보내는 중... ({len(rows)}개 곡)")
+        self.export_profile = profiler.start("export_delta" if writer is write_delta else "export")
+        self.export_future = self.export_executor.submit(writer, rows, file_path)
+        self._poll_export(file_path, version)
+    
+    def _poll_export(self, file_path, version):
+        """백그라운드 내보내기 완료 확인 (GUI 스레드에서 주기적으로 호출)"""
+        if not self.export_future.done():
+            QTimer.singleShot(EXPORT_POLL_MS, lambda: self._poll_export(file_path, version))
+            return
+        
+        profiler.stop(self.export_profile)
+        self.export_profile = None
+        
+        try:
+            exported_count = self.export_future.result()
         except Exception as e:
             QMessageBox.critical(
                 self, 
                 "오류", 
-                f"CSV 파일 생성 중 오류가 발생했습니다:\n{str(e)}"
+                f"파일 생성 중 오류가 발생했습니다:\n{str(e)}"
             )
-            print(f"CSV 내보내기 오류: {e}")
+            logger.error("내보내기 오류: %s", e)
+            self.update_status()
+            return
+        
+        # 이번에 내보낸 시점 이후의 변경만 다음 변경분에 포함
+        self.changes.mark_exported(version)
+        
+        # 성공 메시지
+        QMessageBox.information(
+            self, 
+            "완료", 
+            f"내보내기가 완료되었습니다!\n\n"
+            f"파일: {os.path.basename(file_path)}\n"
+            f"위치: {os.path.dirname(file_path)}\n"
+            f"내보낸 곡 수: {exported_count}개"
+        )
+        
+        # 상태바 업데이트
+        self.status_label.setText(f"📊 내보내기 완료: {exported_count}개 곡")
+        QTimer.singleShot(5000, self.update_status)  # 5초 후 원래 상태로 복원
 
  
\ No newline at end of file
@@ -0,0 +1,230 @@
+"""
+처리 단계별 지표 수집
+캐시 조회, MusicBrainz 검색/아티스트 조회, Discogs, GPT, 태그 저장 같은 단계마다 소요 시간을
+히스토그램(Prometheus 방식 누적 버킷)으로 모으고, 백엔드별 적중/미스/재시도/요청 한도 초과 횟수를 센다.
+스냅샷은 JSON 또는 Prometheus 텍스트 형식으로 내보낼 수 있어, 대량 처리에서 시간이 어디에 쓰이는지 볼 수 있다.
+기록은 락 한 번과 덧셈 몇 번이라 작업 스레드에서 호출해도 부담이 없다.
+"""
+
+import os
+import json
+import time
+import bisect
+import threading
+from contextlib import contextmanager
+from functools import wraps
+from typing import Dict, Optional, Tuple
+
+# 히스토그램 버킷 상한(초) - 캐시 조회(ms 미만)부터 재시도가 섞인 원격 호출(수십 초)까지
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+# 단계 이름
+STAGE_CACHE = 'cache_lookup'
+STAGE_MUSICBRAINZ_SEARCH = 'musicbrainz_search'
+STAGE_MUSICBRAINZ_ARTIST = 'musicbrainz_artist'
+STAGE_DISCOGS = 'discogs'
+STAGE_GPT = 'gpt'
+STAGE_SPOTIFY = 'spotify'
+STAGE_LOCAL_PRIOR = 'local_prior'
+STAGE_THROTTLE = 'throttle'      # 성공 후 고정 대기 (API 예절용 sleep)
+STAGE_TAG_WRITE = 'tag_write'
+STAGE_RECOMMEND = 'recommend'    # 곡 하나의 장르 추천 전체
+
+# 백엔드별 이벤트
+EVENT_HIT = 'hit'
+EVENT_MISS = 'miss'
+EVENT_RETRY = 'retry'
+EVENT_RATE_LIMITED = 'rate_limited'
+EVENT_TIMEOUT = 'timeout'
+EVENT_ERROR = 'error'
+
+METRICS_PREFIX = 'smartgenretagger'
+
+
+class Histogram:
+    """누적 전 버킷별 개수 + 합계/최소/최대"""
+
+    __slots__ = ('bounds', 'counts', 'count', 'total', 'min', 'max')
+
+    def __init__(self, bounds: Tuple[float, ...] = LATENCY_BUCKETS):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)  # 마지막 칸은 +Inf
+        self.count = 0
+        self.total = 0.0
+        self.min = float('inf')
+        self.max = 0.0
+
+    def observe(self, value: float):
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def quantile(self, q: float) -> float:
+        """버킷 상한 기준 근사 분위수 (+Inf 버킷이면 최댓값)"""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        running = 0
+        for bound, n in zip(self.bounds, self.counts):
+            running += n
+            if running >= rank:
+                return min(bound, self.max)
+        return self.max
+
+    def cumulative(self):
+        """[(상한 문자열, 누적 개수)] - 마지막은 '+Inf'"""
+        result, running = [], 0
+        for bound, n in zip(self.bounds, self.counts):
+            running += n
+            result.append((_format_bound(bound), running))
+        result.append(('+Inf', self.count))
+        return result
+
+    def summary(self) -> Dict:
+        return {
+            'count': self.count,
+            'sum': round(self.total, 6),
+            'mean': round(self.total / self.count, 6) if self.count else 0.0,
+            'min': round(self.min, 6) if self.count else 0.0,
+            'max': round(self.max, 6),
+            'p50': self.quantile(0.5),
+            'p95': self.quantile(0.95),
+            'p99': self.quantile(0.99),
+            'buckets': dict(self.cumulative()),
+        }
+
+
+def _format_bound(bound: float) -> str:
+    return repr(float(bound))
+
+
+def _label(value: str) -> str:
+    """Prometheus 라벨 값 이스케이프"""
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+class Metrics:
+    """단계별 소요 시간 히스토그램 + (백엔드, 이벤트) 카운터 (스레드 안전)"""
+
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self.lock = threading.Lock()
+        self._stages: Dict[str, Histogram] = {}
+        self._counters: Dict[Tuple[str, str], int] = {}
+        self._started = time.time()
+
+    def observe(self, stage: str, seconds: float):
+        if not self.enabled:
+            return
+        with self.lock:
+            histogram = self._stages.get(stage)
+            if histogram is None:
+                histogram = self._stages[stage] = Histogram()
+            histogram.observe(seconds)
+
+    @contextmanager
+    def timer(self, stage: str):
+        """with 블록 소요 시간을 stage에 기록 (예외로 빠져나가도 기록)"""
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(stage, time.perf_counter() - start)
+
+    def timed(self, stage: str):
+        """함수 호출 소요 시간을 기록하는 데코레이터"""
+        def decorator(func):
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                with self.timer(stage):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def count(self, backend: str, event: str, n: int = 1):
+        if not self.enabled:
+            return
+        key = (backend, event)
+        with self.lock:
+            self._counters[key] = self._counters.get(key, 0) + n
+
+    def counter(self, backend: str, event: str) -> int:
+        return self._counters.get((backend, event), 0)
+
+    def reset(self):
+        with self.lock:
+            self._stages.clear()
+            self._counters.clear()
+            self._started = time.time()
+
+    # ------------------------------------------------------------------
+    # 내보내기
+    # ------------------------------------------------------------------
+
+    def snapshot(self) -> Dict:
+        """현재 지표 사본 {'started', 'elapsed', 'stages': {단계: 요약}, 'counters': {백엔드: {이벤트: 횟수}}}"""
+        with self.lock:
+            stages = {stage: h.summary() for stage, h in sorted(self._stages.items())}
+            counters: Dict[str, Dict[str, int]] = {}
+            for (backend, event), n in sorted(self._counters.items()):
+                counters.setdefault(backend, {})[event] = n
+            started = self._started
+        return {
+            'started': started,
+            'elapsed': round(time.time() - started, 3),
+            'stages': stages,
+            'counters': counters,
+        }
+
+    def to_json(self, indent: Optional[int] = 2) -> str:
+        return json.dumps(self.snapshot(), ensure_ascii=False, indent=indent)
+
+    def to_prometheus(self, prefix: str = METRICS_PREFIX) -> str:
+        """Prometheus 텍스트 노출 형식 (textfile collector 등에서 그대로 수집 가능)"""
+        snap = self.snapshot()
+        lines = [
+            f"# HELP {prefix}_stage_seconds 처리 단계별 소요 시간",
+            f"# TYPE {prefix}_stage_seconds histogram",
+        ]
+        for stage, summary in snap['stages'].items():
+            label = _label(stage)
+            for bound, n in summary['buckets'].items():
+                lines.append(f'{prefix}_stage_seconds_bucket{{stage="{label}",le="{bound}"}} {n}')
+            lines.append(f'{prefix}_stage_seconds_sum{{stage="{label}"}} {summary["sum"]}')
+            lines.append(f'{prefix}_stage_seconds_count{{stage="{label}"}} {summary["count"]}')
+        lines.append(f"# HELP {prefix}_backend_events_total 백엔드별 적중/미스/재시도/요청 한도 초과 횟수")
+        lines.append(f"# TYPE {prefix}_backend_events_total counter")
+        for backend, events in snap['counters'].items():
+            for event, n in events.items():
+                lines.append(f'{prefix}_backend_events_total{{backend="{_label(backend)}",event="{_label(event)}"}} {n}')
+        return "\n".join(lines) + "\n"
+
+    def write(self, path: str):
+        """스냅샷을 파일로 저장 (.json → JSON, 그 외 → Prometheus 텍스트), 임시 파일에 쓴 뒤 교체"""
+        text = self.to_json() if path.lower().endswith('.json') else self.to_prometheus()
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(text)
+        os.replace(tmp_path, path)
+
+    def report(self) -> str:
+        """사람이 읽는 요약 표 (단계별 합계 시간이 큰 순)"""
+        snap = self.snapshot()
+        lines = [f"{'단계':<20} {'횟수':>7} {'합계(s)':>10} {'평균(ms)':>10} {'p95(ms)':>10} {'최대(ms)':>10}"]
+        for stage, s in sorted(snap['stages'].items(), key=lambda item: -item[1]['sum']):
+            lines.append(f"{stage:<20} {s['count']:>7} {s['sum']:>10.2f} {s['mean'] * 1000:>10.1f} "
+                         f"{s['p95'] * 1000:>10.1f} {s['max'] * 1000:>10.1f}")
+        for backend, events in snap['counters'].items():
+            lines.append(f"{backend}: " + ", ".join(f"{event}={n}" for event, n in events.items()))
+        return "\n".join(lines)
+
+
+# 전역 지표 인스턴스
+metrics = Metrics()
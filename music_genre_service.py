@@ -1,17 +1,20 @@
-import musicbrainzngs
-import discogs_client
 import time
-import re
+import logging
 from config import config
-import openai
+from genre_normalizer import genre_normalizer
+from text_normalizer import TrackKey, clean_title, clean_artist
+from metrics import (metrics, STAGE_CACHE, STAGE_MUSICBRAINZ_SEARCH, STAGE_MUSICBRAINZ_ARTIST, STAGE_DISCOGS,
+                     STAGE_GPT, STAGE_LOCAL_PRIOR, STAGE_THROTTLE, STAGE_RECOMMEND, EVENT_HIT, EVENT_MISS,
+                     EVENT_RETRY, EVENT_RATE_LIMITED, EVENT_TIMEOUT, EVENT_ERROR)
 import pickle
 import threading
 import os
 from typing import Dict, List, Optional, Tuple, Union
-import asyncio
-import aiohttp
-from concurrent.futures import ThreadPoolExecutor
-import functools
+
+logger = logging.getLogger(__name__)
+
+# musicbrainzngs, discogs_client, openai, asyncio는 import 비용이 커서
+# 앱 시작 속도를 위해 실제로 사용하는 시점에 로드한다.
 
 # =============================================================================
 # 프롬프트 템플릿 관리
@@ -208,14 +211,17 @@ class PromptManager:
 OUTPUT (genres only):"""
     
     @classmethod
-    def get_direct_recommendation_prompt(cls, title: str, artist: str, rule_preset: str = 'direct_recommendation') -> str:
-        """곡 정보 기반 추천 프롬프트 생성"""
+    def get_direct_recommendation_prompt(cls, title: str, artist: str, rule_preset: str = 'direct_recommendation',
+                                         hint_genres: List[str] = None) -> str:
+        """곡 정보 기반 추천 프롬프트 생성 (hint_genres: Spotify 아티스트 장르 등 참고용 장르)"""
         rule_keys = cls.get_rules_by_preset(rule_preset)
+        hint_line = (f"🎧 **ARTIST GENRES (Spotify, reference only - the song itself decides):** {', '.join(hint_genres)}\n"
+                     if hint_genres else "")
         
         return f"""🎯 **DJ GENRE ANALYSIS - ACCURACY FIRST:**
 
 🎵 **SONG:** {title} by {artist}
-
+{hint_line}
 🚨 **CRITICAL RULES:**
 1. **ACCURACY IS PARAMOUNT** - Only suggest genres that actually match the song
 2. **NO FORCED GENRES** - Don't add Afrobeats/Latin/Dancehall unless the song actually is that genre
@@ -268,7 +274,7 @@ OUTPUT (genres only):"""
         if rule_key in cls.RULES:
             cls.RULES[rule_key] = new_content
         else:
-            print(f"Warning: Rule '{rule_key}' not found")
+            logger.debug("Warning: Rule '%s' not found", rule_key)
     
     @classmethod
     def add_custom_preset(cls, preset_name: str, rule_keys: List[str]):
@@ -353,42 +359,34 @@ def get_custom_genre_prompt(content: str, rules: List[str] = None) -> str:
 # 유틸리티 함수들
 # =============================================================================
 
-def clean_title(title):
-    """곡명에서 마지막 괄호/대괄호 정보를 반복적으로 제거"""
-    while True:
-        new_title = re.sub(r'\s*[\(\[].*?[\)\]]\s*$', '', title).strip()
-        if new_title == title:
-            break
-        title = new_title
-    return title
+_musicbrainz = None
+_musicbrainz_lock = threading.Lock()
 
-def clean_artist(artist):
-    """아티스트명에서 피처링 정보(ft, feat, featuring, with 등) 이후를 모두 제거"""
-    return re.split(r'\b(ft\.?|feat\.?|featuring|with)\b', artist, flags=re.IGNORECASE)[0].strip()
+def get_musicbrainz():
+    """musicbrainzngs 지연 로드 (첫 사용 시 import 및 User-Agent/Rate Limit 설정)"""
+    global _musicbrainz
+    if _musicbrainz is None:
+        with _musicbrainz_lock:
+            if _musicbrainz is None:
+                import musicbrainzngs
+                musicbrainzngs.set_useragent("SmartGenreTagger", "1.0", "contact@example.com")
+                musicbrainzngs.set_rate_limit(limit_or_interval=1.0, new_requests=1)
+                _musicbrainz = musicbrainzngs
+    return _musicbrainz
 
 def filter_artist_in_genres(genres, artist):
     """장르 리스트에서 아티스트명(혹은 주요 단어)이 포함된 장르명을 제거"""
-    artist_words = set(artist.lower().replace('.', '').replace('-', ' ').split())
-    filtered = []
-    for g in genres:
-        g_lower = g.lower()
-        # 아티스트명 전체 또는 단어가 장르명에 포함되면 제외
-        if artist.lower() in g_lower:
-            continue
-        if any(word in g_lower for word in artist_words if len(word) > 2):  # 너무 짧은 단어는 무시
-            continue
-        filtered.append(g)
-    return filtered
+    return genre_normalizer.filter_artist(genres, artist)
 
 def filter_decade_genres(genres):
     """연도/시대 관련 정보가 포함된 장르를 제외"""
-    decade_pattern = re.compile(r'(\b(19|20)\d{2}s\b|\b\d{2}s\b|\bdecade\b|\bera\b)', re.IGNORECASE)
-    return [g for g in genres if not decade_pattern.search(g)]
+    return genre_normalizer.filter_decades(genres)
 
 def get_discogs_genres(title, artist):
     """Discogs에서 곡/아티스트/릴리즈 장르/스타일 정보 추출 (개선된 Rate Limit 대응)"""
     genres = []
     try:
+        import discogs_client
         d = discogs_client.Client('SmartGenreTagger/1.0', user_token=config.discogs_token)
         
         # 지수 백오프를 위한 변수들
@@ -399,196 +397,112 @@ def get_discogs_genres(title, artist):
             try:
                 # 릴리즈 검색
                 query = f'{title} {artist}'
-                print(f"🎧 Discogs 릴리즈 검색: {query}")
-                
-                results = d.search(query, type='release', per_page=3)  # 결과 수 줄임
-                for release in results:
-                    if hasattr(release, 'genres') and release.genres:
-                        for genre in release.genres:
-                            if genre and len(genre) > 1:  # 의미있는 장르만
-                                genres.append(genre)
-                    if hasattr(release, 'styles') and release.styles:
-                        for style in release.styles:
-                            if style and len(style) > 1:  # 의미있는 스타일만
-                                genres.append(style)
-                    
-                    # 충분한 장르를 찾았으면 조기 종료
-                    if len(set(genres)) >= 5:
-                        break
+                logger.debug("🎧 Discogs 릴리즈 검색: %s", query)
                 
-                # 아티스트 검색 (장르가 부족할 때만)
-                if len(set(genres)) < 3:
-                    print(f"🎧 Discogs 아티스트 검색: {artist}")
-                    artist_results = d.search(artist, type='artist', per_page=2)
-                    for a in artist_results:
-                        if hasattr(a, 'genres') and a.genres:
-                            for genre in a.genres:
-                                if genre and len(genre) > 1:
+                # 검색 결과는 순회할 때 받아오므로 순회까지 포함해 측정
+                with metrics.timer(STAGE_DISCOGS):
+                    results = d.search(query, type='release', per_page=3)  # 결과 수 줄임
+                    for release in results:
+                        if hasattr(release, 'genres') and release.genres:
+                            for genre in release.genres:
+                                if genre and len(genre) > 1:  # 의미있는 장르만
                                     genres.append(genre)
-                        if hasattr(a, 'styles') and a.styles:
-                            for style in a.styles:
-                                if style and len(style) > 1:
+                        if hasattr(release, 'styles') and release.styles:
+                            for style in release.styles:
+                                if style and len(style) > 1:  # 의미있는 스타일만
                                     genres.append(style)
-                        
+                    
                         # 충분한 장르를 찾았으면 조기 종료
                         if len(set(genres)) >= 5:
                             break
                 
+                    # 아티스트 검색 (장르가 부족할 때만)
+                    if len(set(genres)) < 3:
+                        logger.debug("🎧 Discogs 아티스트 검색: %s", artist)
+                        artist_results = d.search(artist, type='artist', per_page=2)
+                        for a in artist_results:
+                            if hasattr(a, 'genres') and a.genres:
+                                for genre in a.genres:
+                                    if genre and len(genre) > 1:
+                                        genres.append(genre)
+                            if hasattr(a, 'styles') and a.styles:
+                                for style in a.styles:
+                                    if style and len(style) > 1:
+                                        genres.append(style)
+                        
+                            # 충분한 장르를 찾았으면 조기 종료
+                            if len(set(genres)) >= 5:
+                                break
+                
                 # 중복 제거
                 genres = list(dict.fromkeys(genres))
-                print(f"🎧 Discogs 결과: {title} - {artist} -> {genres[:5]}")
+                logger.debug("🎧 Discogs 결과: %s - %s -> %s", title, artist, genres[:5])
                 
                 # 성공 시 지연 후 반환
-                time.sleep(2.5)  # Discogs는 더 긴 지연
+                metrics.count('discogs', EVENT_HIT if genres else EVENT_MISS)
+                with metrics.timer(STAGE_THROTTLE):
+                    time.sleep(2.5)  # Discogs는 더 긴 지연
                 return genres
                 
             except Exception as e:
                 if '429' in str(e) or 'rate limit' in str(e).lower():
                     # 지수 백오프: 3초, 6초, 12초
                     delay = base_delay * (2 ** attempt)
-                    print(f"🎧 Discogs Rate Limit! {delay}초 대기 후 재시도... (시도 {attempt + 1}/{max_retries})")
+                    logger.warning("🎧 Discogs Rate Limit! %s초 대기 후 재시도... (시도 %s/%s)", delay, attempt + 1, max_retries)
+                    metrics.count('discogs', EVENT_RATE_LIMITED)
+                    metrics.count('discogs', EVENT_RETRY)
                     time.sleep(delay)
                     continue
                 elif 'timeout' in str(e).lower():
-                    print(f"🎧 Discogs 타임아웃: {e}")
+                    logger.warning("🎧 Discogs 타임아웃: %s", e)
+                    metrics.count('discogs', EVENT_TIMEOUT)
                     if attempt < max_retries - 1:
+                        metrics.count('discogs', EVENT_RETRY)
                         time.sleep(3)
                         continue
                     else:
                         return []
                 else:
-                    print(f"🎧 Discogs 검색 오류: {e}")
+                    logger.warning("🎧 Discogs 검색 오류: %s", e)
+                    metrics.count('discogs', EVENT_ERROR)
                     return []
         
-        print(f"🎧 Discogs {max_retries}회 재시도 실패, 스킵")
+        logger.warning("🎧 Discogs %s회 재시도 실패, 스킵", max_retries)
         return ['Rate Limited']
         
     except Exception as e:
-        print(f"🎧 Discogs 검색 오류: {e}")
+        logger.warning("🎧 Discogs 검색 오류: %s", e)
         return []
 
 def clean_compound_genres(genre_string):
     """복합 장르에서 수식어만 추출하고 정리 (하이픈 처리 포함, 특별 예외 처리)"""
-    if not genre_string:
-        return genre_string
-    
-    # 특별 변환 규칙 (하이픈 변환 전에 먼저 처리)
-    special_conversions = {
-        'korean hip hop': 'K-Rap',
-        'korean rap': 'K-Rap',
-        'k rap': 'K-Rap',
-        'k-rap': 'K-Rap'
-    }
-    
-    # 하이픈 유지 예외 목록 (복합 장르 처리에서도 제외)
-    hyphen_exceptions = ['k-pop', 'j-pop', 'c-pop', 'k-rap']
-    
-    # 제외할 의미 없는 태그들
-    meaningless_tags = ['contemporary', 'modern', 'new', 'current', 'recent', 'latest', 'music']
-    
-    genres = [g.strip() for g in genre_string.split('/')]
-    processed_genres = []
-    special_genres = []  # 특별 처리된 장르들을 따로 보관
-    
-    for genre in genres:
-        genre_lower = genre.lower().strip()
-        
-        # 빈 문자열 제거
-        if not genre_lower:
-            continue
-            
-        # 의미 없는 태그 필터링
-        if genre_lower in meaningless_tags:
-            continue
-            
-        # 특별 변환 규칙 적용
-        converted = False
-        for key, value in special_conversions.items():
-            if key in genre_lower:
-                special_genres.append(value)
-                converted = True
-                break
-        
-        if converted:
-            continue
-            
-        # 하이픈 예외 처리: K-Pop, J-Pop 등은 하이픈 유지하고 특별 처리
-        if genre_lower in hyphen_exceptions:
-            formatted_genre = genre.title()
-            special_genres.append(formatted_genre)  # K-Pop, J-Pop 등으로 정리
-        else:
-            # 일반적인 하이픈을 띄어쓰기로 변환
-            genre = re.sub(r'-', ' ', genre)
-            genre = ' '.join(genre.split())  # 여러 공백을 하나로 정리
-            processed_genres.append(genre)
-    
-    # 대분류 키워드들
-    main_genres = ['Hip Hop', 'R&B', 'Rock', 'Pop', 'EDM', 'Electronic', 'Jazz', 'Blues', 'Country', 'Folk']
-    
-    cleaned_genres = []
-    main_genre_found = None
-    
-    # 일반 장르들만 복합 장르 처리
-    for genre in processed_genres:
-        # 대분류 장르 찾기
-        found_main = False
-        for main in main_genres:
-            if main.lower() in genre.lower():
-                if not main_genre_found:
-                    main_genre_found = main
-                    cleaned_genres.append(main)
-                # 복합 장르에서 수식어 추출
-                modifier = genre.replace(main, '').strip()
-                if modifier and modifier.lower() not in meaningless_tags:
-                    cleaned_genres.append(modifier)
-                found_main = True
-                break
-        
-        if not found_main:
-            # 대분류가 포함되지 않은 순수 세부 장르
-            cleaned_genres.append(genre)
-    
-    # 특별 처리된 장르들을 마지막에 추가
-    cleaned_genres.extend(special_genres)
-    
-    # 중복 제거하면서 순서 유지
-    unique_genres = []
-    for g in cleaned_genres:
-        g = g.strip()
-        if g and g not in unique_genres and g.lower() not in meaningless_tags:
-            unique_genres.append(g)
-    
-    result = ' / '.join(unique_genres[:4])  # 최대 4개로 제한
-    return result
+    return genre_normalizer.clean_compound(genre_string)
 
 def titlecase_keep_separators(s):
     """장르 문자열의 각 단어를 대문자로 시작하도록 변경"""
-    import re
-    
     # GPT 결과는 이미 잘 정리되어 있으므로 clean_compound_genres 적용하지 않음
-    # 단순히 첫 글자만 대문자로 변경
-    result = re.sub(r'\w+', lambda m: m.group(0).capitalize(), s)
-    return result
+    return genre_normalizer.titlecase(s)
 
 def gpt_genre_refine(genres_list, title="", artist=""):
     """GPT를 사용한 장르 정제 (개선된 에러 처리 및 재시도 로직)"""
     # 입력 검증
     if not genres_list or len(genres_list) == 0:
-        print(f"🤖 GPT 장르 분석 스킵: 입력 장르 없음 - {title} - {artist}")
+        logger.debug("🤖 GPT 장르 분석 스킵: 입력 장르 없음 - %s - %s", title, artist)
         return "Hip Hop"  # 기본값
     
     genres_str = ', '.join([f"'{g}'" for g in genres_list if g and len(g) > 1])
     if not genres_str:
-        print(f"🤖 GPT 장르 분석 스킵: 유효한 장르 없음 - {title} - {artist}")
+        logger.debug("🤖 GPT 장르 분석 스킵: 유효한 장르 없음 - %s - %s", title, artist)
         return "Hip Hop"  # 기본값
     
     song_info = f"{title} - {artist}" if title and artist else "Unknown Song"
-    print(f"🤖 GPT 장르 분석 시작: {song_info}")
-    print(f"🤖 입력 장르들: {genres_str}")
+    logger.debug("🤖 GPT 장르 분석 시작: %s", song_info)
+    logger.debug("🤖 입력 장르들: %s", genres_str)
     
     prompt = prompt_manager.get_genre_refine_prompt(genres_str)
     request_config = create_gpt_request(prompt)
     
+    import openai
     client = openai.OpenAI(api_key=config.openai_api_key)
     
     # 재시도 로직
@@ -596,123 +510,75 @@ def gpt_genre_refine(genres_list, title="", artist=""):
     for attempt in range(max_retries):
         try:
             # 타임아웃 설정으로 블로킹 방지
-            response = client.chat.completions.create(timeout=20, **request_config)
+            with metrics.timer(STAGE_GPT):
+                response = client.chat.completions.create(timeout=20, **request_config)
             result = response.choices[0].message.content.strip()
             
             # 결과 검증
             if not result or len(result) < 3:
-                print(f"🤖 GPT 응답 부족: '{result}' - 기본값 사용")
+                logger.debug("🤖 GPT 응답 부족: '%s' - 기본값 사용", result)
                 return "Hip Hop"
             
-            # 지역 장르 후처리 필터링 적용
-            filtered_result = filter_regional_genres(result)
-            final_result = titlecase_keep_separators(filtered_result)
+            # 지역 장르 필터링 + 대문자 변환 (한 번에 처리)
+            final_result = genre_normalizer.refine(result)
             
-            if result != filtered_result:
-                print(f"🤖 GPT 원본 결과: {result}")
-                print(f"🚫 지역 장르 필터링 후: {filtered_result}")
+            if result != final_result:
+                logger.debug("🤖 GPT 원본 결과: %s", result)
+                logger.debug("🚫 지역 장르 필터링 후: %s", final_result)
             
-            print(f"🤖 GPT 장르 분석 완료: {song_info} -> {final_result}")
+            logger.debug("🤖 GPT 장르 분석 완료: %s -> %s", song_info, final_result)
             return final_result
             
         except Exception as e:
             error_msg = str(e).lower()
             if "timeout" in error_msg:
-                print(f"🚨 GPT API 타임아웃 (시도 {attempt + 1}/{max_retries}): {song_info}")
+                metrics.count('gpt', EVENT_TIMEOUT)
+                logger.warning("🚨 GPT API 타임아웃 (시도 %s/%s): %s", attempt + 1, max_retries, song_info)
                 if attempt < max_retries - 1:
+                    metrics.count('gpt', EVENT_RETRY)
                     time.sleep(2)  # 재시도 전 대기
                     continue
             elif "rate limit" in error_msg or "429" in error_msg:
-                print(f"🚨 GPT API Rate Limit (시도 {attempt + 1}/{max_retries}): {song_info}")
+                metrics.count('gpt', EVENT_RATE_LIMITED)
+                logger.warning("🚨 GPT API Rate Limit (시도 %s/%s): %s", attempt + 1, max_retries, song_info)
                 if attempt < max_retries - 1:
+                    metrics.count('gpt', EVENT_RETRY)
                     time.sleep(5)  # Rate Limit 시 더 긴 대기
                     continue
             elif "api key" in error_msg or "401" in error_msg:
-                print(f"🚨 GPT API 키 오류: {error_msg}")
+                metrics.count('gpt', EVENT_ERROR)
+                logger.warning("🚨 GPT API 키 오류: %s", error_msg)
                 return "Hip Hop"  # API 키 문제는 재시도 불가
             else:
-                print(f"🚨 GPT API 오류 (시도 {attempt + 1}/{max_retries}): {error_msg}")
+                metrics.count('gpt', EVENT_ERROR)
+                logger.warning("🚨 GPT API 오류 (시도 %s/%s): %s", attempt + 1, max_retries, error_msg)
                 if attempt < max_retries - 1:
+                    metrics.count('gpt', EVENT_RETRY)
                     time.sleep(1)
                     continue
     
     # 모든 재시도 실패
-    print(f"🚨 GPT API {max_retries}회 재시도 실패: {song_info} - 기본값 반환")
+    logger.warning("🚨 GPT API %s회 재시도 실패: %s - 기본값 반환", max_retries, song_info)
     return "Hip Hop"  # 기본값 반환
 
 def filter_regional_genres(genre_result):
     """지역 장르 후처리 필터링 (언어명, 국가명, 지역명 완전 제거)"""
-    # 제거할 지역/언어/국가 태그들
-    regional_terms = [
-        # 지역 힙합
-        "Southern Hip Hop", "southern hip hop",
-        "East Coast Hip Hop", "east coast hip hop", 
-        "West Coast Hip Hop", "west coast hip hop",
-        "Midwest Hip Hop", "midwest hip hop",
-        # 지역명 단독
-        "Southern", "East Coast", "West Coast", "Midwest",
-        # 언어명
-        "English", "American", "British", "German", "French", 
-        "Italian", "Spanish", "Japanese", "Chinese", "Korean",
-        # 국가명
-        "USA", "US", "UK", "Germany", "France", "Italy", "Spain", "Japan", "China",
-        # 연도 관련
-        "2010s", "2000s", "1990s", "90s", "00s", "10s", "20s"
-    ]
-    
-    genres = [g.strip() for g in genre_result.split('/')]
-    filtered_genres = []
-    
-    for genre in genres:
-        # 빈 장르 제거
-        if not genre.strip():
-            continue
-            
-        # 지역/언어/국가 태그가 포함되어 있으면 제외
-        is_filtered = False
-        genre_lower = genre.lower()
-        
-        for regional in regional_terms:
-            if regional.lower() == genre_lower or regional.lower() in genre_lower:
-                print(f"🚫 지역/언어 장르 필터링: '{genre}' 제외됨")
-                is_filtered = True
-                break
-        
-        # 허용 예외 처리 (이미 허용된 장르들은 보존)
-        allowed_exceptions = ["uk drill", "k-pop", "k-rap", "latin", "afrobeats", "hardcore"]
-        if is_filtered:
-            for exception in allowed_exceptions:
-                if exception in genre_lower:
-                    print(f"✅ 예외 허용: '{genre}' 유지됨")
-                    is_filtered = False
-                    break
-        
-        if not is_filtered:
-            filtered_genres.append(genre)
-    
-    # 필터링 후 장르가 부족하면 기본 장르 추가
-    if len(filtered_genres) < 1:
-        filtered_genres = ["Hip Hop"]
-    elif len(filtered_genres) < 2:
-        if "Hip Hop" not in ' / '.join(filtered_genres):
-            filtered_genres.insert(0, "Hip Hop")
-    
-    result = ' / '.join(filtered_genres[:4])  # 최대 4개로 제한
-    return result
+    return genre_normalizer.filter_regional(genre_result)
 
-def gpt_direct_recommendation(title, artist):
-    """GPT 단독 추천 (개선된 에러 처리 및 재시도 로직)"""
+def gpt_direct_recommendation(title, artist, hint_genres=None):
+    """GPT 단독 추천 (개선된 에러 처리 및 재시도 로직, hint_genres는 프롬프트에 참고 장르로 추가)"""
     # 입력 검증
     if not title or not artist or len(title.strip()) < 2 or len(artist.strip()) < 2:
-        print(f"🤖 GPT 단독 추천 스킵: 입력 부족 - {title} - {artist}")
+        logger.debug("🤖 GPT 단독 추천 스킵: 입력 부족 - %s - %s", title, artist)
         return "Hip Hop"  # 기본값
     
-    print(f"🤖 GPT 단독 추천 시작: {title} - {artist}")
-    prompt = prompt_manager.get_direct_recommendation_prompt(title, artist)
+    logger.debug("🤖 GPT 단독 추천 시작: %s - %s", title, artist)
+    prompt = prompt_manager.get_direct_recommendation_prompt(title, artist, hint_genres=hint_genres)
     
     # 직접 추천에서는 정확성 우선 시스템 메시지 사용
     request_config = create_gpt_request(prompt, prompt_manager.SYSTEM_MESSAGE_DIRECT)
     
+    import openai
     client = openai.OpenAI(api_key=config.openai_api_key)
     
     # 재시도 로직
@@ -720,94 +586,139 @@ def gpt_direct_recommendation(title, artist):
     for attempt in range(max_retries):
         try:
             # 타임아웃 설정으로 블로킹 방지
-            response = client.chat.completions.create(timeout=20, **request_config)
+            with metrics.timer(STAGE_GPT):
+                response = client.chat.completions.create(timeout=20, **request_config)
             result = response.choices[0].message.content.strip()
             
             # 결과 검증
             if not result or len(result) < 3:
-                print(f"🤖 GPT 응답 부족: '{result}' - 기본값 사용")
+                logger.debug("🤖 GPT 응답 부족: '%s' - 기본값 사용", result)
                 return "Hip Hop"
             
-            # 지역 장르 후처리 필터링 적용
-            filtered_result = filter_regional_genres(result)
-            final_result = titlecase_keep_separators(filtered_result)
+            # 지역 장르 필터링 + 대문자 변환 (한 번에 처리)
+            final_result = genre_normalizer.refine(result)
             
-            if result != filtered_result:
-                print(f"🤖 GPT 원본 결과: {result}")
-                print(f"🚫 지역 장르 필터링 후: {filtered_result}")
+            if result != final_result:
+                logger.debug("🤖 GPT 원본 결과: %s", result)
+                logger.debug("🚫 지역 장르 필터링 후: %s", final_result)
             
-            print(f"🤖 GPT 단독 추천 완료: {title} - {artist} -> {final_result}")
+            logger.debug("🤖 GPT 단독 추천 완료: %s - %s -> %s", title, artist, final_result)
             return final_result
             
         except Exception as e:
             error_msg = str(e).lower()
             if "timeout" in error_msg:
-                print(f"🚨 GPT API 타임아웃 (시도 {attempt + 1}/{max_retries}): {title} - {artist}")
+                metrics.count('gpt', EVENT_TIMEOUT)
+                logger.warning("🚨 GPT API 타임아웃 (시도 %s/%s): %s - %s", attempt + 1, max_retries, title, artist)
                 if attempt < max_retries - 1:
+                    metrics.count('gpt', EVENT_RETRY)
                     time.sleep(2)  # 재시도 전 대기
                     continue
             elif "rate limit" in error_msg or "429" in error_msg:
-                print(f"🚨 GPT API Rate Limit (시도 {attempt + 1}/{max_retries}): {title} - {artist}")
+                metrics.count('gpt', EVENT_RATE_LIMITED)
+                logger.warning("🚨 GPT API Rate Limit (시도 %s/%s): %s - %s", attempt + 1, max_retries, title, artist)
                 if attempt < max_retries - 1:
+                    metrics.count('gpt', EVENT_RETRY)
                     time.sleep(5)  # Rate Limit 시 더 긴 대기
                     continue
             elif "api key" in error_msg or "401" in error_msg:
-                print(f"🚨 GPT API 키 오류: {error_msg}")
+                metrics.count('gpt', EVENT_ERROR)
+                logger.warning("🚨 GPT API 키 오류: %s", error_msg)
                 return "Hip Hop"  # API 키 문제는 재시도 불가
             else:
-                print(f"🚨 GPT API 오류 (시도 {attempt + 1}/{max_retries}): {error_msg}")
+                metrics.count('gpt', EVENT_ERROR)
+                logger.warning("🚨 GPT API 오류 (시도 %s/%s): %s", attempt + 1, max_retries, error_msg)
                 if attempt < max_retries - 1:
+                    metrics.count('gpt', EVENT_RETRY)
                     time.sleep(1)
                     continue
     
     # 모든 재시도 실패
-    print(f"🚨 GPT API {max_retries}회 재시도 실패: {title} - {artist} - 기본값 반환")
+    logger.warning("🚨 GPT API %s회 재시도 실패: %s - %s - 기본값 반환", max_retries, title, artist)
     return "Hip Hop"  # 기본값 반환
 
 CACHE_FILE = ".genre_cache.pkl"
 
+# Spotify 보강 단계: 동시 조회 스레드 수와 GPT 정제 전 결과 대기 시간(초)
+SPOTIFY_WORKERS = 4
+SPOTIFY_WAIT_TIMEOUT = 15
+
 class PersistentGenreCache:
-    def __init__(self, cache_file=CACHE_FILE):
+    def __init__(self, cache_file=CACHE_FILE, background=True):
         self.cache_file = cache_file
         self.lock = threading.Lock()
-        self._cache = self._load_cache()
+        self._cache = {}
+        self._loaded = threading.Event()
+        if background:
+            # 앱 시작을 막지 않도록 캐시 파일은 백그라운드 스레드에서 로드
+            threading.Thread(target=self._load_in_background, name="genre-cache-loader", daemon=True).start()
+        else:
+            self._load_in_background()
+    
+    def _load_in_background(self):
+        try:
+            self._cache = self._load_cache()
+        finally:
+            self._loaded.set()
+    
+    def wait_until_loaded(self, timeout=None):
+        """캐시 로드 완료 대기"""
+        return self._loaded.wait(timeout)
     
     def _load_cache(self):
         try:
             with open(self.cache_file, "rb") as f:
-                print(f"[캐시] 파일에서 캐시 로드: {self.cache_file}")
+                logger.info("[캐시] 파일에서 캐시 로드: %s", self.cache_file)
                 return pickle.load(f)
         except Exception:
-            print(f"[캐시] 새 캐시 생성: {self.cache_file}")
+            logger.info("[캐시] 새 캐시 생성: %s", self.cache_file)
             return {}
     
     def save(self):
+        self._loaded.wait()
         with self.lock:
             try:
                 with open(self.cache_file, "wb") as f:
                     pickle.dump(self._cache, f)
-                print(f"[캐시] 파일로 저장 완료: {self.cache_file}")
+                logger.info("[캐시] 파일로 저장 완료: %s", self.cache_file)
             except Exception as e:
-                print(f"[캐시] 저장 실패: {e}")
+                logger.error("[캐시] 저장 실패: %s", e)
     
     def get(self, key):
+        self._loaded.wait()
         return self._cache.get(key)
     
     def set(self, key, value):
-        self._cache[key] = value
+        self._loaded.wait()
+        with self.lock:
+            self._cache[key] = value
+    
+    def update(self, key, **fields):
+        """항목의 일부 필드만 갱신 (곡별 장르와 Spotify 정보를 한 항목에 보관)
+        기존 캐시의 문자열 값은 {'genre': 값}으로 취급한다."""
+        self._loaded.wait()
+        with self.lock:
+            entry = self._cache.get(key)
+            if not isinstance(entry, dict):
+                entry = {'genre': entry} if entry else {}
+            self._cache[key] = {**entry, **fields}
     
     def __contains__(self, key):
+        self._loaded.wait()
         return key in self._cache
 
 class MusicGenreService:
     """MusicBrainz + Discogs API를 사용한 장르 정보 서비스 (지속성 캐시 지원)"""
     
     def __init__(self):
-        musicbrainzngs.set_useragent("SmartGenreTagger", "1.0", "contact@example.com")
-        musicbrainzngs.set_rate_limit(limit_or_interval=1.0, new_requests=1)
+        # MusicBrainz 설정은 get_musicbrainz()에서 첫 검색 시 수행
         self._genre_cache = PersistentGenreCache()
         self._save_counter = 0
         self._stop_requested = False  # 중지 플래그 추가
+        # Spotify 보강 (인증 정보가 있을 때만, 첫 사용 시 생성)
+        self._spotify_search = None
+        self._spotify_executor = None
+        self._spotify_lock = threading.Lock()
 
     def set_stop_flag(self, stop=True):
         """중지 플래그 설정"""
@@ -818,31 +729,138 @@ class MusicGenreService:
         return self._stop_requested
 
     def get_cached_genre(self, title, artist, year=None):
-        # 키 정규화: 소문자 변환, 공백 정리, 특수문자 제거
-        normalized_title = re.sub(r'[^\w\s]', '', title.strip().lower())
-        normalized_artist = re.sub(r'[^\w\s]', '', artist.strip().lower())
-        key = (normalized_title, normalized_artist, str(year) if year else "")
-        result = self._genre_cache.get(key)
+        with metrics.timer(STAGE_CACHE):
+            key = TrackKey.from_tags(title, artist, year)
+            result = self._genre_cache.get(key)
+            if isinstance(result, dict):
+                result = result.get('genre')
+        metrics.count('cache', EVENT_HIT if result else EVENT_MISS)
         if result:
-            print(f"⚡️ 캐시 적중: {title} - {artist} -> {result}")
+            logger.debug("⚡️ 캐시 적중: %s - %s -> %s", title, artist, result)
         return result
 
+    def has_cached_genre(self, title, artist, year=None):
+        """장르 캐시에 추천 결과가 있는지 여부 (지표에 기록하지 않음, 로컬 예측 결과는 캐시되지 않음)"""
+        entry = self._genre_cache.get(TrackKey.from_tags(title, artist, year))
+        return bool(entry.get('genre') if isinstance(entry, dict) else entry)
+
     def set_cached_genre(self, title, artist, year, genre):
-        # 키 정규화: 소문자 변환, 공백 정리, 특수문자 제거
-        normalized_title = re.sub(r'[^\w\s]', '', title.strip().lower())
-        normalized_artist = re.sub(r'[^\w\s]', '', artist.strip().lower())
-        key = (normalized_title, normalized_artist, str(year) if year else "")
-        self._genre_cache.set(key, genre)
+        key = TrackKey.from_tags(title, artist, year)
+        self._genre_cache.update(key, genre=genre)
         self._save_counter += 1
         if self._save_counter % 50 == 0:  # 50곡마다 저장 (더 자주)
             self._genre_cache.save()
-            print(f"[캐시] 자동 저장: {self._save_counter}곡 처리됨")
+            logger.info("[캐시] 자동 저장: %s곡 처리됨", self._save_counter)
 
     def save_cache(self):
         self._genre_cache.save()
+        if self._spotify_search:
+            self._spotify_search.save()
+
+    # ------------------------------------------------------------------
+    # Spotify 보강 (인기도, 트랙 ID, 아티스트 장르)
+    # ------------------------------------------------------------------
+
+    def get_spotify_info(self, title, artist):
+        """캐시된 곡의 Spotify 정보 (id, popularity, url, genres, fetched_at 등) 또는 None
+        매칭은 연도와 무관하므로 연도 없는 곡 키에 저장한다. 유효기간이 지난 정보도 그대로 반환하며,
+        다음에 그 곡을 추천할 때 다시 조회한다."""
+        entry = self._genre_cache.get(TrackKey.from_tags(title, artist))
+        return entry.get('spotify') if isinstance(entry, dict) else None
+
+    def _get_spotify_search(self):
+        """Spotify 검색기 (인증 정보가 없거나 인증에 실패했으면 None)"""
+        if self._spotify_search is None:
+            with self._spotify_lock:
+                if self._spotify_search is None:
+                    from spotify_client import SPOTIFY_KEYS
+                    if config.missing_credentials(SPOTIFY_KEYS):
+                        self._spotify_search = False
+                    else:
+                        from spotify_search import SpotifySearch
+                        from concurrent.futures import ThreadPoolExecutor
+                        self._spotify_executor = ThreadPoolExecutor(
+                            max_workers=SPOTIFY_WORKERS, thread_name_prefix="spotify")
+                        self._spotify_search = SpotifySearch()
+        return self._spotify_search or None
+
+    def _is_spotify_info_fresh(self, info):
+        """Spotify 정보가 검색 캐시(PersistentSpotifyCache)의 유효기간 안에 조회된 것인지 여부
+        조회 시각이 없는 예전 항목은 만료된 것으로 본다."""
+        fetched_at = info.get('fetched_at') if info else None
+        if not fetched_at or not self._spotify_search:
+            return False
+        return time.time() - fetched_at < self._spotify_search.cache.ttl
+
+    def _start_spotify_lookup(self, title, artist):
+        """Spotify 조회를 백그라운드로 시작 (유효한 정보가 이미 있거나 비활성화면 None)"""
+        if self._stop_requested or not title or not artist:
+            return None
+        if not self._get_spotify_search() or self._is_spotify_info_fresh(self.get_spotify_info(title, artist)):
+            return None
+        return self._spotify_executor.submit(self._lookup_spotify, title, artist)
+
+    def _lookup_spotify(self, title, artist):
+        """작업 스레드: 트랙 검색 + 아티스트 장르 조회 후 곡 캐시에 저장"""
+        searcher = self._spotify_search
+        if not searcher:
+            return None
+        try:
+            track = searcher.search_track(title, artist)
+            if not track:
+                return None
+            key = TrackKey.from_tags(title, artist)
+            info = {
+                'id': track['id'],
+                'name': track['name'],
+                'artists': track['artists'],
+                'popularity': track['popularity'],
+                'url': track['external_urls'],
+                'similarity': track['similarity_score'],
+                'genres': searcher.artist_genres(track.get('artist_ids', [])),
+                # 검색 캐시에서 온 결과면 그 결과를 실제로 조회한 시각 (인기도가 그 시점 값이므로)
+                'fetched_at': searcher.cache.cached_at(key) or time.time(),
+            }
+        except Exception as e:
+            from spotify_client import is_auth_error
+            if is_auth_error(e):
+                logger.warning("🚨 Spotify 인증 오류 - Spotify 보강을 끕니다: %s", e)
+                self._spotify_search = False
+            else:
+                logger.warning("🟢 Spotify 조회 오류: %s - %s: %s", title, artist, e)
+            return None
+        self._genre_cache.update(key, spotify=info)
+        logger.debug("🟢 Spotify: %s - %s -> 인기도 %s, 장르 %s", title, artist, info['popularity'], info['genres'])
+        return info
+
+    def _wait_spotify(self, future):
+        """Spotify 조회 결과 대기 (중지 요청 시 취소)"""
+        if future is None:
+            return None
+        if self._stop_requested:
+            future.cancel()
+            return None
+        try:
+            return future.result(timeout=SPOTIFY_WAIT_TIMEOUT)
+        except Exception:
+            return None
+
+    def _with_spotify_genres(self, genres, future, title, artist):
+        """GPT 정제 입력에 Spotify 아티스트 장르 추가 (중복 제외)"""
+        info = self._wait_spotify(future) or self.get_spotify_info(title, artist)
+        if not info or not info.get('genres'):
+            return genres
+        existing = {g.lower() for g in genres}
+        extra = [g for g in info['genres'] if g.lower() not in existing]
+        if extra:
+            logger.debug("🟢 Spotify 장르: %s", extra)
+        return genres + extra
 
     async def get_genre_recommendation_async(self, title, artist, year=None, original_genre=None):
-        """비동기 장르 추천 - 더 빠른 처리를 위해"""
+        """비동기 장르 추천 - 더 빠른 처리를 위해
+        동기 경로와 같이 캐시에 없는 곡만 Spotify 조회를 시작해 아티스트 장르를 GPT 입력에 더한다."""
+        import asyncio
+        spotify_future = None
         try:
             # 중지 요청 체크
             if self._stop_requested:
@@ -855,13 +873,17 @@ class MusicGenreService:
             # 중지 요청 체크
             if self._stop_requested:
                 return "중지됨", ""
+            
+            # 캐시에 없는 곡만 Spotify 조회를 백그라운드로 시작 (아래 원격 검색과 동시에 진행)
+            spotify_future = self._start_spotify_lookup(title, artist)
                 
-            clean_title = clean_title(title)
-            clean_artist = clean_artist(artist)
+            title_clean = clean_title(title)
+            artist_clean = clean_artist(artist)
             
             if year and str(year).isdigit() and int(year) <= 2023:
-                # 구곡은 GPT 단독 추천
-                result = await self._gpt_direct_recommendation_async(clean_title, artist)
+                # 구곡은 GPT 단독 추천 (Spotify 아티스트 장르는 참고 장르로 전달)
+                hint_genres = await self._with_spotify_genres_async([], spotify_future, title, artist)
+                result = await self._gpt_direct_recommendation_async(title_clean, artist, hint_genres)
                 if result != "중지됨":
                     self.set_cached_genre(title, artist, year, result)
                 return result, ""
@@ -869,8 +891,8 @@ class MusicGenreService:
             # 신곡은 비동기 병렬 처리
             if not year or not str(year).isdigit():
                 # 장르와 연도를 동시에 검색
-                mb_task = self._search_musicbrainz_async(clean_title, clean_artist, with_year=True)
-                discogs_task = self._get_discogs_genres_async(clean_title, clean_artist)
+                mb_task = self._search_musicbrainz_async(title_clean, artist_clean, with_year=True)
+                discogs_task = self._get_discogs_genres_async(title_clean, artist_clean)
                 
                 # 병렬 실행
                 mb_result, discogs_result = await asyncio.gather(mb_task, discogs_task, return_exceptions=True)
@@ -881,8 +903,8 @@ class MusicGenreService:
                 discogs_genres = discogs_result if isinstance(discogs_result, list) else []
             else:
                 # 연도가 있는 경우 장르만 검색
-                mb_genres = await self._search_musicbrainz_async(clean_title, clean_artist, with_year=False)
-                discogs_genres = await self._get_discogs_genres_async(clean_title, clean_artist)
+                mb_genres = await self._search_musicbrainz_async(title_clean, artist_clean, with_year=False)
+                discogs_genres = await self._get_discogs_genres_async(title_clean, artist_clean)
                 extracted_year = ""
             
             # 중지 요청 체크
@@ -893,59 +915,72 @@ class MusicGenreService:
             
             if len(mb_genres) >= 3:
                 final_genres = mb_genres
-                print(f"🎼 MusicBrainz만으로 충분: {title} - {artist} -> {final_genres}")
+                logger.debug("🎼 MusicBrainz만으로 충분: %s - %s -> %s", title, artist, final_genres)
             else:
-                discogs_genres = get_discogs_genres(clean_title, clean_artist)
+                discogs_genres = get_discogs_genres(title_clean, artist_clean)
                 
                 # 중지 요청 체크
                 if self._stop_requested:
-                    print(f"🛑 중지 요청으로 인한 조기 종료: {title} - {artist}")
+                    logger.debug("🛑 중지 요청으로 인한 조기 종료: %s - %s", title, artist)
                     return "중지됨", ""
                     
                 final_genres = list(dict.fromkeys(mb_genres + discogs_genres))
-                print(f"🎼 MusicBrainz 장르: {mb_genres}")
-                print(f"🎧 Discogs 장르: {discogs_genres}")
-                print(f"🎼 통합 장르 리스트: {title} - {artist} -> {final_genres}")
+                logger.debug("🎼 MusicBrainz 장르: %s", mb_genres)
+                logger.debug("🎧 Discogs 장르: %s", discogs_genres)
+                logger.debug("🎼 통합 장르 리스트: %s - %s -> %s", title, artist, final_genres)
+            
+            # Spotify 아티스트 장르를 GPT 정제 입력에 추가
+            final_genres = await self._with_spotify_genres_async(final_genres, spotify_future, title, artist)
                 
             if final_genres:
                 try:
                     # 중지 요청 체크
                     if self._stop_requested:
-                        print(f"🛑 중지 요청으로 인한 조기 종료: {title} - {artist}")
+                        logger.debug("🛑 중지 요청으로 인한 조기 종료: %s - %s", title, artist)
                         return "중지됨", ""
                     
                     # Rate Limited 장르 필터링
                     filtered_genres = [g for g in final_genres if g != 'Rate Limited']
                     if not filtered_genres:
-                        print(f"⚠️ 모든 API가 Rate Limited 상태: {title} - {artist}")
+                        logger.warning("⚠️ 모든 API가 Rate Limited 상태: %s - %s", title, artist)
                         if original_genre:
                             return original_genre, extracted_year
                         return "Hip Hop", extracted_year
                         
-                    print(f"🤖 GPT에게 전달할 장르들: {filtered_genres}")
-                    gpt_result = gpt_genre_refine(filtered_genres, clean_title, clean_artist)
-                    print(f"🤖 GPT 최종 장르 추천: {gpt_result}")
+                    # 연도/아티스트명 장르 제거 (한 번의 순회)
+                    filtered_genres = self._filter_for_gpt(filtered_genres, artist)
+                    logger.debug("🤖 GPT에게 전달할 장르들: %s", filtered_genres)
+                    gpt_result = gpt_genre_refine(filtered_genres, title_clean, artist_clean)
+                    logger.info("🎵 장르 추천 완료 (GPT): %s - %s -> %s", title, artist, gpt_result)
                     self.set_cached_genre(title, artist, year, gpt_result)
                     return gpt_result, extracted_year
                 except Exception as gpt_err:
-                    print(f"GPT 호출 오류: {gpt_err}")
+                    logger.warning("GPT 호출 오류: %s", gpt_err)
                     
-            print(f"❌ 장르 정보를 찾을 수 없음")
+            logger.warning("❌ 장르 정보를 찾을 수 없음")
             if original_genre:
-                print(f"➡️ 기존 장르 정보로 대체: {original_genre}")
+                logger.debug("➡️ 기존 장르 정보로 대체: %s", original_genre)
                 self.set_cached_genre(title, artist, year, original_genre)
                 return original_genre, extracted_year
-            print(f"🎵 ===== 장르 추천 완료 (Unknown) =====")
-            print(f"🎵 최종 결과: {title} - {artist} -> Unknown Genre")
-            print(f"🎵 =====================================\n")
+            logger.info("🎵 장르 추천 완료 (Unknown): %s - %s -> Unknown Genre", title, artist)
             return "Unknown Genre", extracted_year
         except Exception as e:
-            print(f"❌ 장르 검색 오류: {e}")
+            logger.warning("❌ 장르 검색 오류: %s", e)
             if original_genre:
-                print(f"➡️ 기존 장르 정보로 대체: {original_genre}")
+                logger.debug("➡️ 기존 장르 정보로 대체: %s", original_genre)
                 self.set_cached_genre(title, artist, year, original_genre)
                 return original_genre, ""
             return f"검색 오류: {str(e)}", ""
+        finally:
+            # 내보내기에 Spotify 정보가 들어가도록 진행 중인 조회를 마저 기다림 (이벤트 루프는 막지 않음)
+            if spotify_future is not None:
+                await asyncio.get_event_loop().run_in_executor(None, self._wait_spotify, spotify_future)
+    
+    async def _with_spotify_genres_async(self, genres, future, title, artist):
+        """비동기 Spotify 장르 추가 (조회 결과 대기는 스레드 풀에서)"""
+        import asyncio
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(None, self._with_spotify_genres, genres, future, title, artist)
     
     async def _search_musicbrainz_async(self, title, artist, with_year=True):
         """비동기 MusicBrainz 검색"""
@@ -956,6 +991,7 @@ class MusicGenreService:
                 return self._search_musicbrainz_genres_only(title, artist)
         
         # CPU 집약적 작업을 스레드 풀에서 실행
+        import asyncio
         loop = asyncio.get_event_loop()
         return await loop.run_in_executor(None, sync_search)
     
@@ -964,6 +1000,7 @@ class MusicGenreService:
         def sync_discogs():
             return get_discogs_genres(title, artist)
         
+        import asyncio
         loop = asyncio.get_event_loop()
         return await loop.run_in_executor(None, sync_discogs)
     
@@ -974,72 +1011,123 @@ class MusicGenreService:
                 return "중지됨"
             return gpt_genre_refine(genres_list, title, artist)
         
+        import asyncio
         loop = asyncio.get_event_loop()
         return await loop.run_in_executor(None, sync_gpt)
     
-    async def _gpt_direct_recommendation_async(self, title, artist):
+    async def _gpt_direct_recommendation_async(self, title, artist, hint_genres=None):
         """비동기 GPT 직접 추천"""
         def sync_gpt():
             if self._stop_requested:
                 return "중지됨"
-            return gpt_direct_recommendation(title, artist)
+            return gpt_direct_recommendation(title, artist, hint_genres)
         
+        import asyncio
         loop = asyncio.get_event_loop()
         return await loop.run_in_executor(None, sync_gpt)
 
-    def get_genre_recommendation(self, title, artist, year=None, original_genre=None):
-        """기존 동기 메서드 유지 (호환성을 위해)"""
+    def get_genre_recommendation(self, title, artist, year=None, original_genre=None, path=None):
+        """장르 추천 - 캐시에 없는 곡은 Spotify 조회를 같은 곡의 MusicBrainz/Discogs/GPT 처리와 동시에 진행
+        Spotify 결과(인기도, 트랙 ID, 아티스트 장르)는 get_spotify_info()로 조회할 수 있다.
+        path가 있고 로컬 장르 예측 모델(genre_prior)이 학습되어 있으면 오디오 특징 예측을 먼저 사용한다."""
+        with metrics.timer(STAGE_RECOMMEND):
+            return self._recommend_genre(title, artist, year, original_genre, path)
+
+    # ------------------------------------------------------------------
+    # 로컬 장르 예측 (오디오 특징 기반, 원격 호출 없음)
+    # ------------------------------------------------------------------
+
+    def _local_genre_prior(self, path):
+        """(장르, 확률) 또는 None (경로가 없거나 모델이 없거나 분석 실패)"""
+        if not path:
+            return None
+        from genre_prior import genre_prior
+        if not genre_prior.available():
+            return None
         try:
-            print(f"🎵 ===== 장르 추천 시작 =====")
-            print(f"🎵 곡명: {title}")
-            print(f"🎵 아티스트: {artist}")
-            print(f"🎵 연도: {year}")
+            with metrics.timer(STAGE_LOCAL_PRIOR):
+                return genre_prior.predict_file(path)
+        except Exception as e:
+            metrics.count('local_prior', EVENT_ERROR)
+            logger.warning("🧠 로컬 장르 예측 오류 %s: %s", os.path.basename(path), e)
+            return None
+
+    def _with_prior_hint(self, genres, prior):
+        """GPT 정제 입력에 로컬 예측 장르 추가 (힌트 확률 이상일 때만, 중복 제외)"""
+        from genre_prior import HINT_PROBABILITY
+        if not prior or prior[1] < HINT_PROBABILITY:
+            return genres
+        if prior[0].lower() in {g.lower() for g in genres}:
+            return genres
+        logger.debug("🧠 로컬 예측 장르 힌트: %s (%.0f%%)", prior[0], prior[1] * 100)
+        return genres + [prior[0]]
+
+    def _recommend_genre(self, title, artist, year, original_genre, path=None):
+        """기존 동기 추천 로직
+        Spotify 조회는 장르 캐시에 없고 로컬 예측으로 끝나지 않는 곡만 시작하고, GPT 호출(정제/단독 추천) 직전과
+        추천이 끝날 때 결과를 기다린다. (캐시 적중과 확실한 로컬 예측은 Spotify를 기다리지 않고 바로 반환)"""
+        spotify_future = None
+        try:
+            logger.debug("🎵 장르 추천 시작: %s - %s (%s)", title, artist, year)
             
             # 중지 요청 체크
             if self._stop_requested:
-                print(f"🛑 중지 요청으로 인한 조기 종료: {title} - {artist}")
+                logger.debug("🛑 중지 요청으로 인한 조기 종료: %s - %s", title, artist)
                 return "중지됨", ""
                 
             cache_hit = self.get_cached_genre(title, artist, year)
             if cache_hit:
-                print(f"⚡️ 캐시 적중: {title} - {artist} ({year}) -> {cache_hit}")
-                print(f"🎵 ===== 장르 추천 완료 (캐시) =====\n")
+                logger.debug("⚡️ 캐시 적중: %s - %s (%s) -> %s", title, artist, year, cache_hit)
+                logger.info("🎵 장르 추천 완료 (캐시): %s - %s -> %s", title, artist, cache_hit)
                 return cache_hit, ""
                 
             # 중지 요청 체크
             if self._stop_requested:
-                print(f"🛑 중지 요청으로 인한 조기 종료: {title} - {artist}")
+                logger.debug("🛑 중지 요청으로 인한 조기 종료: %s - %s", title, artist)
                 return "중지됨", ""
+            
+            # 로컬 예측이 충분히 확실하면 원격 검색(Spotify 포함) 생략
+            from genre_prior import CONFIDENT_PROBABILITY
+            prior = self._local_genre_prior(path)
+            if prior and prior[1] >= CONFIDENT_PROBABILITY:
+                logger.debug("🧠 로컬 장르 예측: %s - %s -> %s (%.0f%%), 원격 검색 생략", title, artist, prior[0], prior[1] * 100)
+                metrics.count('local_prior', EVENT_HIT)
+                # 분류기 추정(대분류 하나)은 장르 캐시에 넣지 않음 - 잘못 예측해도 다음 실행에서 원격 검색으로 바로잡을 수 있게
+                logger.info("🎵 장르 추천 완료 (로컬 예측): %s - %s -> %s", title, artist, prior[0])
+                return prior[0], ""
+            
+            # 원격 검색으로 가는 곡만 Spotify 조회를 백그라운드로 시작 (아래 원격 검색과 동시에 진행)
+            spotify_future = self._start_spotify_lookup(title, artist)
                 
-            print(f"🔍 장르 검색 시작 연도 {year}: {title} - {artist}")
+            logger.debug("🔍 장르 검색 시작 연도 %s: %s - %s", year, title, artist)
             clean = clean_title(title)
             if clean != title:
-                print(f"  ⮕ 전처리된 곡명: {clean}")
+                logger.debug("  ⮕ 전처리된 곡명: %s", clean)
             title_for_search = clean
             artist_clean = clean_artist(artist)
             if artist_clean != artist:
-                print(f"  ⮕ 전처리된 아티스트명: {artist_clean}")
+                logger.debug("  ⮕ 전처리된 아티스트명: %s", artist_clean)
             artist_for_search = artist_clean
             
             if year and str(year).isdigit() and int(year) <= 2023:
                 # 중지 요청 체크
                 if self._stop_requested:
-                    print(f"🛑 중지 요청으로 인한 조기 종료: {title} - {artist}")
+                    logger.debug("🛑 중지 요청으로 인한 조기 종료: %s - %s", title, artist)
                     return "중지됨", ""
                     
-                print(f"🎯 구곡(GPT 단독 추천): {title} - {artist} ({year})")
-                result = gpt_direct_recommendation(title_for_search, artist)
+                logger.debug("🎯 구곡(GPT 단독 추천): %s - %s (%s)", title, artist, year)
+                # Spotify 아티스트 장르는 참고 장르로 프롬프트에 전달
+                hint_genres = self._with_spotify_genres([], spotify_future, title, artist)
+                result = gpt_direct_recommendation(title_for_search, artist, hint_genres)
                 
                 # 중지 요청 체크
                 if self._stop_requested:
-                    print(f"🛑 중지 요청으로 인한 조기 종료: {title} - {artist}")
+                    logger.debug("🛑 중지 요청으로 인한 조기 종료: %s - %s", title, artist)
                     return "중지됨", ""
                     
-                print(f"🎯 GPT 단독 추천 결과: {result}")
+                logger.debug("🎯 GPT 단독 추천 결과: %s", result)
                 self.set_cached_genre(title, artist, year, result)
-                print(f"🎵 ===== 장르 추천 완료 (구곡) =====")
-                print(f"🎵 최종 결과: {title} - {artist} -> {result}")
-                print(f"🎵 =====================================\n")
+                logger.info("🎵 장르 추천 완료 (구곡): %s - %s -> %s", title, artist, result)
                 return result, ""
                 
             # 연도가 없는 경우에만 MusicBrainz에서 장르와 연도를 동시에 가져오기
@@ -1052,64 +1140,71 @@ class MusicGenreService:
             
             # 중지 요청 체크
             if self._stop_requested:
-                print(f"🛑 중지 요청으로 인한 조기 종료: {title} - {artist}")
+                logger.debug("🛑 중지 요청으로 인한 조기 종료: %s - %s", title, artist)
                 return "중지됨", ""
                 
             if len(mb_genres) >= 3:
                 final_genres = mb_genres
-                print(f"🎼 MusicBrainz만으로 충분: {title} - {artist} -> {final_genres}")
+                logger.debug("🎼 MusicBrainz만으로 충분: %s - %s -> %s", title, artist, final_genres)
             else:
                 discogs_genres = get_discogs_genres(title_for_search, artist_for_search)
                 
                 # 중지 요청 체크
                 if self._stop_requested:
-                    print(f"🛑 중지 요청으로 인한 조기 종료: {title} - {artist}")
+                    logger.debug("🛑 중지 요청으로 인한 조기 종료: %s - %s", title, artist)
                     return "중지됨", ""
                     
                 final_genres = list(dict.fromkeys(mb_genres + discogs_genres))
-                print(f"🎼 MusicBrainz 장르: {mb_genres}")
-                print(f"🎧 Discogs 장르: {discogs_genres}")
-                print(f"🎼 통합 장르 리스트: {title} - {artist} -> {final_genres}")
+                logger.debug("🎼 MusicBrainz 장르: %s", mb_genres)
+                logger.debug("🎧 Discogs 장르: %s", discogs_genres)
+                logger.debug("🎼 통합 장르 리스트: %s - %s -> %s", title, artist, final_genres)
                 
+            # Spotify 아티스트 장르와 로컬 예측 장르를 GPT 정제 입력에 추가 (Spotify 조회는 검색 시작과 동시에 진행 중)
+            final_genres = self._with_spotify_genres(final_genres, spotify_future, title, artist)
+            final_genres = self._with_prior_hint(final_genres, prior)
+            
             if final_genres:
                 try:
                     # 중지 요청 체크
                     if self._stop_requested:
-                        print(f"🛑 중지 요청으로 인한 조기 종료: {title} - {artist}")
+                        logger.debug("🛑 중지 요청으로 인한 조기 종료: %s - %s", title, artist)
                         return "중지됨", ""
                     
                     # Rate Limited 장르 필터링
                     filtered_genres = [g for g in final_genres if g != 'Rate Limited']
                     if not filtered_genres:
-                        print(f"⚠️ 모든 API가 Rate Limited 상태: {title} - {artist}")
+                        logger.warning("⚠️ 모든 API가 Rate Limited 상태: %s - %s", title, artist)
                         if original_genre:
                             return original_genre, extracted_year
                         return "Hip Hop", extracted_year
                         
-                    print(f"🤖 GPT에게 전달할 장르들: {filtered_genres}")
+                    # 연도/아티스트명 장르 제거 (한 번의 순회)
+                    filtered_genres = self._filter_for_gpt(filtered_genres, artist)
+                    logger.debug("🤖 GPT에게 전달할 장르들: %s", filtered_genres)
                     gpt_result = gpt_genre_refine(filtered_genres, title_for_search, artist_for_search)
-                    print(f"🤖 GPT 최종 장르 추천: {gpt_result}")
+                    logger.info("🎵 장르 추천 완료 (GPT): %s - %s -> %s", title, artist, gpt_result)
                     self.set_cached_genre(title, artist, year, gpt_result)
                     return gpt_result, extracted_year
                 except Exception as gpt_err:
-                    print(f"GPT 호출 오류: {gpt_err}")
+                    logger.warning("GPT 호출 오류: %s", gpt_err)
                     
-            print(f"❌ 장르 정보를 찾을 수 없음")
+            logger.warning("❌ 장르 정보를 찾을 수 없음")
             if original_genre:
-                print(f"➡️ 기존 장르 정보로 대체: {original_genre}")
+                logger.debug("➡️ 기존 장르 정보로 대체: %s", original_genre)
                 self.set_cached_genre(title, artist, year, original_genre)
                 return original_genre, extracted_year
-            print(f"🎵 ===== 장르 추천 완료 (Unknown) =====")
-            print(f"🎵 최종 결과: {title} - {artist} -> Unknown Genre")
-            print(f"🎵 =====================================\n")
+            logger.info("🎵 장르 추천 완료 (Unknown): %s - %s -> Unknown Genre", title, artist)
             return "Unknown Genre", extracted_year
         except Exception as e:
-            print(f"❌ 장르 검색 오류: {e}")
+            logger.warning("❌ 장르 검색 오류: %s", e)
             if original_genre:
-                print(f"➡️ 기존 장르 정보로 대체: {original_genre}")
+                logger.debug("➡️ 기존 장르 정보로 대체: %s", original_genre)
                 self.set_cached_genre(title, artist, year, original_genre)
                 return original_genre, ""
             return f"검색 오류: {str(e)}", ""
+        finally:
+            # 내보내기/일괄 결과에 Spotify 정보가 들어가도록 진행 중인 조회를 마저 기다림
+            self._wait_spotify(spotify_future)
     
     def _search_musicbrainz_with_year(self, title, artist):
         """MusicBrainz에서 장르와 연도 정보를 동시에 검색 (개선된 Rate Limit 대응)"""
@@ -1118,10 +1213,11 @@ class MusicGenreService:
         try:
             # 중지 요청 체크
             if self._stop_requested:
-                print(f"🛑 MusicBrainz 검색 중지: {title} - {artist}")
+                logger.debug("🛑 MusicBrainz 검색 중지: %s - %s", title, artist)
                 return [], ""
                 
-            print(f"📀 MusicBrainz 검색 (장르+연도): {title} - {artist}")
+            logger.debug("📀 MusicBrainz 검색 (장르+연도): %s - %s", title, artist)
+            musicbrainzngs = get_musicbrainz()
             query = f'recording:"{title}" AND artist:"{artist}"'
             
             # 지수 백오프를 위한 변수들
@@ -1132,23 +1228,24 @@ class MusicGenreService:
                 try:
                     # 중지 요청 체크
                     if self._stop_requested:
-                        print(f"🛑 MusicBrainz 검색 중지: {title} - {artist}")
+                        logger.debug("🛑 MusicBrainz 검색 중지: %s - %s", title, artist)
                         return [], ""
                     
                     # 타임아웃 설정 (15초)
-                    result = musicbrainzngs.search_recordings(query=query, limit=3)
+                    with metrics.timer(STAGE_MUSICBRAINZ_SEARCH):
+                        result = musicbrainzngs.search_recordings(query=query, limit=3)
                     
                     for recording in result.get('recording-list', []):
                         # 중지 요청 체크
                         if self._stop_requested:
-                            print(f"🛑 MusicBrainz 처리 중지: {title} - {artist}")
+                            logger.debug("🛑 MusicBrainz 처리 중지: %s - %s", title, artist)
                             return [], ""
                         
                         # 연도 추출 (첫 번째 레코딩에서만)
                         if not extracted_year and 'first-release-date' in recording and recording['first-release-date']:
                             extracted_year = recording['first-release-date'][:4]
                             if extracted_year.isdigit():
-                                print(f"📅 연도 추출: {title} - {artist} -> {extracted_year}")
+                                logger.debug("📅 연도 추출: %s - %s -> %s", title, artist, extracted_year)
                                 
                         # 장르 추출
                         if 'tag-list' in recording:
@@ -1165,51 +1262,59 @@ class MusicGenreService:
                                     try:
                                         # 중지 요청 체크
                                         if self._stop_requested:
-                                            print(f"🛑 MusicBrainz 아티스트 검색 중지: {title} - {artist}")
+                                            logger.debug("🛑 MusicBrainz 아티스트 검색 중지: %s - %s", title, artist)
                                             return genres, extracted_year
                                         
                                         # 아티스트 정보 가져오기 (타임아웃 10초)
-                                        artist_info = musicbrainzngs.get_artist_by_id(artist_id, includes=['tags'])
+                                        with metrics.timer(STAGE_MUSICBRAINZ_ARTIST):
+                                            artist_info = musicbrainzngs.get_artist_by_id(artist_id, includes=['tags'])
                                         if 'tag-list' in artist_info['artist']:
                                             for tag in artist_info['artist']['tag-list']:
                                                 tag_name = tag['name'].strip()
                                                 if tag_name and len(tag_name) > 1:  # 의미있는 태그만
                                                     genres.append(tag_name)
                                     except Exception as artist_err:
-                                        print(f"📀 아티스트 정보 가져오기 실패: {artist_err}")
+                                        logger.warning("📀 아티스트 정보 가져오기 실패: %s", artist_err)
                                         continue
                     
                     # 중복 제거
                     genres = list(dict.fromkeys(genres))
-                    print(f"📀 MusicBrainz 결과: {title} - {artist} -> 장르: {genres[:5]}, 연도: {extracted_year}")
+                    logger.debug("📀 MusicBrainz 결과: %s - %s -> 장르: %s, 연도: %s", title, artist, genres[:5], extracted_year)
                     
                     # 성공 시 지연 후 반환
-                    time.sleep(1.5)  # 기본 지연
+                    metrics.count('musicbrainz', EVENT_HIT if genres else EVENT_MISS)
+                    with metrics.timer(STAGE_THROTTLE):
+                        time.sleep(1.5)  # 기본 지연
                     return genres, extracted_year
                     
                 except Exception as e:
                     if '429' in str(e) or 'rate limit' in str(e).lower():
                         # 지수 백오프: 2초, 4초, 8초
                         delay = base_delay * (2 ** attempt)
-                        print(f"📀 MusicBrainz Rate Limit! {delay}초 대기 후 재시도... (시도 {attempt + 1}/{max_retries})")
+                        logger.warning("📀 MusicBrainz Rate Limit! %s초 대기 후 재시도... (시도 %s/%s)", delay, attempt + 1, max_retries)
+                        metrics.count('musicbrainz', EVENT_RATE_LIMITED)
+                        metrics.count('musicbrainz', EVENT_RETRY)
                         time.sleep(delay)
                         continue
                     elif 'timeout' in str(e).lower():
-                        print(f"📀 MusicBrainz 타임아웃: {e}")
+                        logger.warning("📀 MusicBrainz 타임아웃: %s", e)
+                        metrics.count('musicbrainz', EVENT_TIMEOUT)
                         if attempt < max_retries - 1:
+                            metrics.count('musicbrainz', EVENT_RETRY)
                             time.sleep(2)
                             continue
                         else:
                             return [], ""
                     else:
-                        print(f"📀 MusicBrainz 검색 오류: {e}")
+                        logger.warning("📀 MusicBrainz 검색 오류: %s", e)
+                        metrics.count('musicbrainz', EVENT_ERROR)
                         return [], ""
             
-            print(f"📀 MusicBrainz {max_retries}회 재시도 실패, 스킵")
+            logger.warning("📀 MusicBrainz %s회 재시도 실패, 스킵", max_retries)
             return ['Rate Limited'], ""
             
         except Exception as e:
-            print(f"📀 MusicBrainz 검색 오류: {e}")
+            logger.warning("📀 MusicBrainz 검색 오류: %s", e)
             return [], ""
     
     def _search_musicbrainz_genres_only(self, title, artist):
@@ -1218,24 +1323,26 @@ class MusicGenreService:
         try:
             # 중지 요청 체크
             if self._stop_requested:
-                print(f"🛑 MusicBrainz 장르 검색 중지: {title} - {artist}")
+                logger.debug("🛑 MusicBrainz 장르 검색 중지: %s - %s", title, artist)
                 return []
                 
-            print(f"📀 MusicBrainz 검색 (장르만): {title} - {artist}")
+            logger.debug("📀 MusicBrainz 검색 (장르만): %s - %s", title, artist)
+            musicbrainzngs = get_musicbrainz()
             query = f'recording:"{title}" AND artist:"{artist}"'
             try_count = 0
             while try_count < 2:
                 try:
                     # 중지 요청 체크
                     if self._stop_requested:
-                        print(f"🛑 MusicBrainz 장르 검색 중지: {title} - {artist}")
+                        logger.debug("🛑 MusicBrainz 장르 검색 중지: %s - %s", title, artist)
                         return []
                         
-                    result = musicbrainzngs.search_recordings(query=query, limit=3)
+                    with metrics.timer(STAGE_MUSICBRAINZ_SEARCH):
+                        result = musicbrainzngs.search_recordings(query=query, limit=3)
                     for recording in result.get('recording-list', []):
                         # 중지 요청 체크
                         if self._stop_requested:
-                            print(f"🛑 MusicBrainz 장르 처리 중지: {title} - {artist}")
+                            logger.debug("🛑 MusicBrainz 장르 처리 중지: %s - %s", title, artist)
                             return []
                         
                         # 장르 추출만 수행 (연도는 스킵)
@@ -1250,10 +1357,11 @@ class MusicGenreService:
                                     try:
                                         # 중지 요청 체크
                                         if self._stop_requested:
-                                            print(f"🛑 MusicBrainz 아티스트 장르 검색 중지: {title} - {artist}")
+                                            logger.debug("🛑 MusicBrainz 아티스트 장르 검색 중지: %s - %s", title, artist)
                                             return genres
                                             
-                                        artist_info = musicbrainzngs.get_artist_by_id(artist_id, includes=['tags'])
+                                        with metrics.timer(STAGE_MUSICBRAINZ_ARTIST):
+                                            artist_info = musicbrainzngs.get_artist_by_id(artist_id, includes=['tags'])
                                         if 'tag-list' in artist_info['artist']:
                                             for tag in artist_info['artist']['tag-list']:
                                                 tag_name = tag['name'].strip()
@@ -1261,24 +1369,37 @@ class MusicGenreService:
                                     except:
                                         continue
                     genres = list(dict.fromkeys(genres))
-                    print(f"📀 MusicBrainz 결과 (장르만): {title} - {artist} -> {genres}")
-                    time.sleep(1)
+                    logger.debug("📀 MusicBrainz 결과 (장르만): %s - %s -> %s", title, artist, genres)
+                    metrics.count('musicbrainz', EVENT_HIT if genres else EVENT_MISS)
+                    with metrics.timer(STAGE_THROTTLE):
+                        time.sleep(1)
                     return genres
                 except Exception as e:
                     if '429' in str(e):
-                        print("📀 MusicBrainz 429 Rate Limit! 5초 대기 후 재시도...")
+                        logger.warning("📀 MusicBrainz 429 Rate Limit! 5초 대기 후 재시도...")
+                        metrics.count('musicbrainz', EVENT_RATE_LIMITED)
+                        metrics.count('musicbrainz', EVENT_RETRY)
                         time.sleep(5)
                         try_count += 1
                         continue
                     else:
-                        print(f"📀 MusicBrainz 장르 검색 오류: {e}")
+                        logger.warning("📀 MusicBrainz 장르 검색 오류: %s", e)
+                        metrics.count('musicbrainz', EVENT_ERROR)
                         return []
-            print("📀 MusicBrainz 429 Rate Limit 2회 초과, 스킵")
+            logger.warning("📀 MusicBrainz 429 Rate Limit 2회 초과, 스킵")
             return ['Rate Limited']
         except Exception as e:
-            print(f"📀 MusicBrainz 장르 검색 오류: {e}")
+            logger.warning("📀 MusicBrainz 장르 검색 오류: %s", e)
             return []
     
+    def _filter_for_gpt(self, genres, artist):
+        """GPT 정제 입력에서 연도/시대 장르와 아티스트명이 들어간 장르를 한 번의 순회로 제거
+        (모두 걸러지면 원래 목록을 그대로 사용)"""
+        filtered = genre_normalizer.filter_genre_list(genres, clean_artist(artist) or None)
+        if len(filtered) != len(genres):
+            logger.debug("🚫 연도/아티스트명 장르 제외: %s", [g for g in genres if g not in filtered])
+        return filtered or genres
+
     def _combine_genres(self, mb_genres, discogs_genres, artist=None):
         """MusicBrainz와 Discogs 장르 정보를 단순히 합쳐 중복만 제거"""
         return list(dict.fromkeys(mb_genres + discogs_genres))
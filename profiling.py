@@ -0,0 +1,295 @@
+"""
+실행 중 켜고 끄는 프로파일러
+GUI 동작(로드/추천/저장/내보내기)과 일괄 처리 단계마다 두 가지를 폴더에 남긴다.
+    <이름>.prof    cProfile 통계 (python -m pstats, snakeviz 등으로 열기)
+    <이름>.txt     누적 시간 기준 상위 함수 요약
+    <이름>.folded  전체 스레드 벽시계 샘플 (flamegraph.pl, speedscope에서 바로 열 수 있는 접힌 스택 형식)
+cProfile은 동작을 시작한 스레드만 보므로, 작업 스레드에서 기다리는 시간(API 응답, 디스크)은
+일정 간격으로 모든 스레드의 스택을 찍는 샘플러가 채운다.
+
+꺼져 있을 때는 enabled 속성 확인 한 번으로 끝나 데코레이터를 붙여 둬도 부담이 없다.
+환경변수 SMARTGENRETAGGER_PROFILE=폴더 로 시작부터 켜거나, GUI 버튼/CLI --profile로 켠다.
+"""
+
+import os
+import io
+import sys
+import time
+import pstats
+import cProfile
+import logging
+import threading
+from collections import Counter
+from contextlib import contextmanager
+from datetime import datetime
+from functools import wraps
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+PROFILE_ENV = "SMARTGENRETAGGER_PROFILE"
+DEFAULT_PROFILE_DIR = "profiles"
+
+# 벽시계 샘플 간격(초) - 5ms면 샘플러 자체 부담은 작고 1초짜리 동작도 200개 샘플
+SAMPLE_INTERVAL = 0.005
+# .txt 요약에 남길 함수 수
+SUMMARY_LINES = 40
+
+
+def _frame_label(code) -> str:
+    """접힌 스택의 프레임 이름 - 함수 (파일:줄), 구분자 ';'는 쓰지 않음"""
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})".replace(";", ",")
+
+
+def _safe_name(name: str) -> str:
+    return "".join(c if c.isalnum() or c in "-_" else "_" for c in name)
+
+
+def _atomic_write(path: str, text: str):
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+
+
+class _Sampler:
+    """동작이 하나라도 진행 중인 동안 모든 스레드의 스택을 주기적으로 기록"""
+
+    def __init__(self, interval: float = SAMPLE_INTERVAL):
+        self.interval = interval
+        self.lock = threading.Lock()
+        self._sessions: List[Counter] = []
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    def attach(self, samples: Counter):
+        with self.lock:
+            self._sessions.append(samples)
+            if self._thread is None:
+                self._stop.clear()
+                self._thread = threading.Thread(target=self._run, name="profile-sampler", daemon=True)
+                self._thread.start()
+
+    def detach(self, samples: Counter):
+        with self.lock:
+            self._sessions = [s for s in self._sessions if s is not samples]
+            thread = self._thread if not self._sessions else None
+            if thread is not None:
+                self._thread = None
+                self._stop.set()
+        if thread is not None:
+            thread.join()
+
+    def _run(self):
+        own_id = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            names = {t.ident: t.name for t in threading.enumerate()}
+            stacks = []
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_id:
+                    continue
+                labels = []
+                while frame is not None:
+                    labels.append(_frame_label(frame.f_code))
+                    frame = frame.f_back
+                labels.append(names.get(thread_id, str(thread_id)).replace(";", ","))
+                stacks.append(";".join(reversed(labels)))
+            with self.lock:
+                for samples in self._sessions:
+                    samples.update(stacks)
+
+
+class _Session:
+    """진행 중인 동작 하나 (cProfile + 벽시계 샘플)"""
+
+    __slots__ = ('name', 'profile', 'samples', 'started', 'thread_id')
+
+    def __init__(self, name: str):
+        self.name = name
+        self.profile = cProfile.Profile()
+        self.samples: Counter = Counter()
+        self.started = time.perf_counter()
+        self.thread_id = threading.get_ident()
+
+
+class Profiler:
+    """동작별 프로파일 기록기 (전역 profiler 인스턴스로 사용)"""
+
+    def __init__(self, output_dir: Optional[str] = None, interval: float = SAMPLE_INTERVAL):
+        self.enabled = False
+        self.output_dir = None
+        self.lock = threading.Lock()
+        self._sampler = _Sampler(interval)
+        self._local = threading.local()
+        self._totals: Dict[str, pstats.Stats] = {}
+        self._calls: Dict[str, int] = {}
+        self._seq = 0
+        output_dir = output_dir or os.environ.get(PROFILE_ENV)
+        if output_dir:
+            self.enable(output_dir)
+
+    # ------------------------------------------------------------------
+    # 켜기/끄기
+    # ------------------------------------------------------------------
+
+    def enable(self, output_dir: Optional[str] = None) -> str:
+        """프로파일 켜기, 결과 폴더 경로 반환"""
+        output_dir = os.path.abspath(output_dir or self.output_dir or DEFAULT_PROFILE_DIR)
+        os.makedirs(output_dir, exist_ok=True)
+        self.output_dir = output_dir
+        self.enabled = True
+        logger.info("⏱️ 프로파일 켜짐: %s", output_dir)
+        return output_dir
+
+    def disable(self) -> List[str]:
+        """프로파일 끄기 - 누적 통계를 저장하고 저장한 파일 목록 반환 (진행 중인 동작은 끝까지 기록)"""
+        self.enabled = False
+        written = self.flush()
+        logger.info("⏱️ 프로파일 꺼짐")
+        return written
+
+    def toggle(self, output_dir: Optional[str] = None) -> bool:
+        if self.enabled:
+            self.disable()
+        else:
+            self.enable(output_dir)
+        return self.enabled
+
+    # ------------------------------------------------------------------
+    # 동작 단위 기록 (실행마다 파일 저장)
+    # ------------------------------------------------------------------
+
+    def start(self, name: str) -> Optional[_Session]:
+        """동작 기록 시작 - 꺼져 있거나 이 스레드에서 이미 기록 중이면 None (바깥 동작에 포함)"""
+        if not self.enabled or getattr(self._local, 'active', False):
+            return None
+        session = _Session(name)
+        self._local.active = True
+        self._sampler.attach(session.samples)
+        session.profile.enable()
+        return session
+
+    def stop(self, session: Optional[_Session]) -> Optional[str]:
+        """start()로 시작한 동작 종료 후 저장 (같은 스레드에서 호출), 저장한 .prof 경로 반환"""
+        if session is None:
+            return None
+        session.profile.disable()
+        elapsed = time.perf_counter() - session.started
+        self._sampler.detach(session.samples)
+        self._local.active = False
+        try:
+            return self._write_session(session, elapsed)
+        except OSError as e:
+            logger.warning("프로파일 저장 실패 (%s): %s", session.name, e)
+            return None
+
+    @contextmanager
+    def action(self, name: str):
+        """with 블록 하나를 동작으로 기록"""
+        if not self.enabled:
+            yield
+            return
+        session = self.start(name)
+        try:
+            yield
+        finally:
+            self.stop(session)
+
+    def profiled(self, name: str):
+        """함수 호출을 동작으로 기록하는 데코레이터"""
+        def decorator(func):
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return func(*args, **kwargs)
+                with self.action(name):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    # ------------------------------------------------------------------
+    # 누적 기록 (곡마다 호출되는 단계, flush/disable 때 한 번 저장)
+    # ------------------------------------------------------------------
+
+    def accumulated(self, name: str):
+        """호출마다 cProfile로 재고 이름별로 합쳐 두는 데코레이터 (작업 스레드용)"""
+        def decorator(func):
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                if not self.enabled or getattr(self._local, 'active', False):
+                    return func(*args, **kwargs)
+                profile = cProfile.Profile()
+                self._local.active = True
+                profile.enable()
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    profile.disable()
+                    self._local.active = False
+                    self._merge(name, profile)
+            return wrapper
+        return decorator
+
+    def _merge(self, name: str, profile: cProfile.Profile):
+        stats = pstats.Stats(profile)
+        with self.lock:
+            total = self._totals.get(name)
+            if total is None:
+                self._totals[name] = stats
+            else:
+                total.add(stats)
+            self._calls[name] = self._calls.get(name, 0) + 1
+
+    def flush(self) -> List[str]:
+        """누적 통계를 <이름>.prof/.txt로 저장하고 비움"""
+        with self.lock:
+            totals, calls = self._totals, self._calls
+            self._totals, self._calls = {}, {}
+        written = []
+        if not totals or not self.output_dir:
+            return written
+        for name, stats in totals.items():
+            base = os.path.join(self.output_dir, f"{self._stamp()}_{_safe_name(name)}")
+            try:
+                self._dump_stats(stats, base, f"{name} - {calls[name]}회 호출 누적")
+            except OSError as e:
+                logger.warning("프로파일 저장 실패 (%s): %s", name, e)
+                continue
+            written.append(f"{base}.prof")
+            logger.info("⏱️ 누적 프로파일 저장: %s (%s회) → %s.prof", name, calls[name], base)
+        return written
+
+    # ------------------------------------------------------------------
+    # 저장
+    # ------------------------------------------------------------------
+
+    def _stamp(self) -> str:
+        with self.lock:
+            self._seq += 1
+            seq = self._seq
+        return f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{seq:03d}"
+
+    @staticmethod
+    def _dump_stats(stats: pstats.Stats, base: str, title: str):
+        tmp_path = f"{base}.prof.tmp"
+        stats.dump_stats(tmp_path)
+        os.replace(tmp_path, f"{base}.prof")
+        buffer = io.StringIO()
+        stats.stream = buffer
+        stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(SUMMARY_LINES)
+        _atomic_write(f"{base}.txt", f"{title}\n{buffer.getvalue()}")
+
+    def _write_session(self, session: _Session, elapsed: float) -> str:
+        output_dir = self.output_dir or os.path.abspath(DEFAULT_PROFILE_DIR)
+        os.makedirs(output_dir, exist_ok=True)
+        base = os.path.join(output_dir, f"{self._stamp()}_{_safe_name(session.name)}")
+        self._dump_stats(pstats.Stats(session.profile), base, f"{session.name} - {elapsed:.3f}초")
+        folded = "".join(f"{stack} {n}\n" for stack, n in session.samples.most_common())
+        _atomic_write(f"{base}.folded", folded)
+        logger.info("⏱️ 프로파일 저장: %s (%.2f초, 샘플 %s개) → %s.prof",
+                    session.name, elapsed, sum(session.samples.values()), base)
+        return f"{base}.prof"
+
+
+# 전역 프로파일러 인스턴스 (환경변수 SMARTGENRETAGGER_PROFILE이 있으면 켜진 상태로 시작)
+profiler = Profiler()
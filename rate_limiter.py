@@ -0,0 +1,84 @@
+"""
+API 요청 속도 제한기
+여러 작업 스레드가 하나의 토큰 버킷을 공유하고, 서버가 429(Too Many Requests)와 함께
+Retry-After를 돌려주면 모든 스레드가 그 시간 동안 함께 대기한다.
+"""
+
+import time
+import logging
+import threading
+from typing import Callable, Optional
+
+from metrics import metrics, EVENT_RATE_LIMITED, EVENT_RETRY
+
+logger = logging.getLogger(__name__)
+
+
+def retry_after_seconds(error: Exception, default: float = 1.0) -> Optional[float]:
+    """429 오류이면 대기할 초를 반환, 아니면 None (spotipy SpotifyException 형식)"""
+    if getattr(error, 'http_status', None) != 429:
+        return None
+    headers = getattr(error, 'headers', None) or {}
+    try:
+        return max(float(headers.get('Retry-After', default)), 0.0)
+    except (TypeError, ValueError):
+        return default
+
+
+class RateLimiter:
+    """스레드 간 공유하는 토큰 버킷 (초당 rate회, 최대 burst회 연속 허용)
+
+    name을 주면 호출 소요 시간을 그 이름의 단계로, 429 응답을 그 이름의 백엔드 이벤트로 지표에 기록한다.
+    """
+
+    def __init__(self, rate: float, burst: int = 1, max_retries: int = 5, name: Optional[str] = None):
+        self.rate = float(rate)
+        self.burst = max(1, burst)
+        self.max_retries = max_retries
+        self.name = name
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """요청 1회분 토큰을 얻을 때까지 대기"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                if now < self._blocked_until:
+                    wait = self._blocked_until - now
+                else:
+                    self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                    self._updated = now
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        return
+                    wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+    def block_for(self, seconds: float):
+        """모든 스레드의 요청을 seconds초 동안 멈춤 (Retry-After 반영)"""
+        with self._lock:
+            self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+            self._tokens = 0.0
+
+    def call(self, func: Callable, *args, **kwargs):
+        """속도 제한을 지켜 func를 호출하고, 429 응답이면 Retry-After만큼 쉬고 재시도"""
+        for attempt in range(self.max_retries + 1):
+            self.acquire()
+            try:
+                if self.name:
+                    with metrics.timer(self.name):
+                        return func(*args, **kwargs)
+                return func(*args, **kwargs)
+            except Exception as e:
+                wait = retry_after_seconds(e)
+                if wait is not None and self.name:
+                    metrics.count(self.name, EVENT_RATE_LIMITED)
+                if wait is None or attempt == self.max_retries:
+                    raise
+                if self.name:
+                    metrics.count(self.name, EVENT_RETRY)
+                logger.warning("⏳ 요청 한도 초과 - %.1f초 후 재시도 (%s/%s)", wait, attempt + 1, self.max_retries)
+                self.block_for(wait)
@@ -0,0 +1,95 @@
+"""
+Spotify 검색 결과 지속성 캐시
+정규화된 (제목, 아티스트) 키로 트랙 ID, 인기도, URL, 유사도를 저장해 다음 실행에서 재검색을 피한다.
+찾은 결과와 찾지 못한 결과는 유효기간(TTL)을 따로 둔다.
+(인기도는 시간이 지나면 변하므로 찾은 결과도 만료되면 다시 검색)
+"""
+
+import os
+import time
+import logging
+import pickle
+import threading
+from typing import Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+SPOTIFY_CACHE_FILE = ".spotify_cache.pkl"
+
+DAY = 24 * 60 * 60
+DEFAULT_TTL = 7 * DAY           # 찾은 트랙 (인기도 갱신 주기)
+DEFAULT_NEGATIVE_TTL = 1 * DAY  # 찾지 못한 곡 (새로 등록되었을 수 있음)
+
+# 캐시 미스/만료 표시 (None은 '찾지 못함'이 캐시된 상태)
+MISS = object()
+
+
+class PersistentSpotifyCache:
+    """(저장 시각, 트랙 정보 또는 None)을 pickle 파일로 보관하는 캐시"""
+
+    def __init__(self, cache_file: str = SPOTIFY_CACHE_FILE, ttl: float = DEFAULT_TTL,
+                 negative_ttl: float = DEFAULT_NEGATIVE_TTL, autosave_every: int = 100):
+        self.cache_file = cache_file
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.autosave_every = autosave_every
+        self.lock = threading.Lock()
+        self._dirty = 0
+        self._cache: Dict[Tuple, Tuple[float, Optional[Dict]]] = self._load_cache()
+
+    def _load_cache(self) -> Dict:
+        try:
+            with open(self.cache_file, "rb") as f:
+                cache = pickle.load(f)
+            logger.info("[Spotify 캐시] 파일에서 캐시 로드: %s (%s곡)", self.cache_file, len(cache))
+            return cache
+        except Exception:
+            logger.info("[Spotify 캐시] 새 캐시 생성: %s", self.cache_file)
+            return {}
+
+    def _is_fresh(self, cached_at: float, track: Optional[Dict], now: float) -> bool:
+        return now - cached_at < (self.ttl if track else self.negative_ttl)
+
+    def get(self, key):
+        """유효한 캐시 값(트랙 정보 또는 None) 반환, 없거나 만료되었으면 MISS"""
+        entry = self._cache.get(key)
+        if entry is None:
+            return MISS
+        cached_at, track = entry
+        if not self._is_fresh(cached_at, track, time.time()):
+            return MISS
+        return track
+
+    def set(self, key, track: Optional[Dict]):
+        """검색 결과 저장 (track=None은 '찾을 수 없음')"""
+        with self.lock:
+            self._cache[key] = (time.time(), track)
+            self._dirty += 1
+            autosave = self.autosave_every and self._dirty >= self.autosave_every
+        if autosave:
+            self.save()
+
+    def cached_at(self, key) -> Optional[float]:
+        """항목을 저장한 시각 (없으면 None, 만료 여부와 무관)"""
+        entry = self._cache.get(key)
+        return entry[0] if entry else None
+
+    def __contains__(self, key) -> bool:
+        return self.get(key) is not MISS
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def save(self):
+        """만료된 항목을 정리하고 임시 파일에 쓴 뒤 교체 (중단되어도 기존 캐시 보존)"""
+        with self.lock:
+            now = time.time()
+            self._cache = {k: v for k, v in self._cache.items() if self._is_fresh(v[0], v[1], now)}
+            tmp_file = f"{self.cache_file}.tmp"
+            try:
+                with open(tmp_file, "wb") as f:
+                    pickle.dump(self._cache, f)
+                os.replace(tmp_file, self.cache_file)
+                self._dirty = 0
+            except Exception as e:
+                logger.error("[Spotify 캐시] 저장 실패: %s", e)
@@ -0,0 +1,83 @@
+"""
+공유 Spotify 클라이언트
+처음 필요할 때 한 번만 생성하고, 접근 토큰은 첫 실제 API 요청에서 발급받아 파일에 캐시한다.
+만료되면 spotipy가 자동으로 다시 발급하므로 실행마다 연결 테스트나 클라이언트 재생성이 필요 없다.
+"""
+
+import threading
+
+from config import config
+
+SPOTIFY_KEYS = ['SPOTIFY_CLIENT_ID', 'SPOTIFY_CLIENT_SECRET']
+SPOTIFY_TOKEN_CACHE = ".spotify_token_cache"
+
+# 429는 spotipy 내부 재시도 대신 공유 속도 제한기(rate_limiter)가 Retry-After를 보고 처리
+STATUS_FORCELIST = (500, 502, 503, 504)
+STATUS_RETRIES = 3
+BACKOFF_FACTOR = 0.3
+
+_spotify = None
+_spotify_lock = threading.Lock()
+
+
+def _build_session():
+    """5xx만 재시도하는 requests 세션
+
+    urllib3는 status_forcelist에 없어도 Retry-After가 붙은 429를 스스로 기다렸다 재시도하므로
+    (respect_retry_after_header 기본값) 이를 꺼서 429가 그대로 RateLimiter.call까지 올라오게 한다.
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    retry = Retry(
+        total=STATUS_RETRIES,
+        connect=None,
+        read=False,
+        status=STATUS_RETRIES,
+        allowed_methods=frozenset(['GET', 'POST', 'PUT', 'DELETE']),
+        status_forcelist=STATUS_FORCELIST,
+        backoff_factor=BACKOFF_FACTOR,
+        respect_retry_after_header=False,
+    )
+    session = requests.Session()
+    adapter = HTTPAdapter(max_retries=retry)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+def get_spotify():
+    """공유 spotipy.Spotify 인스턴스 (인증 정보가 없으면 ConfigError)"""
+    global _spotify
+    if _spotify is None:
+        with _spotify_lock:
+            if _spotify is None:
+                config.validate(SPOTIFY_KEYS)
+                import spotipy
+                from spotipy.cache_handler import CacheFileHandler
+                from spotipy.oauth2 import SpotifyClientCredentials
+
+                credentials = SpotifyClientCredentials(
+                    client_id=config.spotify_client_id,
+                    client_secret=config.spotify_client_secret,
+                    cache_handler=CacheFileHandler(cache_path=SPOTIFY_TOKEN_CACHE)
+                )
+                # 여러 검색 스레드가 동시에 첫 요청을 보내도 토큰은 한 번만 발급
+                token_lock = threading.Lock()
+                get_access_token = credentials.get_access_token
+
+                def locked_get_access_token(*args, **kwargs):
+                    with token_lock:
+                        return get_access_token(*args, **kwargs)
+
+                credentials.get_access_token = locked_get_access_token
+                _spotify = spotipy.Spotify(client_credentials_manager=credentials,
+                                           requests_session=_build_session())
+    return _spotify
+
+
+def is_auth_error(error: Exception) -> bool:
+    """인증 실패(잘못된 키 등) 여부 - 재시도해도 소용없는 오류"""
+    from spotipy.oauth2 import SpotifyOauthError
+    return isinstance(error, SpotifyOauthError) or getattr(error, 'http_status', None) == 401
@@ -10,381 +10,504 @@ CSV 파일의 곡 목록에 Spotify 인기도 정보를 추가하는 스크립
 3. CSV 파일 선택
 4. 결과 파일 저장 위치 선택
 
+헤드리스 실행 (Tk 없이, cron 등):
+    python spotify_popularity_updater.py input.csv -o output.csv --workers 8 --resume
+    python spotify_popularity_updater.py output.csv --refresh -o refreshed.csv
+
 필요한 패키지:
-pip install spotipy python-dotenv pandas
+pip install "spotipy>=2.19" python-dotenv pandas
 """
 
 import os
+import re
 import sys
 import csv
+import json
 import time
-import re
+import queue
+import logging
+import argparse
 from datetime import datetime
-from typing import Optional, Dict, List, Tuple
-import tkinter as tk
-from tkinter import filedialog, messagebox, ttk
+from typing import Optional, Dict, Iterator, List, Tuple
 import threading
 
-try:
-    import spotipy
-    from spotipy.oauth2 import SpotifyClientCredentials
-except ImportError:
-    print("❌ spotipy 패키지가 설치되지 않았습니다.")
-    print("다음 명령어로 설치해주세요: pip install spotipy")
-    sys.exit(1)
+from batch_common import EXIT_INTERRUPTED, EXIT_OK, EXIT_PARTIAL_FAILURE, EXIT_USAGE, ordered_map
+from config import ConfigError
+from log_config import GUI_LEVEL, bulk_level, setup_logging
+from profiling import profiler
+from spotify_cache import DAY
+from spotify_client import get_spotify, is_auth_error
+from spotify_search import CACHE_TTL_DAYS, NEGATIVE_CACHE_TTL_DAYS, SpotifySearch
+from text_normalizer import match_text, search_query
+from track_matcher import similarity, track_matcher
+
+logger = logging.getLogger(__name__)
 
 try:
-    from dotenv import load_dotenv
+    import spotipy  # noqa: F401  (spotify_client에서 사용)
 except ImportError:
-    print("❌ python-dotenv 패키지가 설치되지 않았습니다.")
-    print("다음 명령어로 설치해주세요: pip install python-dotenv")
+    print("❌ spotipy 패키지가 설치되지 않았습니다.", file=sys.stderr)
+    print("다음 명령어로 설치해주세요: pip install spotipy", file=sys.stderr)
     sys.exit(1)
 
 try:
     import pandas as pd
 except ImportError:
-    print("❌ pandas 패키지가 설치되지 않았습니다.")
-    print("다음 명령어로 설치해주세요: pip install pandas")
+    print("❌ pandas 패키지가 설치되지 않았습니다.", file=sys.stderr)
+    print("다음 명령어로 설치해주세요: pip install pandas", file=sys.stderr)
     sys.exit(1)
 
+# 동시 검색 스레드 수 (요청 속도와 캐시 유효기간은 spotify_search에서 공유)
+SEARCH_WORKERS = 8
+
+# 스트리밍 처리: 한 번에 읽고 결과 파일에 덧붙이는 행 수
+CHUNK_SIZE = 500
+
+# 진행률 표시 간격 (헤드리스: 표준 에러 출력 간격(초), GUI: 화면 갱신 간격(ms))
+PROGRESS_INTERVAL = 2.0
+PROGRESS_POLL_MS = 200
+
+# 인기도 새로고침: 여러 트랙 조회(/v1/tracks) 1회당 최대 ID 수
+TRACKS_BATCH_SIZE = 50
+
+_TRACK_ID_RE = re.compile(r'(?:open\.spotify\.com/(?:intl-[\w-]+/)?track/|spotify:track:)([A-Za-z0-9]{22})')
+
+
+def extract_track_id(url) -> Optional[str]:
+    """Spotify 트랙 URL/URI에서 트랙 ID 추출 (없으면 None)"""
+    if not isinstance(url, str):
+        return None
+    match = _TRACK_ID_RE.search(url)
+    return match.group(1) if match else None
+
+
+class CsvCheckpoint:
+    """스트리밍 처리 진행 상황 (결과 파일 옆의 .checkpoint JSON)
+
+    입력 파일 정보, 결과 파일에 기록 완료된 행 수와 그 시점의 결과 파일 크기를 저장한다.
+    기록 도중 중단되어 결과 파일이 더 커졌으면 재개할 때 저장된 크기로 잘라낸다.
+    """
+    
+    def __init__(self, output_file: str):
+        self.output_file = output_file
+        self.path = f"{output_file}.checkpoint"
+    
+    @staticmethod
+    def _source_info(input_file: str) -> Dict:
+        stat = os.stat(input_file)
+        return {'input': os.path.abspath(input_file), 'size': stat.st_size, 'mtime': stat.st_mtime}
+    
+    def load(self, input_file: str) -> Optional[Dict]:
+        """같은 입력 파일에 대한 유효한 체크포인트 반환 (없거나 입력이 바뀌었으면 None)"""
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if state.get('source') != self._source_info(input_file) or not os.path.exists(self.output_file):
+            return None
+        if os.path.getsize(self.output_file) < state.get('output_size', 0):
+            return None
+        return state
+    
+    def save(self, input_file: str, rows_done: int, found: int):
+        state = {
+            'source': self._source_info(input_file),
+            'rows_done': rows_done,
+            'found': found,
+            'output_size': os.path.getsize(self.output_file),
+        }
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(state, f, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+    
+    def clear(self):
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+
+def count_csv_rows(input_file: str) -> int:
+    """헤더를 제외한 CSV 행 수 (따옴표 안 줄바꿈 고려, 진행률 표시용)"""
+    with open(input_file, newline='', encoding='utf-8-sig') as f:
+        return max(0, sum(1 for _ in csv.reader(f)) - 1)
+
 
 class SpotifyPopularityUpdater:
     """Spotify 인기도 업데이터 클래스"""
     
     def __init__(self):
         self.spotify = None
-        self.cache = {}  # 검색 결과 캐시
+        self._auth_failed = False
+        # 검색 전략, 지속성 캐시, 공유 속도 제한기
+        self.searcher = SpotifySearch()
+        self.cache = self.searcher.cache
+        self.rate_limiter = self.searcher.rate_limiter
         self.processed_count = 0
         self.total_count = 0
+        self.error_count = 0
         self.is_cancelled = False
+        self.workers = SEARCH_WORKERS
+        
+        self._last_progress = 0.0
+        self._started_at = 0.0
         
-        # GUI 컴포넌트
+        # GUI 컴포넌트 (GUI 모드에서만 생성, 작업 스레드는 상태 값과 메시지 큐만 사용)
         self.root = None
         self.progress_var = None
         self.status_var = None
         self.progress_bar = None
+        self.status_message = "대기 중..."
+        self._messages = queue.Queue()
         
     def load_spotify_credentials(self) -> bool:
-        """Spotify API 인증 정보 로드"""
+        """Spotify 클라이언트 준비 (연결 테스트 없음, 키 검증은 첫 실제 요청에서 이루어짐)"""
         try:
-            # .env 파일 로드
-            load_dotenv()
-            
-            client_id = os.getenv('SPOTIFY_CLIENT_ID')
-            client_secret = os.getenv('SPOTIFY_CLIENT_SECRET')
-            
-            if not client_id or not client_secret:
-                print("❌ .env 파일에서 Spotify API 키를 찾을 수 없습니다.")
-                print("다음 변수들을 .env 파일에 추가해주세요:")
-                print("SPOTIFY_CLIENT_ID=your_client_id")
-                print("SPOTIFY_CLIENT_SECRET=your_client_secret")
-                return False
-            
-            # Spotify 클라이언트 초기화
-            credentials = SpotifyClientCredentials(
-                client_id=client_id,
-                client_secret=client_secret
-            )
-            self.spotify = spotipy.Spotify(client_credentials_manager=credentials)
-            
-            # 연결 테스트
-            test_result = self.spotify.search(q="test", type="track", limit=1)
-            print("✅ Spotify API 연결 성공!")
+            self.spotify = get_spotify()
+            self._auth_failed = False
             return True
-            
-        except Exception as e:
-            print(f"❌ Spotify API 초기화 실패: {e}")
+        except ConfigError as e:
+            for missing in e.missing:
+                logger.error("❌ %s", missing.message)
+            logger.error("다음 변수들을 .env 파일에 추가해주세요:\nSPOTIFY_CLIENT_ID=your_client_id\n"
+                         "SPOTIFY_CLIENT_SECRET=your_client_secret")
             return False
     
+    def _handle_request_error(self, error: Exception, context: str):
+        """요청 오류 처리 - 인증 실패는 한 번만 알리고 전체 작업 중단"""
+        if not is_auth_error(error):
+            logger.warning("🔍 %s: %s", context, error)
+            return
+        if not self._auth_failed:
+            self._auth_failed = True
+            self.is_cancelled = True
+            self.notify("error", "오류", f"Spotify 인증에 실패했습니다.\n.env 파일의 API 키를 확인해주세요.\n({error})")
+    
     def clean_search_query(self, title: str, artist: str) -> str:
-        """검색 쿼리 정리 - 더 정교한 정리"""
-        # 제목 정리
-        title_clean = title.strip()
-        
-        # Clean/Dirty, Remix, Extended 등 제거
-        title_clean = re.sub(r'\s*\((Clean|Dirty|Explicit|Radio Edit|Album Version|Extended|Main)\)\s*', '', title_clean, flags=re.IGNORECASE)
-        title_clean = re.sub(r'\s*(Clean|Dirty|Explicit|Radio Edit|Album Version|Extended|Main)\s*', '', title_clean, flags=re.IGNORECASE)
-        
-        # Remix 관련 제거
-        title_clean = re.sub(r'\s*\((.*?Remix.*?|.*?Edit.*?)\)\s*', '', title_clean, flags=re.IGNORECASE)
-        title_clean = re.sub(r'\s*(Remix|Edit)\s*', '', title_clean, flags=re.IGNORECASE)
-        
-        # 기타 괄호 내용 제거
-        title_clean = re.sub(r'\([^)]*\)|\[[^\]]*\]', '', title_clean).strip()
-        
-        # 특수문자 정리 (더 보수적으로)
-        title_clean = re.sub(r'[^\w\s가-힣\'-]', ' ', title_clean).strip()
-        title_clean = re.sub(r'\s+', ' ', title_clean).strip()
-        
-        # 아티스트 정리
-        artist_clean = artist.strip()
-        
-        # ft, feat 등과 그 뒤의 내용 모두 제거
-        artist_clean = re.split(r'\s+(ft\.?|feat\.?|featuring|with|&|\+)\s+', artist_clean, flags=re.IGNORECASE)[0].strip()
-        
-        # 괄호 내용 제거
-        artist_clean = re.sub(r'\([^)]*\)|\[[^\]]*\]', '', artist_clean).strip()
-        
-        # 특수문자 정리
-        artist_clean = re.sub(r'[^\w\s가-힣\'-]', ' ', artist_clean).strip()
-        artist_clean = re.sub(r'\s+', ' ', artist_clean).strip()
-        
-        return f"{title_clean} {artist_clean}".strip()
+        """검색 쿼리 정리 - 버전 표기, 리믹스, 괄호, 피처링 제거 (text_normalizer 공용 규칙)"""
+        return search_query(title, artist)
     
     def search_spotify_track(self, title: str, artist: str) -> Optional[Dict]:
-        """Spotify에서 트랙 검색 - 다단계 검색 전략"""
-        # 캐시 확인
-        cache_key = f"{title.lower()}|{artist.lower()}"
-        if cache_key in self.cache:
-            return self.cache[cache_key]
-        
+        """Spotify에서 트랙 검색 - 다단계 검색 전략 (spotify_search 공용 검색기)"""
         try:
-            # 검색 전략들을 순서대로 시도
-            search_strategies = [
-                # 1. 기본 검색 (제목 + 아티스트)
-                lambda: self.clean_search_query(title, artist),
-                # 2. Spotify 고급 검색 문법 사용
-                lambda: f'track:"{title.split("(")[0].strip()}" artist:"{artist.split("ft")[0].split("feat")[0].strip()}"',
-                # 3. 제목만 검색
-                lambda: title.split("(")[0].strip(),
-                # 4. 제목에서 특수문자 모두 제거
-                lambda: re.sub(r'[^\w\s가-힣]', ' ', title).strip(),
-                # 5. 아티스트만 검색
-                lambda: artist.split("ft")[0].split("feat")[0].strip(),
-                # 6. 제목의 첫 단어들만 검색
-                lambda: ' '.join(title.split()[:3]) if len(title.split()) > 2 else title
-            ]
-            
-            for i, strategy in enumerate(search_strategies):
-                query = strategy()
-                if not query or len(query.strip()) < 2:
-                    continue
-                
-                # Spotify 검색 (더 많은 결과 요청)
-                results = self.spotify.search(q=query, type="track", limit=20)
-                tracks = results.get('tracks', {}).get('items', [])
-                
-                if tracks:
-                    # 가장 적합한 트랙 찾기
-                    best_match = self.find_best_match(tracks, title, artist)
-                    if best_match:
-                        # 캐시에 저장
-                        self.cache[cache_key] = best_match
-                        return best_match
-                
-                # Rate Limit 방지
-                time.sleep(0.05)
-            
-            # 모든 전략 실패
-            self.cache[cache_key] = None
-            return None
-            
+            return self.searcher.search_track(title, artist)
         except Exception as e:
-            print(f"🔍 검색 오류 ({title} - {artist}): {e}")
-            self.cache[cache_key] = None
+            # 일시적인 오류는 캐시하지 않음 (다음 실행에서 다시 검색)
+            self._handle_request_error(e, f"검색 오류 ({title} - {artist})")
             return None
     
     def find_best_match(self, tracks: List[Dict], target_title: str, target_artist: str) -> Optional[Dict]:
-        """가장 적합한 트랙 찾기 - 더 관대한 매칭"""
-        if not tracks:
-            return None
-        
-        # 타겟 정보 정리
-        target_title_clean = self.normalize_text(target_title)
-        target_artist_clean = self.normalize_text(target_artist)
-        
-        best_score = 0
-        best_track = None
-        
-        for track in tracks:
-            track_title = self.normalize_text(track['name'])
-            track_artists = [self.normalize_text(artist['name']) for artist in track['artists']]
-            
-            # 제목 유사도 계산
-            title_score = self.calculate_similarity(target_title_clean, track_title)
-            
-            # 아티스트 유사도 계산 (모든 아티스트 중 가장 높은 점수)
-            artist_score = 0
-            for track_artist in track_artists:
-                score = self.calculate_similarity(target_artist_clean, track_artist)
-                artist_score = max(artist_score, score)
-            
-            # 전체 점수 계산 (제목 60%, 아티스트 40%)
-            total_score = title_score * 0.6 + artist_score * 0.4
-            
-            # 더 관대한 매칭 기준 (40% → 30%)
-            if total_score > best_score and total_score > 0.3:
-                best_score = total_score
-                best_track = {
-                    'id': track['id'],
-                    'name': track['name'],
-                    'artists': [artist['name'] for artist in track['artists']],
-                    'popularity': track['popularity'],
-                    'external_urls': track['external_urls']['spotify'],
-                    'similarity_score': total_score
-                }
-        
-        return best_track
+        """가장 적합한 트랙 찾기 - 제목 60%, 아티스트 40%, 30% 초과 시 매칭 (track_matcher 엔진)"""
+        return track_matcher.best_match(tracks, target_title, target_artist)
     
     def normalize_text(self, text: str) -> str:
-        """텍스트 정규화 - 비교를 위한 표준화"""
-        if not text:
-            return ""
-        
-        # 소문자 변환
-        text = text.lower().strip()
-        
-        # Clean/Dirty 등 제거
-        text = re.sub(r'\s*\((clean|dirty|explicit|radio edit|album version|extended|main)\)\s*', '', text)
-        text = re.sub(r'\s+(clean|dirty|explicit|radio edit|album version|extended|main)\s*', '', text)
-        
-        # feat, ft 등 제거
-        text = re.split(r'\s+(ft\.?|feat\.?|featuring|with|&|\+)\s+', text)[0].strip()
-        
-        # 괄호 내용 제거
-        text = re.sub(r'\([^)]*\)|\[[^\]]*\]', '', text).strip()
-        
-        # 특수문자를 공백으로 변환
-        text = re.sub(r'[^\w\s가-힣]', ' ', text)
-        
-        # 연속된 공백을 하나로
-        text = re.sub(r'\s+', ' ', text).strip()
-        
-        return text
+        """텍스트 정규화 - 비교를 위한 표준화 (text_normalizer 공용 규칙)"""
+        return match_text(text)
     
     def calculate_similarity(self, str1: str, str2: str) -> float:
-        """문자열 유사도 계산 - 개선된 알고리즘"""
-        if not str1 or not str2:
-            return 0.0
-        
-        # 완전 일치
-        if str1 == str2:
-            return 1.0
-        
-        # 포함 관계 확인 (더 관대하게)
-        if str1 in str2 or str2 in str1:
-            shorter = min(len(str1), len(str2))
-            longer = max(len(str1), len(str2))
-            return max(0.7, shorter / longer)  # 최소 70% 점수 보장
-        
-        # 단어 기반 유사도
-        words1 = set(str1.split())
-        words2 = set(str2.split())
-        
-        if not words1 or not words2:
-            return 0.0
-        
-        # Jaccard 유사도
-        intersection = len(words1.intersection(words2))
-        union = len(words1.union(words2))
-        jaccard = intersection / union if union > 0 else 0.0
-        
-        # 부분 문자열 매칭도 고려
-        partial_score = 0.0
-        for word1 in words1:
-            for word2 in words2:
-                if len(word1) >= 3 and len(word2) >= 3:  # 3글자 이상만 비교
-                    if word1 in word2 or word2 in word1:
-                        partial_score = max(partial_score, 0.5)
-        
-        # 최종 점수 (Jaccard + 부분 매칭)
-        return max(jaccard, partial_score)
+        """문자열 유사도 계산 - 완전 일치, 포함 관계, Jaccard, 부분 단어 일치 (track_matcher 엔진)"""
+        return similarity(str1, str2)
+    
+    # 제목/아티스트가 비어 있는 행 표시
+    MISSING_INFO = object()
+    # 검색 자체가 실패한 행 표시 (네트워크 오류, 재시도 후에도 5xx, 속도 제한 초과 등 - 이어하기 때 다시 검색)
+    LOOKUP_ERROR = object()
     
-    def process_csv(self, input_file: str, output_file: str) -> bool:
-        """CSV 파일 처리"""
+    def _lookup_row(self, job: Tuple) -> Tuple:
+        """작업 스레드: (청크, 행 번호, 제목, 아티스트) → (청크, 행 번호, 제목, 아티스트, 검색 결과)"""
+        chunk, index, title, artist = job
+        if not title or not artist or title == 'nan' or artist == 'nan':
+            return chunk, index, title, artist, self.MISSING_INFO
+        if self.is_cancelled:
+            return chunk, index, title, artist, self.LOOKUP_ERROR
         try:
-            # CSV 파일 읽기
-            df = pd.read_csv(input_file, encoding='utf-8-sig')
+            return chunk, index, title, artist, self.searcher.search_track(title, artist)
+        except Exception as e:
+            # 일시적인 오류는 캐시하지 않음 (못 찾은 곡과 구분해 기록)
+            self._handle_request_error(e, f"검색 오류 ({title} - {artist})")
+            return chunk, index, title, artist, self.LOOKUP_ERROR
+    
+    def _iter_jobs(self, input_file: str, skip: int) -> Iterator[Tuple]:
+        """입력 CSV를 CHUNK_SIZE 행씩 읽어 행 단위 검색 작업으로 펼침 (앞의 skip행은 건너뜀)"""
+        # 청크마다 타입 추론이 달라지지 않도록 모든 값을 입력 그대로 문자열로 읽음
+        # (skiprows는 따옴표 안 줄바꿈이 있으면 행 번호가 어긋나므로 읽은 뒤 건너뜀)
+        reader = pd.read_csv(input_file, encoding='utf-8-sig', chunksize=CHUNK_SIZE,
+                             dtype=str, keep_default_na=False)
+        for chunk in reader:
+            if self.is_cancelled:
+                return
+            if skip:
+                if len(chunk) <= skip:
+                    skip -= len(chunk)
+                    continue
+                chunk = chunk.iloc[skip:].copy()
+                skip = 0
+            
+            # 새 컬럼들 추가
+            chunk['Spotify_인기도'] = ''
+            chunk['Spotify_URL'] = ''
+            chunk['검색_결과'] = ''
             
-            # 필수 컬럼 확인
+            titles = chunk['제목'].astype(str).str.strip()
+            artists = chunk['아티스트'].astype(str).str.strip()
+            for index, title, artist in zip(chunk.index, titles, artists):
+                yield chunk, index, title, artist
+    
+    def _apply_result(self, chunk, index, title: str, artist: str, track_info) -> bool:
+        """검색 결과를 행에 기록 (찾았으면 True)"""
+        if track_info is self.MISSING_INFO:
+            chunk.at[index, '검색_결과'] = '정보 부족'
+            return False
+        if track_info is self.LOOKUP_ERROR:
+            chunk.at[index, '검색_결과'] = '검색 오류'
+            return False
+        if not track_info:
+            chunk.at[index, '검색_결과'] = '찾을 수 없음'
+            logger.info("❌ %s - %s → 모든 검색 전략 실패", title, artist)
+            return False
+        chunk.at[index, 'Spotify_인기도'] = str(track_info['popularity'])
+        chunk.at[index, 'Spotify_URL'] = track_info['external_urls']
+        chunk.at[index, '검색_결과'] = f"발견 (유사도: {track_info['similarity_score']:.2f})"
+        logger.info("✅ %s - %s → 발견: %s - %s (인기도: %s, 유사도: %.2f)", title, artist, track_info['name'],
+                    ', '.join(track_info['artists']), track_info['popularity'], track_info['similarity_score'])
+        return True
+    
+    def process_csv(self, input_file: str, output_file: str, resume: bool = False) -> bool:
+        """CSV 파일 처리 - CHUNK_SIZE 행씩 읽어 검색하고 결과 파일에 덧붙임
+        
+        청크를 기록할 때마다 체크포인트를 남기므로 중단/오류 후 resume=True로 다시 실행하면
+        마지막으로 기록된 행 다음부터 이어서 처리한다. 검색 오류('검색 오류')가 난 행부터는
+        체크포인트를 더 진행하지 않아, 이어하기 때 그 행부터 다시 검색한다 (찾은 곡은 캐시 적중).
+        """
+        checkpoint = CsvCheckpoint(output_file)
+        try:
+            # 필수 컬럼 확인 (헤더만 읽기)
+            columns = pd.read_csv(input_file, encoding='utf-8-sig', nrows=0).columns
             required_columns = ['제목', '아티스트']
-            missing_columns = [col for col in required_columns if col not in df.columns]
+            missing_columns = [col for col in required_columns if col not in columns]
             
             if missing_columns:
-                messagebox.showerror("오류", f"필수 컬럼이 없습니다: {', '.join(missing_columns)}")
+                self.notify("error", "오류", f"필수 컬럼이 없습니다: {', '.join(missing_columns)}")
                 return False
             
-            # 새 컬럼들 추가
-            df['Spotify_인기도'] = ''
-            df['Spotify_URL'] = ''
-            df['검색_결과'] = ''
-            
-            self.total_count = len(df)
+            self.total_count = count_csv_rows(input_file)
             self.processed_count = 0
+            self._started_at = time.monotonic()
+            self.searcher.cache_hits = 0
+            self.error_count = 0
+            found_count = 0
             
-            # 각 행 처리
-            for index, row in df.iterrows():
+            # 이어하기: 기록 완료된 크기로 결과 파일을 맞추고 그 다음 행부터 읽기
+            state = checkpoint.load(input_file) if resume else None
+            if state:
+                with open(output_file, 'r+b') as f:
+                    f.truncate(state['output_size'])
+                self.processed_count = state['rows_done']
+                found_count = state['found']
+                logger.info("↩️ 이어서 처리: %s/%s행 완료된 상태", self.processed_count, self.total_count)
+            else:
+                checkpoint.clear()
+            write_header = not state
+            
+            # 첫 검색 오류 행: (청크, 청크 안 위치, 그 앞까지 처리한 행 수, 그 앞까지 찾은 곡 수)
+            first_error = None
+            checkpoint_frozen = False
+            
+            def append(rows):
+                nonlocal write_header
+                rows.to_csv(output_file, mode='w' if write_header else 'a', header=write_header,
+                            index=False, encoding='utf-8-sig')
+                write_header = False
+            
+            def flush(chunk, done):
+                """청크에서 완료된 앞쪽 done행을 결과 파일에 덧붙이고 체크포인트 갱신
+                (첫 검색 오류 행 앞까지만 체크포인트에 포함)"""
+                nonlocal checkpoint_frozen
+                if checkpoint_frozen:
+                    append(chunk.iloc[:done])
+                elif first_error and first_error[0] is chunk:
+                    _, position, rows_done, found = first_error
+                    append(chunk.iloc[:position])
+                    checkpoint.save(input_file, rows_done, found)
+                    append(chunk.iloc[position:done])
+                    checkpoint_frozen = True
+                else:
+                    append(chunk.iloc[:done])
+                    checkpoint.save(input_file, self.processed_count, found_count)
+            
+            # 검색은 파일 전체에 걸친 하나의 스트림으로 여러 스레드에서 진행 (청크 경계에서도 쉬지 않음)
+            # 결과는 행 순서대로 받아, 한 청크가 모두 끝날 때마다 기록
+            current, done = None, 0
+            jobs = self._iter_jobs(input_file, self.processed_count)
+            for chunk, index, title, artist, track_info in ordered_map(self._lookup_row, jobs, self.workers):
                 if self.is_cancelled:
                     break
-                
-                title = str(row['제목']).strip()
-                artist = str(row['아티스트']).strip()
-                
-                if not title or not artist or title == 'nan' or artist == 'nan':
-                    df.at[index, '검색_결과'] = '정보 부족'
-                    self.processed_count += 1
-                    self.update_progress()
-                    continue
-                
-                # Spotify 검색
-                track_info = self.search_spotify_track(title, artist)
-                
-                if track_info:
-                    df.at[index, 'Spotify_인기도'] = track_info['popularity']
-                    df.at[index, 'Spotify_URL'] = track_info['external_urls']
-                    df.at[index, '검색_결과'] = f"발견 (유사도: {track_info['similarity_score']:.2f})"
-                    print(f"✅ {title} - {artist}")
-                    print(f"   → 발견: {track_info['name']} - {', '.join(track_info['artists'])}")
-                    print(f"   → 인기도: {track_info['popularity']}, 유사도: {track_info['similarity_score']:.2f}")
-                else:
-                    df.at[index, '검색_결과'] = '찾을 수 없음'
-                    print(f"❌ {title} - {artist} → 모든 검색 전략 실패")
-                
+                if chunk is not current:
+                    if current is not None:
+                        flush(current, done)
+                    current, done = chunk, 0
+                if track_info is self.LOOKUP_ERROR:
+                    self.error_count += 1
+                    if first_error is None:
+                        first_error = (chunk, done, self.processed_count, found_count)
+                found_count += self._apply_result(chunk, index, title, artist, track_info)
+                done += 1
                 self.processed_count += 1
                 self.update_progress()
+            if current is not None:
+                flush(current, done)
             
-            # 결과 저장
-            df.to_csv(output_file, index=False, encoding='utf-8-sig')
+            if write_header:
+                # 데이터 행이 없는 CSV도 헤더만 있는 결과 파일 생성
+                pd.DataFrame(columns=[*columns, 'Spotify_인기도', 'Spotify_URL', '검색_결과']).to_csv(
+                    output_file, index=False, encoding='utf-8-sig')
             
-            if not self.is_cancelled:
-                found_count = len(df[df['Spotify_인기도'] != ''])
-                messagebox.showinfo("완료", 
+            if self.is_cancelled:
+                logger.info("⏸️ 중단됨: %s/%s행 기록 (이어하기 가능)", self.processed_count, self.total_count)
+            else:
+                if not self.error_count:
+                    checkpoint.clear()
+                retry_note = f"검색 오류: {self.error_count}개 (이어하기로 다시 검색)\n" if self.error_count else ""
+                self.notify("info", "완료",
                     f"처리 완료!\n\n"
                     f"전체 곡 수: {self.total_count}개\n"
                     f"발견된 곡: {found_count}개\n"
-                    f"성공률: {found_count/self.total_count*100:.1f}%\n\n"
+                    f"성공률: {found_count/max(self.total_count, 1)*100:.1f}%\n"
+                    f"{retry_note}\n"
                     f"결과 파일: {output_file}")
             
             return True
             
         except Exception as e:
-            messagebox.showerror("오류", f"CSV 처리 중 오류 발생:\n{str(e)}")
+            self.notify("error", "오류", f"CSV 처리 중 오류 발생:\n{str(e)}")
             return False
+        finally:
+            # 중단/오류가 나도 그때까지의 검색 결과는 다음 실행에서 재사용
+            self.cache.save()
+            logger.info("[Spotify 캐시] 적중 %s곡, 저장 %s곡", self.searcher.cache_hits, len(self.cache))
     
-    def update_progress(self):
-        """진행률 업데이트"""
-        if self.progress_var and self.status_var:
-            progress = (self.processed_count / self.total_count) * 100
-            self.progress_var.set(progress)
-            self.status_var.set(f"처리 중... {self.processed_count}/{self.total_count}")
+    def fetch_popularity(self, track_ids: List[str]) -> Dict[str, int]:
+        """트랙 ID 목록의 현재 인기도 조회 (50개씩 묶어서 요청)"""
+        batches = [track_ids[i:i + TRACKS_BATCH_SIZE] for i in range(0, len(track_ids), TRACKS_BATCH_SIZE)]
+        
+        def fetch(batch):
+            if self.is_cancelled:
+                return batch, []
+            try:
+                response = self.rate_limiter.call(self.spotify.tracks, batch)
+                return batch, response.get('tracks', [])
+            except Exception as e:
+                self._handle_request_error(e, f"트랙 조회 오류 ({len(batch)}곡)")
+                return batch, []
+        
+        popularity = {}
+        for batch, tracks in ordered_map(fetch, batches, self.workers):
+            # 삭제된 트랙은 None으로 반환됨
+            for track_id, track in zip(batch, tracks):
+                if track:
+                    popularity[track_id] = track['popularity']
+            self.processed_count = min(self.total_count, self.processed_count + len(batch))
+            self.update_progress()
+        return popularity
+    
+    def refresh_popularity(self, input_file: str, output_file: str) -> bool:
+        """인기도 새로고침 - 기존 Spotify_URL의 트랙 ID로 Spotify_인기도만 갱신 (재검색 없음)"""
+        try:
+            # 갱신하지 않는 값(빈 칸이 섞인 연도/인기도 등)이 47.0처럼 바뀌지 않도록 입력 그대로 문자열로 읽음
+            df = pd.read_csv(input_file, encoding='utf-8-sig', dtype=str, keep_default_na=False)
+            
+            if 'Spotify_URL' not in df.columns:
+                self.notify("error", "오류", "Spotify_URL 컬럼이 없습니다.\n먼저 인기도 검색을 실행해주세요.")
+                return False
+            if 'Spotify_인기도' not in df.columns:
+                df['Spotify_인기도'] = ''
+            
+            track_ids = df['Spotify_URL'].map(extract_track_id)
+            unique_ids = list(dict.fromkeys(track_ids.dropna()))
+            
+            self.total_count = len(unique_ids)
+            self.processed_count = 0
+            self._started_at = time.monotonic()
+            logger.info("🔄 인기도 새로고침: %s곡, 요청 %s회", len(unique_ids), -(-len(unique_ids) // TRACKS_BATCH_SIZE))
             
-            if self.root:
-                self.root.update()
+            popularity = self.fetch_popularity(unique_ids)
+            if self.is_cancelled:
+                return False
+            
+            # 조회된 트랙만 갱신 (나머지 컬럼과 조회 실패 행은 그대로 유지)
+            new_values = track_ids.map(popularity)
+            updated = new_values.notna()
+            df.loc[updated, 'Spotify_인기도'] = new_values[updated].astype(int).astype(str)
+            
+            df.to_csv(output_file, index=False, encoding='utf-8-sig')
+            
+            self.notify("info", "완료",
+                f"새로고침 완료!\n\n"
+                f"URL이 있는 곡: {int(track_ids.notna().sum())}개\n"
+                f"갱신된 곡: {int(updated.sum())}개\n\n"
+                f"결과 파일: {output_file}")
+            return True
+            
+        except Exception as e:
+            self.notify("error", "오류", f"인기도 새로고침 중 오류 발생:\n{str(e)}")
+            return False
+    
+    def notify(self, kind: str, title: str, message: str):
+        """완료/오류 알림 - GUI는 메인 스레드에서 메시지 박스로, 헤드리스는 표준 에러로 출력"""
+        if self.root:
+            self._messages.put((kind, title, message))
+        else:
+            icon = "❌" if kind == "error" else "✅"
+            print(f"{icon} {title}: {message}", file=sys.stderr)
+    
+    def update_progress(self):
+        """진행률 업데이트 (작업 스레드에서 호출)
+        
+        GUI는 메인 스레드가 PROGRESS_POLL_MS마다 값을 읽어가고,
+        헤드리스는 PROGRESS_INTERVAL초마다 한 줄씩 표준 에러에 출력한다.
+        """
+        if self.root or not self.total_count:
+            return
+        now = time.monotonic()
+        if now - self._last_progress < PROGRESS_INTERVAL and self.processed_count < self.total_count:
+            return
+        self._last_progress = now
+        elapsed = now - self._started_at
+        rate = self.processed_count / elapsed if elapsed > 0 else 0.0
+        remaining = (self.total_count - self.processed_count) / rate if rate > 0 else 0.0
+        print(f"⏳ {self.processed_count}/{self.total_count} "
+              f"({self.processed_count / self.total_count * 100:.1f}%, {rate:.1f}곡/초, 남은 시간 {remaining:.0f}초)",
+              file=sys.stderr)
+    
+    def _poll_progress(self):
+        """GUI 메인 스레드: 진행률, 상태, 알림 메시지 반영"""
+        from tkinter import messagebox
+        
+        status = self.status_message
+        if self.total_count:
+            self.progress_var.set(self.processed_count / self.total_count * 100)
+            if status == "처리 중...":
+                status = f"처리 중... {self.processed_count}/{self.total_count}"
+        self.status_var.set(status)
+        while not self._messages.empty():
+            kind, title, message = self._messages.get_nowait()
+            (messagebox.showerror if kind == "error" else messagebox.showinfo)(title, message)
+        self.root.after(PROGRESS_POLL_MS, self._poll_progress)
     
     def select_input_file(self) -> Optional[str]:
         """입력 CSV 파일 선택"""
+        from tkinter import filedialog
         return filedialog.askopenfilename(
             title="처리할 CSV 파일 선택",
             filetypes=[("CSV 파일", "*.csv"), ("모든 파일", "*.*")]
         )
     
-    def select_output_file(self, input_file: str) -> Optional[str]:
+    def select_output_file(self, input_file: str, suffix: str = "with_spotify_popularity") -> Optional[str]:
         """출력 CSV 파일 선택"""
         # 기본 파일명 생성
-        base_name = os.path.splitext(os.path.basename(input_file))[0]
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        default_name = f"{base_name}_with_spotify_popularity_{timestamp}.csv"
+        default_name = default_output_name(input_file, suffix)
         
+        from tkinter import filedialog
         return filedialog.asksaveasfilename(
             title="결과 파일 저장 위치",
             defaultextension=".csv",
@@ -393,7 +516,10 @@ class SpotifyPopularityUpdater:
         )
     
     def create_gui(self):
-        """GUI 생성"""
+        """GUI 생성 (tkinter는 GUI 모드에서만 로드)"""
+        import tkinter as tk
+        from tkinter import ttk
+        
         self.root = tk.Tk()
         self.root.title("Spotify 인기도 업데이터")
         self.root.geometry("500x300")
@@ -410,13 +536,19 @@ class SpotifyPopularityUpdater:
         # 설명
         desc_label = ttk.Label(main_frame, 
             text="CSV 파일의 곡 목록에 Spotify 인기도 정보를 추가합니다.\n"
-                 "CSV 파일에는 '제목'과 '아티스트' 컬럼이 필요합니다.",
+                 "CSV 파일에는 '제목'과 '아티스트' 컬럼이 필요합니다.\n"
+                 "새로고침은 Spotify_URL이 있는 곡의 인기도만 갱신합니다.",
             justify=tk.CENTER)
         desc_label.grid(row=1, column=0, columnspan=2, pady=(0, 20))
         
         # 시작 버튼
         start_button = ttk.Button(main_frame, text="📁 CSV 파일 선택 및 시작", command=self.start_processing)
-        start_button.grid(row=2, column=0, columnspan=2, pady=(0, 20))
+        start_button.grid(row=2, column=0, pady=(0, 20))
+        
+        # 인기도 새로고침 버튼 (Spotify_URL이 있는 CSV)
+        refresh_button = ttk.Button(main_frame, text="🔄 인기도 새로고침",
+                                    command=lambda: self.start_processing(refresh=True))
+        refresh_button.grid(row=2, column=1, pady=(0, 20))
         
         # 진행률 바
         self.progress_var = tk.DoubleVar()
@@ -436,34 +568,44 @@ class SpotifyPopularityUpdater:
         self.root.columnconfigure(0, weight=1)
         self.root.rowconfigure(0, weight=1)
         main_frame.columnconfigure(0, weight=1)
+        
+        self.root.after(PROGRESS_POLL_MS, self._poll_progress)
     
-    def start_processing(self):
-        """처리 시작"""
+    def start_processing(self, refresh: bool = False):
+        """처리 시작 (refresh=True이면 기존 URL 기준 인기도 새로고침)"""
         # 입력 파일 선택
         input_file = self.select_input_file()
         if not input_file:
             return
         
         # 출력 파일 선택
-        output_file = self.select_output_file(input_file)
+        suffix = "popularity_refreshed" if refresh else "with_spotify_popularity"
+        output_file = self.select_output_file(input_file, suffix)
         if not output_file:
             return
         
+        from tkinter import messagebox
+        
+        # 같은 결과 파일에 중단된 작업이 있으면 이어할지 확인
+        resume = False
+        if not refresh and CsvCheckpoint(output_file).load(input_file):
+            resume = messagebox.askyesno("이어하기", "중단된 작업이 있습니다.\n마지막으로 저장된 행부터 이어서 처리할까요?")
+        
         # Spotify API 초기화
         if not self.load_spotify_credentials():
-            messagebox.showerror("오류", "Spotify API 초기화에 실패했습니다.\n.env 파일의 API 키를 확인해주세요.")
+            messagebox.showerror("오류", "Spotify API 키가 설정되지 않았습니다.\n.env 파일의 API 키를 확인해주세요.")
             return
         
-        # 백그라운드에서 처리
+        # 백그라운드에서 처리 (화면 갱신은 _poll_progress가 담당)
         self.is_cancelled = False
-        self.status_var.set("처리 중...")
+        self.status_message = "처리 중..."
         
         def process_thread():
-            self.process_csv(input_file, output_file)
-            if not self.is_cancelled:
-                self.status_var.set("완료!")
+            if refresh:
+                self.refresh_popularity(input_file, output_file)
             else:
-                self.status_var.set("취소됨")
+                self.process_csv(input_file, output_file, resume=resume)
+            self.status_message = "완료!" if not self.is_cancelled else "취소됨"
         
         thread = threading.Thread(target=process_thread)
         thread.daemon = True
@@ -472,26 +614,109 @@ class SpotifyPopularityUpdater:
     def cancel_processing(self):
         """처리 취소"""
         self.is_cancelled = True
-        self.status_var.set("취소 중...")
+        self.status_message = "취소 중..."
     
     def run(self):
         """메인 실행"""
-        print("🎵 Spotify 인기도 업데이터 시작")
-        print("=" * 50)
+        setup_logging(GUI_LEVEL)
+        logger.info("🎵 Spotify 인기도 업데이터 시작")
         
         self.create_gui()
         self.root.mainloop()
 
 
-def main():
-    """메인 함수"""
+def default_output_name(input_file: str, suffix: str = "with_spotify_popularity") -> str:
+    """기본 결과 파일명 (입력 파일명_suffix_시각.csv)"""
+    base_name = os.path.splitext(os.path.basename(input_file))[0]
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    return f"{base_name}_{suffix}_{timestamp}.csv"
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="CSV 곡 목록에 Spotify 인기도 추가 (인자 없이 실행하면 GUI)")
+    parser.add_argument("input", help="입력 CSV ('제목', '아티스트' 컬럼 필요)")
+    parser.add_argument("-o", "--output", help="결과 CSV 경로 (기본: 입력 폴더에 자동 이름)")
+    parser.add_argument("-w", "--workers", type=int, default=SEARCH_WORKERS,
+                        help=f"동시 검색 스레드 수 (기본 {SEARCH_WORKERS})")
+    parser.add_argument("--resume", action="store_true",
+                        help="같은 결과 파일의 체크포인트부터 이어서 처리")
+    parser.add_argument("--refresh", action="store_true",
+                        help="재검색 없이 기존 Spotify_URL의 인기도만 갱신")
+    parser.add_argument("--cache-ttl-days", type=float, default=CACHE_TTL_DAYS,
+                        help=f"찾은 곡 캐시 유효기간 (기본 {CACHE_TTL_DAYS}일)")
+    parser.add_argument("--negative-ttl-days", type=float, default=NEGATIVE_CACHE_TTL_DAYS,
+                        help=f"못 찾은 곡 캐시 유효기간 (기본 {NEGATIVE_CACHE_TTL_DAYS}일)")
+    parser.add_argument("-v", "--verbose", action="count", default=0,
+                        help="곡별 검색 결과 로그 출력 (-vv: 디버그 로그까지)")
+    parser.add_argument("--log-level", metavar="SPEC",
+                        help="로그 레벨 지정 (예: INFO,spotify_search=DEBUG)")
+    parser.add_argument("--profile", metavar="DIR",
+                        help="프로파일 저장 폴더 (cProfile + 전체 스레드 벽시계 샘플)")
+    return parser.parse_args(argv)
+
+
+def run_headless(args: argparse.Namespace) -> int:
+    """Tk 없이 실행 - 진행률/알림/로그는 표준 에러 (곡별 결과 로그는 -v일 때만)"""
+    try:
+        setup_logging(bulk_level(args.verbose), args.log_level)
+    except ValueError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return EXIT_USAGE
+    if not os.path.isfile(args.input):
+        print(f"❌ 입력 파일을 찾을 수 없습니다: {args.input}", file=sys.stderr)
+        return EXIT_USAGE
+    suffix = "popularity_refreshed" if args.refresh else "with_spotify_popularity"
+    output_file = args.output or os.path.join(os.path.dirname(os.path.abspath(args.input)),
+                                              default_output_name(args.input, suffix))
+    
+    updater = SpotifyPopularityUpdater()
+    updater.workers = max(1, args.workers)
+    updater.cache.ttl = args.cache_ttl_days * DAY
+    updater.cache.negative_ttl = args.negative_ttl_days * DAY
+    if not updater.load_spotify_credentials():
+        return EXIT_USAGE
+    
+    if args.profile:
+        try:
+            profiler.enable(args.profile)
+        except OSError as e:
+            print(f"❌ 프로파일 폴더를 만들 수 없습니다: {e}", file=sys.stderr)
+            return EXIT_USAGE
+    
+    print(f"🎵 {args.input} → {output_file}", file=sys.stderr)
+    try:
+        if args.refresh:
+            with profiler.action("popularity_refresh"):
+                ok = updater.refresh_popularity(args.input, output_file)
+        else:
+            with profiler.action("popularity_update"):
+                ok = updater.process_csv(args.input, output_file, resume=args.resume)
+    except KeyboardInterrupt:
+        print("\n⏸️ 사용자에 의해 중단되었습니다. (--resume으로 이어서 처리 가능)", file=sys.stderr)
+        return EXIT_INTERRUPTED
+    finally:
+        if profiler.enabled:
+            profiler.disable()
+            print(f"⏱️ 프로파일 저장: {profiler.output_dir}", file=sys.stderr)
+    if updater._auth_failed:
+        return EXIT_USAGE
+    return EXIT_OK if ok and not updater.error_count else EXIT_PARTIAL_FAILURE
+
+
+def main(argv=None):
+    """메인 함수 (인자가 있으면 헤드리스 CLI, 없으면 GUI)"""
+    argv = sys.argv[1:] if argv is None else argv
+    if argv:
+        sys.exit(run_headless(parse_args(argv)))
+    
     try:
         updater = SpotifyPopularityUpdater()
         updater.run()
     except KeyboardInterrupt:
-        print("\n사용자에 의해 중단되었습니다.")
+        print("\n사용자에 의해 중단되었습니다.", file=sys.stderr)
     except Exception as e:
-        print(f"오류 발생: {e}")
+        logger.error("오류 발생: %s", e, exc_info=True)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,107 @@
+"""
+Spotify 트랙 검색 공용 모듈
+다단계 검색 전략, 결과 매칭(track_matcher), 지속성 캐시(spotify_cache), 공유 속도 제한(rate_limiter)을
+묶어 Spotify 인기도 업데이터와 장르 추천 파이프라인(MusicGenreService)이 같은 검색을 공유한다.
+"""
+
+import threading
+from typing import Dict, Iterator, List, Optional
+
+from metrics import metrics, STAGE_SPOTIFY, EVENT_HIT, EVENT_MISS
+from rate_limiter import RateLimiter
+from spotify_cache import DAY, MISS, PersistentSpotifyCache
+from spotify_client import get_spotify
+from text_normalizer import TrackKey, search_query, strip_symbols
+from track_matcher import track_matcher
+
+# Spotify 요청 속도 (프로세스 안의 모든 스레드가 공유)
+REQUESTS_PER_SECOND = 10
+REQUEST_BURST = 10
+
+# 검색 결과 캐시 유효기간 (찾은 곡은 인기도 갱신 주기, 못 찾은 곡은 재시도 주기)
+CACHE_TTL_DAYS = 7
+NEGATIVE_CACHE_TTL_DAYS = 1
+
+SEARCH_LIMIT = 20
+ARTISTS_BATCH_SIZE = 50
+
+spotify_rate_limiter = RateLimiter(REQUESTS_PER_SECOND, burst=REQUEST_BURST, name=STAGE_SPOTIFY)
+
+
+def _main_artist(artist: str) -> str:
+    return artist.split("ft")[0].split("feat")[0].strip()
+
+
+def search_strategies(title: str, artist: str) -> Iterator[str]:
+    """검색어를 우선순위대로 생성 (앞 전략에서 찾으면 뒤 전략은 만들지 않음)"""
+    # 1. 기본 검색 (제목 + 아티스트)
+    yield search_query(title, artist)
+    # 2. Spotify 고급 검색 문법 사용
+    yield f'track:"{title.split("(")[0].strip()}" artist:"{_main_artist(artist)}"'
+    # 3. 제목만 검색
+    yield title.split("(")[0].strip()
+    # 4. 제목에서 특수문자 모두 제거
+    yield strip_symbols(title)
+    # 5. 아티스트만 검색
+    yield _main_artist(artist)
+    # 6. 제목의 첫 단어들만 검색
+    yield ' '.join(title.split()[:3]) if len(title.split()) > 2 else title
+
+
+class SpotifySearch:
+    """곡명/아티스트로 Spotify 트랙을 찾는 검색기 (스레드 안전)"""
+
+    def __init__(self, cache: Optional[PersistentSpotifyCache] = None,
+                 rate_limiter: RateLimiter = spotify_rate_limiter):
+        # 실행 간 유지되는 검색 결과 캐시
+        self.cache = cache if cache is not None else PersistentSpotifyCache(
+            ttl=CACHE_TTL_DAYS * DAY, negative_ttl=NEGATIVE_CACHE_TTL_DAYS * DAY)
+        self.rate_limiter = rate_limiter
+        self.cache_hits = 0
+        self._artist_genres: Dict[str, List[str]] = {}
+        self._lock = threading.Lock()
+
+    def search_track(self, title: str, artist: str) -> Optional[Dict]:
+        """다단계 검색 전략으로 가장 적합한 트랙 정보 반환 (못 찾으면 None)
+
+        요청 오류는 그대로 발생시키며 캐시하지 않는다 (호출자가 처리).
+        """
+        cache_key = TrackKey.from_tags(title, artist)
+        cached = self.cache.get(cache_key)
+        if cached is not MISS:
+            with self._lock:
+                self.cache_hits += 1
+            metrics.count('spotify_cache', EVENT_HIT)
+            return cached
+        metrics.count('spotify_cache', EVENT_MISS)
+
+        spotify = get_spotify()
+        for query in search_strategies(title, artist):
+            if not query or len(query.strip()) < 2:
+                continue
+            results = self.rate_limiter.call(spotify.search, q=query, type="track", limit=SEARCH_LIMIT)
+            tracks = results.get('tracks', {}).get('items', [])
+            best_match = track_matcher.best_match(tracks, title, artist)
+            if best_match:
+                self.cache.set(cache_key, best_match)
+                return best_match
+
+        # 모든 전략 실패
+        self.cache.set(cache_key, None)
+        return None
+
+    def artist_genres(self, artist_ids: List[str]) -> List[str]:
+        """아티스트들의 Spotify 장르 (아티스트별로 한 번만 조회, 순서 유지/중복 제거)"""
+        missing = [a for a in dict.fromkeys(artist_ids) if a not in self._artist_genres]
+        for i in range(0, len(missing), ARTISTS_BATCH_SIZE):
+            batch = missing[i:i + ARTISTS_BATCH_SIZE]
+            response = self.rate_limiter.call(get_spotify().artists, batch)
+            for artist_id, info in zip(batch, response.get('artists', [])):
+                self._artist_genres[artist_id] = list(info.get('genres', [])) if info else []
+        genres = []
+        for artist_id in artist_ids:
+            genres.extend(self._artist_genres.get(artist_id, []))
+        return list(dict.fromkeys(genres))
+
+    def save(self):
+        self.cache.save()
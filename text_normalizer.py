@@ -0,0 +1,146 @@
+"""
+곡명/아티스트명 정규화 공용 모듈
+장르 캐시 키, MusicBrainz/Discogs/Spotify 검색어, Spotify 결과 매칭에서 쓰는 정규화를
+미리 컴파일된 정규식과 크기 제한 메모 캐시(lru_cache)로 한 곳에서 제공한다.
+같은 곡이 여러 단계에서 반복 정규화되어도 실제 정규식 처리는 한 번만 일어난다.
+"""
+
+import re
+from functools import lru_cache
+from typing import NamedTuple, Optional, Union
+
+# 메모 캐시 크기 (곡 수천~수만 개 기준, 항목당 수백 바이트)
+MEMO_SIZE = 16384
+
+# 장르 서비스용
+_TRAILING_BRACKET_RE = re.compile(r'\s*[\(\[].*?[\)\]]\s*$')
+_FEATURING_WORD_RE = re.compile(r'\b(ft\.?|feat\.?|featuring|with)\b', re.IGNORECASE)
+_NON_WORD_RE = re.compile(r'[^\w\s]')
+
+# Spotify 검색어용
+_VERSION_TAGS = r'(Clean|Dirty|Explicit|Radio Edit|Album Version|Extended|Main)'
+_QUERY_VERSION_PAREN_RE = re.compile(r'\s*\(' + _VERSION_TAGS + r'\)\s*', re.IGNORECASE)
+_QUERY_VERSION_WORD_RE = re.compile(r'\s*' + _VERSION_TAGS + r'\s*', re.IGNORECASE)
+_QUERY_REMIX_PAREN_RE = re.compile(r'\s*\((.*?Remix.*?|.*?Edit.*?)\)\s*', re.IGNORECASE)
+_QUERY_REMIX_WORD_RE = re.compile(r'\s*(Remix|Edit)\s*', re.IGNORECASE)
+_QUERY_SPECIAL_RE = re.compile(r"[^\w\s가-힣'-]")
+_QUERY_ARTIST_SPLIT_RE = re.compile(r'\s+(ft\.?|feat\.?|featuring|with|&|\+)\s+', re.IGNORECASE)
+_BRACKETS_RE = re.compile(r'\([^)]*\)|\[[^\]]*\]')
+_SPACES_RE = re.compile(r'\s+')
+_SYMBOLS_RE = re.compile(r'[^\w\s가-힣]')
+
+# Spotify 매칭용 (소문자 변환 후 적용)
+_MATCH_VERSION_PAREN_RE = re.compile(r'\s*\((clean|dirty|explicit|radio edit|album version|extended|main)\)\s*')
+_MATCH_VERSION_WORD_RE = re.compile(r'\s+(clean|dirty|explicit|radio edit|album version|extended|main)\s*')
+_MATCH_ARTIST_SPLIT_RE = re.compile(r'\s+(ft\.?|feat\.?|featuring|with|&|\+)\s+')
+
+
+@lru_cache(maxsize=MEMO_SIZE)
+def clean_title(title: str) -> str:
+    """곡명에서 마지막 괄호/대괄호 정보를 반복적으로 제거"""
+    while True:
+        new_title = _TRAILING_BRACKET_RE.sub('', title).strip()
+        if new_title == title:
+            break
+        title = new_title
+    return title
+
+
+@lru_cache(maxsize=MEMO_SIZE)
+def clean_artist(artist: str) -> str:
+    """아티스트명에서 피처링 정보(ft, feat, featuring, with 등) 이후를 모두 제거"""
+    return _FEATURING_WORD_RE.split(artist)[0].strip()
+
+
+@lru_cache(maxsize=MEMO_SIZE)
+def key_text(text: str) -> str:
+    """캐시 키용 정규화: 소문자 변환, 앞뒤 공백 제거, 특수문자 제거"""
+    return _NON_WORD_RE.sub('', text.strip().lower())
+
+
+def normalize_year(year: Union[str, int, float, None]) -> str:
+    """연도 값 통일: '2021 ✓'(편집 표시), '2021.0'(CSV 재로딩) → '2021'"""
+    if not year:
+        return ""
+    year = str(year).replace(" ✓", "").strip()
+    if year.endswith(".0") and year[:-2].isdigit():
+        year = year[:-2]
+    return year
+
+
+class TrackKey(NamedTuple):
+    """정규화된 곡 식별 키 (장르 캐시, Spotify 검색 캐시 공용)
+
+    튜플이므로 기존 캐시 파일의 (제목, 아티스트, 연도) 키와 그대로 호환된다.
+    """
+    title: str
+    artist: str
+    year: str = ""
+
+    @classmethod
+    def from_tags(cls, title: str, artist: str, year: Union[str, int, float, None] = None) -> "TrackKey":
+        return track_key(title or "", artist or "", normalize_year(year))
+
+    def without_year(self) -> "TrackKey":
+        return self._replace(year="")
+
+
+@lru_cache(maxsize=MEMO_SIZE)
+def track_key(title: str, artist: str, year: str = "") -> TrackKey:
+    """정규화된 TrackKey 생성 (year는 normalize_year를 거친 값)"""
+    return TrackKey(key_text(title), key_text(artist), year)
+
+
+@lru_cache(maxsize=MEMO_SIZE)
+def search_title(title: str) -> str:
+    """Spotify 검색어용 곡명 정리 (버전 표기, 리믹스, 괄호, 특수문자 제거)"""
+    title_clean = title.strip()
+    title_clean = _QUERY_VERSION_PAREN_RE.sub('', title_clean)
+    title_clean = _QUERY_VERSION_WORD_RE.sub('', title_clean)
+    title_clean = _QUERY_REMIX_PAREN_RE.sub('', title_clean)
+    title_clean = _QUERY_REMIX_WORD_RE.sub('', title_clean)
+    title_clean = _BRACKETS_RE.sub('', title_clean).strip()
+    title_clean = _QUERY_SPECIAL_RE.sub(' ', title_clean).strip()
+    return _SPACES_RE.sub(' ', title_clean).strip()
+
+
+@lru_cache(maxsize=MEMO_SIZE)
+def search_artist(artist: str) -> str:
+    """Spotify 검색어용 아티스트명 정리 (피처링 이후, 괄호, 특수문자 제거)"""
+    artist_clean = artist.strip()
+    artist_clean = _QUERY_ARTIST_SPLIT_RE.split(artist_clean)[0].strip()
+    artist_clean = _BRACKETS_RE.sub('', artist_clean).strip()
+    artist_clean = _QUERY_SPECIAL_RE.sub(' ', artist_clean).strip()
+    return _SPACES_RE.sub(' ', artist_clean).strip()
+
+
+def search_query(title: str, artist: str) -> str:
+    """Spotify 기본 검색어 ('곡명 아티스트')"""
+    return f"{search_title(title)} {search_artist(artist)}".strip()
+
+
+@lru_cache(maxsize=MEMO_SIZE)
+def strip_symbols(text: str) -> str:
+    """특수문자를 공백으로 치환 (한글 유지)"""
+    return _SYMBOLS_RE.sub(' ', text).strip()
+
+
+@lru_cache(maxsize=MEMO_SIZE)
+def match_text(text: Optional[str]) -> str:
+    """검색 결과 비교용 정규화 (소문자, 버전 표기/피처링/괄호/특수문자 제거)"""
+    if not text:
+        return ""
+    text = text.lower().strip()
+    text = _MATCH_VERSION_PAREN_RE.sub('', text)
+    text = _MATCH_VERSION_WORD_RE.sub('', text)
+    text = _MATCH_ARTIST_SPLIT_RE.split(text)[0].strip()
+    text = _BRACKETS_RE.sub('', text).strip()
+    text = _SYMBOLS_RE.sub(' ', text)
+    return _SPACES_RE.sub(' ', text).strip()
+
+
+def cache_info() -> dict:
+    """메모 캐시 적중률 (디버깅/벤치마크용)"""
+    functions = (clean_title, clean_artist, key_text, track_key, search_title,
+                 search_artist, strip_symbols, match_text)
+    return {f.__name__: f.cache_info()._asdict() for f in functions}
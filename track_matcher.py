@@ -0,0 +1,121 @@
+"""
+Spotify 검색 결과 매칭 엔진
+SpotifyPopularityUpdater.find_best_match/calculate_similarity와 같은 점수, 같은 선택 결과를 내면서
+후보 문자열 정규화와 단어 집합 계산을 한 번만 수행하고, 더 나올 수 없는 점수는 계산하지 않는다.
+"""
+
+from functools import lru_cache
+from typing import Dict, List, NamedTuple, Optional
+
+from text_normalizer import MEMO_SIZE, match_text
+
+TITLE_WEIGHT = 0.6
+ARTIST_WEIGHT = 0.4
+MIN_SCORE = 0.3            # 이 점수를 넘어야 매칭으로 인정
+CONTAINMENT_SCORE = 0.7    # 한쪽이 다른 쪽을 포함할 때 최소 점수
+PARTIAL_WORD_SCORE = 0.5   # 3글자 이상 단어끼리 부분 일치할 때 점수
+PARTIAL_MIN_LENGTH = 3
+
+
+class PreparedText(NamedTuple):
+    """유사도 계산용으로 미리 분해한 정규화 문자열"""
+    text: str
+    words: frozenset
+    long_words: tuple
+
+
+@lru_cache(maxsize=MEMO_SIZE)
+def prepare(text: str) -> PreparedText:
+    """정규화된 문자열의 단어 집합을 한 번만 계산"""
+    words = frozenset(text.split())
+    return PreparedText(text, words, tuple(w for w in words if len(w) >= PARTIAL_MIN_LENGTH))
+
+
+@lru_cache(maxsize=MEMO_SIZE)
+def prepare_raw(text: Optional[str]) -> PreparedText:
+    """원본 문자열 정규화 + 분해"""
+    return prepare(match_text(text))
+
+
+def prepared_similarity(a: PreparedText, b: PreparedText) -> float:
+    """문자열 유사도 (완전 일치 > 포함 관계 > Jaccard/부분 단어 일치 중 큰 값)"""
+    str1, str2 = a.text, b.text
+    if not str1 or not str2:
+        return 0.0
+    if str1 == str2:
+        return 1.0
+    if str1 in str2 or str2 in str1:
+        shorter = min(len(str1), len(str2))
+        longer = max(len(str1), len(str2))
+        return max(CONTAINMENT_SCORE, shorter / longer)
+
+    words1, words2 = a.words, b.words
+    if not words1 or not words2:
+        return 0.0
+    intersection = len(words1 & words2)
+    union = len(words1 | words2)
+    jaccard = intersection / union if union > 0 else 0.0
+    if jaccard >= PARTIAL_WORD_SCORE:
+        return jaccard
+
+    # 부분 단어 일치는 Jaccard가 더 낮을 때만 확인
+    for word1 in a.long_words:
+        for word2 in b.long_words:
+            if word1 in word2 or word2 in word1:
+                return PARTIAL_WORD_SCORE
+    return jaccard
+
+
+def similarity(str1: str, str2: str) -> float:
+    """정규화된 두 문자열의 유사도"""
+    return prepared_similarity(prepare(str1), prepare(str2))
+
+
+class TrackMatcher:
+    """검색 결과 중 곡명/아티스트와 가장 비슷한 트랙 선택"""
+
+    def best_match(self, tracks: List[Dict], target_title: str, target_artist: str) -> Optional[Dict]:
+        """가장 적합한 트랙 정보 (점수가 MIN_SCORE 이하이면 None)"""
+        if not tracks:
+            return None
+
+        title = prepare_raw(target_title)
+        artist = prepare_raw(target_artist)
+
+        best_score = 0
+        best = None
+        for track in tracks:
+            title_score = prepared_similarity(title, prepare_raw(track['name']))
+            # 아티스트가 완전히 일치해도 현재 최고 점수를 넘을 수 없으면 건너뜀
+            if title_score * TITLE_WEIGHT + ARTIST_WEIGHT <= max(best_score, MIN_SCORE):
+                continue
+
+            artist_score = 0
+            for track_artist in track['artists']:
+                artist_score = max(artist_score, prepared_similarity(artist, prepare_raw(track_artist['name'])))
+                if artist_score == 1.0:
+                    break
+
+            total_score = title_score * TITLE_WEIGHT + artist_score * ARTIST_WEIGHT
+            if total_score > best_score and total_score > MIN_SCORE:
+                best_score = total_score
+                best = track
+                # 완전 일치보다 높은 점수는 없으므로 이후 후보는 볼 필요 없음
+                if title_score == 1.0 and artist_score == 1.0:
+                    break
+
+        if best is None:
+            return None
+        return {
+            'id': best['id'],
+            'name': best['name'],
+            'artists': [a['name'] for a in best['artists']],
+            'artist_ids': [a.get('id') for a in best['artists'] if a.get('id')],
+            'popularity': best['popularity'],
+            'external_urls': best['external_urls']['spotify'],
+            'similarity_score': best_score
+        }
+
+
+# 전역 매칭 엔진 인스턴스
+track_matcher = TrackMatcher()
@@ -131,6 +131,8 @@ class ControlButtonsWidget(QWidget):
     save_selected_requested = Signal()
     save_all_requested = Signal()
     csv_export_requested = Signal()
+    delta_export_requested = Signal()
+    profile_toggled = Signal(bool)
     
     def __init__(self):
         super().__init__()
@@ -177,13 +179,31 @@ class ControlButtonsWidget(QWidget):
         self.btn_csv_export.clicked.connect(self.csv_export_requested.emit)
         layout.addWidget(self.btn_csv_export)
         
+        # 변경분 내보내기 버튼
+        self.btn_delta_export = QPushButton("🔁 변경분 내보내기")
+        self.btn_delta_export.clicked.connect(self.delta_export_requested.emit)
+        layout.addWidget(self.btn_delta_export)
+        
         layout.addStretch()
+        
+        # 프로파일 켜기/끄기 (동작별 프로파일을 폴더에 저장)
+        self.btn_profile = QPushButton("⏱️ 프로파일")
+        self.btn_profile.setCheckable(True)
+        self.btn_profile.setToolTip("켜 두면 로드/추천/저장/내보내기마다 프로파일을 저장합니다")
+        self.btn_profile.toggled.connect(self.profile_toggled.emit)
+        layout.addWidget(self.btn_profile)
     
     def set_gpt_buttons_enabled(self, enabled):
         """장르 추천 버튼들 활성화/비활성화"""
         self.btn_gpt_selected.setEnabled(enabled)
         self.btn_gpt_all.setEnabled(enabled)
         self.btn_gpt_stop.setEnabled(not enabled)  # 중지 버튼은 반대로
+    
+    def set_profile_checked(self, checked):
+        """시그널 없이 프로파일 버튼 상태만 맞춤"""
+        self.btn_profile.blockSignals(True)
+        self.btn_profile.setChecked(checked)
+        self.btn_profile.blockSignals(False)
 
 
 class AudioControlWidget(QWidget):
@@ -195,6 +215,7 @@ class AudioControlWidget(QWidget):
     seek_started = Signal()
     seek_finished = Signal()
     copy_filename_requested = Signal()  # 파일명 복사 시그널 추가
+    hook_jump_requested = Signal()
     
     def __init__(self):
         super().__init__()
@@ -218,6 +239,13 @@ class AudioControlWidget(QWidget):
         self.btn_play_pause.clicked.connect(self.play_pause_requested.emit)
         time_layout.addWidget(self.btn_play_pause)
         
+        # 훅(곡의 첫 큰 구간)으로 이동 버튼
+        self.btn_hook = QPushButton("⏭️ 훅")
+        self.btn_hook.setFixedWidth(60)
+        self.btn_hook.setToolTip("곡 분석으로 찾은 첫 하이라이트 구간으로 이동")
+        self.btn_hook.clicked.connect(self.hook_jump_requested.emit)
+        time_layout.addWidget(self.btn_hook)
+        
         # 파일명 복사 버튼 추가
         self.btn_copy_filename = QPushButton("📋 파일명 복사")
         self.btn_copy_filename.setFixedWidth(110)